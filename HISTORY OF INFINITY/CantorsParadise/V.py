@@ -1,5 +1,7 @@
 from manim import *
 
+from manimations.interning import tex
+
 class VonNeumannUniverse(Scene):
     def construct(self):
         # Configuration
@@ -17,7 +19,7 @@ class VonNeumannUniverse(Scene):
         self.play(Write(card_label))
         
         # Level 0: empty set (center)
-        v0 = MathTex(r"\emptyset").move_to(UP * start_y)
+        v0 = tex(r"\emptyset").move_to(UP * start_y)
         v0.set_color(YELLOW)
         
         # Cardinality for level 0
@@ -33,7 +35,7 @@ class VonNeumannUniverse(Scene):
         # Level 1: {∅} (center)
         v1 = MathTex(r"\{\emptyset\}").move_to(UP * (start_y + level_spacing))
         v1.set_color(YELLOW)
-        v1_left = MathTex(r"\emptyset").scale(0.8).next_to(v1, LEFT, buff=0.8)
+        v1_left = tex(r"\emptyset").scale(0.8).next_to(v1, LEFT, buff=0.8)
         v1_left.set_color(WHITE)
         
         card_1_formula = MathTex(r"2^1").scale(0.8).move_to(card_0_formula.get_center())
@@ -1,6 +1,8 @@
 from manim import *
 import random
 
+from manimations.glyphs import SymbolGrid
+
 class CantorDiagonal(Scene):
     def construct(self):
     
@@ -30,23 +32,15 @@ class CantorDiagonal(Scene):
         vertical_ellipsis.move_to(LEFT * 4.5 + UP * (2 - num_rows * 0.5))
         nat_numbers.add(vertical_ellipsis)
         
-        # Binary strings grid
-        binary_grid = VGroup()
-        digit_objects = {}  # Store individual digit objects for later reference
+        # Binary strings grid: each digit is shaped once and copied to its cells
+        binary_grid = SymbolGrid(binary_strings, font_size=20, cell=(0.4, 0.5), origin=LEFT * 3 + UP * 2)
+        row_ellipses = VGroup()
         
         for i in range(num_rows):
-            row_group = VGroup()
-            for j in range(num_cols):
-                digit = Text(str(binary_strings[i][j]), font_size=20)
-                digit.move_to(LEFT * 3 + RIGHT * j * 0.4 + UP * (2 - i * 0.5))
-                row_group.add(digit)
-                digit_objects[(i, j)] = digit
-            
             # Add horizontal ellipsis at the end of each row
             h_ellipsis = MathTex(r"\cdots", font_size=20)
             h_ellipsis.move_to(LEFT * 3 + RIGHT * num_cols * 0.4 + UP * (2 - i * 0.5))
-            row_group.add(h_ellipsis)
-            binary_grid.add(row_group)
+            row_ellipses.add(h_ellipsis)
         
         # Add a row of horizontal ellipses below the grid
         bottom_ellipses = VGroup()
@@ -73,7 +67,7 @@ class CantorDiagonal(Scene):
         arrow_label = Text("→", font_size=20)
         arrow_label.next_to(arrow, UP, buff=0.1)
         
-        grid_group.add(nat_numbers, binary_grid, bottom_ellipses, arrow, nat_label, real_label)
+        grid_group.add(nat_numbers, binary_grid, row_ellipses, bottom_ellipses, arrow, nat_label, real_label)
         
         # Animate the creation of the grid
         self.play(Write(nat_label), Write(real_label),Write(nat_numbers))
@@ -81,22 +75,14 @@ class CantorDiagonal(Scene):
         
         # Animate binary strings row by row
         for i in range(num_rows):
-            self.play(Write(binary_grid[i]), run_time=0.1)
+            self.play(Write(VGroup(binary_grid.rows[i], row_ellipses[i])), run_time=0.1)
         self.play(Write(bottom_ellipses), run_time=0.01)
         self.wait(2)
         
         # Highlight the diagonal
-        diagonal_squares = VGroup()
-        diagonal_digits = []
-        
-        for i in range(min(num_rows, num_cols)):
-            # Create a square around the diagonal element
-            square = Square(side_length=0.3)
-            square.move_to(digit_objects[(i, i)].get_center())
-            square.set_stroke(RED, width=3)
-            square.set_fill(RED, opacity=0.2)
-            diagonal_squares.add(square)
-            diagonal_digits.append(binary_strings[i][i])
+        diagonal = [(i, i) for i in range(min(num_rows, num_cols))]
+        diagonal_squares = binary_grid.highlight(diagonal, RED, side=0.3, fill_opacity=0.2, stroke_width=3)
+        diagonal_digits = [binary_strings[i][i] for i, _ in diagonal]
         
         # Create diagonal number grid on the right (positioned higher)
         diagonal_grid_pos = RIGHT * 2 + UP * 2
@@ -104,14 +90,9 @@ class CantorDiagonal(Scene):
         diagonal_label.move_to(diagonal_grid_pos + LEFT * 0.6)
         diagonal_label.shift(RIGHT*0.3)
         
-        diagonal_number_grid = VGroup()
-        diagonal_digit_objects = {}
-        
-        for i, digit in enumerate(diagonal_digits):
-            digit_text = Text(str(digit), font_size=24, color=RED)
-            digit_text.move_to(diagonal_grid_pos + RIGHT * i * 0.3)
-            diagonal_number_grid.add(digit_text)
-            diagonal_digit_objects[i] = digit_text
+        diagonal_number_grid = VGroup(
+            SymbolGrid([diagonal_digits], font_size=24, cell=(0.3, 0), origin=diagonal_grid_pos, color=RED)
+        )
         
         # Add ellipsis to diagonal display
         diagonal_ellipsis = Text("...", font_size=24, color=RED)
@@ -152,14 +133,14 @@ class CantorDiagonal(Scene):
         for i in range(min(len(diagonal_digits), num_rows)):
             # Highlight diagonal element
             diagonal_crossout = Line(0 * RIGHT, 0.3 * RIGHT)
-            diagonal_crossout .move_to(digit_objects[(i, i)].get_center())
+            diagonal_crossout .move_to(binary_grid.cell_center(i, i))
             diagonal_crossout .set_stroke(YELLOW)
             diagonal_crossout.rotate(45 * DEGREES)            
             
             # Create blue digit next to diagonal element
             flipped_digit = 1 - diagonal_digits[i]
             blue_digit = Text(str(flipped_digit), font_size=20, color=BLUE)
-            blue_digit.move_to(digit_objects[(i, i)].get_center() + RIGHT * 0.2 + UP * 0.2)
+            blue_digit.move_to(binary_grid.cell_center(i, i) + RIGHT * 0.2 + UP * 0.2)
         
             
             self.wait(0.1)
@@ -191,10 +172,7 @@ class CantorDiagonal(Scene):
         # Sequential highlighting and digit-by-digit construction
         for i in range(min(len(diagonal_digits), num_rows)):
             # Highlight diagonal element
-            diagonal_highlight = Square(side_length=0.3)
-            diagonal_highlight.move_to(digit_objects[(i, i)].get_center())
-            diagonal_highlight.set_stroke(YELLOW, width=4)
-            diagonal_highlight.set_fill(YELLOW, opacity=0.4)
+            diagonal_highlight = binary_grid.highlight([(i, i)], YELLOW, side=0.3, fill_opacity=0.4, stroke_width=4)
 
             
             # Highlight the new digit being added
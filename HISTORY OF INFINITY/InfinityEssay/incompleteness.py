@@ -2,6 +2,8 @@ from manim import *
 from manim_voiceover import VoiceoverScene
 from manim_voiceover.services.recorder import RecorderService
 
+from manimations.factor_tree import FactorTree, prime_factors
+
 class GodelIncompleteness(VoiceoverScene):
     def construct(self):
         # 1. Voiceover Setup
@@ -63,46 +65,6 @@ class GodelIncompleteness(VoiceoverScene):
 
         text_4 = "Essentially this means that we can view each number as a tree, where the leaves are prime numbers."
 
-        # HELPER: Build simple factor trees
-        def get_factor_tree(num, top_point, scale=0.4):
-            grp = VGroup()
-            font_sz = 36 * scale
-            start = top_point + DOWN * 0.4
-            
-            # Trees for specific numbers
-            if num == 4:
-                # 4 -> 2, 2
-                l = Line(start, start + DL*0.5, color=YELLOW, stroke_width=2)
-                r = Line(start, start + DR*0.5, color=YELLOW, stroke_width=2)
-                n1 = MathTex("2", font_size=font_sz).next_to(l.get_end(), DOWN, buff=0.1)
-                n2 = MathTex("2", font_size=font_sz).next_to(r.get_end(), DOWN, buff=0.1)
-                grp.add(l, r, n1, n2)
-            
-            elif num == 6:
-                # 6 -> 3, 2
-                l = Line(start, start + DL*0.5, color=YELLOW, stroke_width=2)
-                r = Line(start, start + DR*0.5, color=YELLOW, stroke_width=2)
-                n1 = MathTex("3", font_size=font_sz).next_to(l.get_end(), DOWN, buff=0.1)
-                n2 = MathTex("2", font_size=font_sz).next_to(r.get_end(), DOWN, buff=0.1)
-                grp.add(l, r, n1, n2)
-            
-            elif num == 8:
-                # 8 -> 2, 4 -> 2, (2,2)
-                l = Line(start, start + DL*0.5, color=YELLOW, stroke_width=2)
-                n_2 = MathTex("2", font_size=font_sz).next_to(l.get_end(), DOWN, buff=0.1)
-                
-                r = Line(start, start + DR*0.5, color=YELLOW, stroke_width=2)
-                n_4 = MathTex("4", font_size=font_sz).next_to(r.get_end(), DOWN, buff=0.1)
-                
-                start_4 = n_4.get_bottom()
-                l4 = Line(start_4, start_4 + DL*0.3, color=YELLOW, stroke_width=2)
-                r4 = Line(start_4, start_4 + DR*0.3, color=YELLOW, stroke_width=2)
-                n_4_1 = MathTex("2", font_size=font_sz).next_to(l4.get_end(), DOWN, buff=0.1)
-                n_4_2 = MathTex("2", font_size=font_sz).next_to(r4.get_end(), DOWN, buff=0.1)
-                
-                grp.add(l, r, n_2, n_4, l4, r4, n_4_1, n_4_2)
-            return grp
-
         # Generate trees one by one
         # We only animate 4, 6, 8. Primes stay empty (as they are just roots).
         trees_group = VGroup()
@@ -111,9 +73,9 @@ class GodelIncompleteness(VoiceoverScene):
             self.wait()
             # We iterate 1-8. If composite, we build and play. 
             for i in range(1, 9):
-                if i in [4, 6, 8]:
+                if len(prime_factors(i)) > 1:
                     pos = number_line.number_to_point(i)
-                    t = get_factor_tree(i, pos)
+                    t = FactorTree(i, root=pos + DOWN * 0.4, root_labels=False, font_size=36 * 0.4, step=0.7, leaf_gap=1.0)
                     trees_group.add(t)
                     self.play(FadeIn(t), run_time=0.5)
                 # For primes (1,2,3,5,7), we do nothing/wait briefly if desired
@@ -130,97 +92,19 @@ class GodelIncompleteness(VoiceoverScene):
         tree_start = number_line.get_center() + DOWN * 0.5
         scale_factor = 0.7 
         
-        def make_node(val, pos, scale=1.0):
-            return MathTex(str(val), font_size=36*scale).move_to(pos)
-
-        # Level 0
-        root = make_node(1792, tree_start, scale=scale_factor)
-        
-        # Level 1
-        p_16 = tree_start + DL * 1.5 + LEFT * 0.5
-        p_112 = tree_start + DR * 1.5 + RIGHT * 0.5
-        n_16 = make_node(16, p_16, scale=scale_factor)
-        n_112 = make_node(112, p_112, scale=scale_factor)
-        l_root_16 = Line(root.get_bottom(), n_16.get_top(), color=YELLOW)
-        l_root_112 = Line(root.get_bottom(), n_112.get_top(), color=YELLOW)
-
-        # Level 2
-        p_4a = p_16 + DL * 0.8
-        p_4b = p_16 + DR * 0.8
-        n_4a = make_node(4, p_4a, scale=scale_factor)
-        n_4b = make_node(4, p_4b, scale=scale_factor)
-        l_16_4a = Line(n_16.get_bottom(), n_4a.get_top(), color=YELLOW)
-        l_16_4b = Line(n_16.get_bottom(), n_4b.get_top(), color=YELLOW)
-
-        p_8 = p_112 + DL * 0.8
-        p_14 = p_112 + DR * 0.8
-        n_8 = make_node(8, p_8, scale=scale_factor)
-        n_14 = make_node(14, p_14, scale=scale_factor)
-        l_112_8 = Line(n_112.get_bottom(), n_8.get_top(), color=YELLOW)
-        l_112_14 = Line(n_112.get_bottom(), n_14.get_top(), color=YELLOW)
-
-        # Level 3
-        p_2a = p_4a + DL * 0.6
-        p_2b = p_4a + DR * 0.6
-        p_2c = p_4b + DL * 0.6
-        p_2d = p_4b + DR * 0.6
-        n_2a = make_node(2, p_2a, scale=scale_factor)
-        n_2b = make_node(2, p_2b, scale=scale_factor)
-        n_2c = make_node(2, p_2c, scale=scale_factor)
-        n_2d = make_node(2, p_2d, scale=scale_factor)
-        l_4a_2s = VGroup(Line(n_4a.get_bottom(), n_2a.get_top(), color=YELLOW),
-                         Line(n_4a.get_bottom(), n_2b.get_top(), color=YELLOW))
-        l_4b_2s = VGroup(Line(n_4b.get_bottom(), n_2c.get_top(), color=YELLOW),
-                         Line(n_4b.get_bottom(), n_2d.get_top(), color=YELLOW))
-
-        p_8_2 = p_8 + DL * 0.6
-        p_8_4 = p_8 + DR * 0.6
-        n_8_2 = make_node(2, p_8_2, scale=scale_factor)
-        n_8_4 = make_node(4, p_8_4, scale=scale_factor)
-        l_8_split = VGroup(Line(n_8.get_bottom(), n_8_2.get_top(), color=YELLOW),
-                           Line(n_8.get_bottom(), n_8_4.get_top(), color=YELLOW))
-
-        p_14_2 = p_14 + DL * 0.6
-        p_14_7 = p_14 + DR * 0.6
-        n_14_2 = make_node(2, p_14_2, scale=scale_factor)
-        n_14_7 = make_node(7, p_14_7, scale=scale_factor)
-        l_14_split = VGroup(Line(n_14.get_bottom(), n_14_2.get_top(), color=YELLOW),
-                            Line(n_14.get_bottom(), n_14_7.get_top(), color=YELLOW))
-
-        # Level 4 (The split of the 4 in the 8 branch)
-        p_8_4_2a = p_8_4 + DL * 0.5
-        p_8_4_2b = p_8_4 + DR * 0.5
-        n_8_4_2a = make_node(2, p_8_4_2a, scale=scale_factor)
-        n_8_4_2b = make_node(2, p_8_4_2b, scale=scale_factor)
-        l_8_4_split = VGroup(Line(n_8_4.get_bottom(), n_8_4_2a.get_top(), color=YELLOW),
-                             Line(n_8_4.get_bottom(), n_8_4_2b.get_top(), color=YELLOW))
-
-        # Grouping by levels for animation
-        level_0 = root
-        level_1 = VGroup(l_root_16, l_root_112, n_16, n_112)
-        level_2 = VGroup(l_16_4a, l_16_4b, n_4a, n_4b, l_112_8, l_112_14, n_8, n_14)
-        level_3 = VGroup(l_4a_2s, l_4b_2s, n_2a, n_2b, n_2c, n_2d, l_8_split, n_8_2, n_8_4, l_14_split, n_14_2, n_14_7)
-        level_4 = VGroup(l_8_4_split, n_8_4_2a, n_8_4_2b)
-
-        big_tree_full = VGroup(level_0, level_1, level_2, level_3, level_4)
+        big_tree = FactorTree(1792, root=tree_start, font_size=36 * scale_factor, step=0.9, leaf_gap=0.6)
 
         with self.voiceover(text=text_5) as tracker:
             # Clear previous stuff
             self.play(FadeOut(theorem_group), FadeOut(trees_group))
             
             # Animate 1792 level by level
-            self.play(FadeIn(level_0, shift=UP))
-            self.wait(0.25)
-            self.play(FadeIn(level_1, shift=UP))
-            self.wait(0.25)
-            self.play(FadeIn(level_2, shift=UP))
-            self.wait(0.25)
-            self.play(FadeIn(level_3, shift=UP))
-            self.wait(0.25)
-            self.play(FadeIn(level_4, shift=UP))
-            self.wait
+            for level in range(big_tree.depth + 1):
+                if level:
+                    self.wait(0.25)
+                self.play(FadeIn(big_tree.level(level), shift=UP))
         
-        self.play(FadeOut(big_tree_full))
+        self.play(FadeOut(big_tree))
 
         # --- PART 4: ENCODING ---
 
@@ -1,5 +1,7 @@
 from manim import *
 
+from manimations.points import PointCloud
+
 # ---------------------------------------------------------
 # Scene 1: Zeno's Paradox (The Dichotomy)
 # Visualizes the infinite subdivision of a path.
@@ -136,7 +138,7 @@ class P3_Construct_vs_Plato(Scene):
         
         # Reveal a pre-existing set
         cloud = Ellipse(width=4, height=3, color=GOLD).move_to(RIGHT*3.5)
-        stars = VGroup(*[Dot(point=cloud.get_center() + np.random.uniform(-1,1,3), color=GOLD_A, radius=0.05) for _ in range(20)])
+        stars = PointCloud(cloud.get_center() + np.random.uniform(-1,1,(20, 3)), color=GOLD_A, radius=0.05)
         
         self.play(Create(cloud), FadeIn(stars), run_time=3)
         
@@ -5,6 +5,12 @@ import numpy as np
 import random
 import math
 
+from manimations.farey import get_farey_graph
+from manimations.points import PointCloud
+from manimations.surfaces import VectorizedSurface
+from manimations.ticks import TickField
+from manimations.trees import FractalTree
+
 # --- COMMON CONFIG ---
 # Font for "Old Fashioned" look
 SERIF_FONT = "Calibri"
@@ -49,7 +55,7 @@ class Part1_Intro(VoiceoverScene, ThreeDScene):
 
         # B. THE FAREY GRAPH (Hyperbolic Geometry) - Top Right
         # Approximated by a Poincare Disk tessellation style
-        farey_graph = self.get_farey_graph(radius=2, depth=3)
+        farey_graph = get_farey_graph(radius=2, depth=3, color=BLUE_A)
         farey_graph.move_to(np.array([5, 3, -1]))
         farey_graph.rotate(PI/4, axis=UP)
 
@@ -60,7 +66,7 @@ class Part1_Intro(VoiceoverScene, ThreeDScene):
 
         # D. TREE (Arbitrary Branching) - Bottom Left
         # A recursive fractal tree structure
-        tree_struct = self.get_fractal_tree(iterations=4)
+        tree_struct = FractalTree(iterations=4)
         tree_struct.move_to(np.array([-4, -3, -1]))
         
         # E. DLO (Dense Linear Order / Rationals) - Center Back
@@ -121,7 +127,7 @@ class Part1_Intro(VoiceoverScene, ThreeDScene):
             z = np.sin(u/2) * np.sin(v) + np.cos(u/2) * np.sin(2*v)
             return np.array([x, y, z])
 
-        surface = Surface(
+        surface = VectorizedSurface(
             lambda u, v: func(u, v),
             u_range=[0, TAU],
             v_range=[0, TAU],
@@ -132,43 +138,6 @@ class Part1_Intro(VoiceoverScene, ThreeDScene):
         surface.set_fill_by_checkerboard(GREEN_E, GREEN_C, opacity=0.2)
         return surface
 
-    def get_farey_graph(self, radius=2, depth=3):
-        """Generates a visual approximation of a hyperbolic Farey graph."""
-        farey_group = VGroup()
-        
-        # Boundary Circle
-        boundary = Circle(radius=radius, color=WHITE, stroke_opacity=0.5)
-        farey_group.add(boundary)
-
-        # Recursive function to draw geodesic arcs
-        def add_arcs(a, b, level):
-            if level == 0:
-                return
-            
-            # Midpoint in angle space
-            mid = (a + b) / 2
-            
-            # Convert angles to points on circle
-            p1 = np.array([radius * np.cos(a), radius * np.sin(a), 0])
-            p2 = np.array([radius * np.cos(b), radius * np.sin(b), 0])
-            
-            # Draw Arc (Orthogonal to boundary - simplified as straight lines or slight curves for aesthetic)
-            # For true hyperbolic geodesics, we use arcs. Here we use Bezier for style.
-            arc = ArcBetweenPoints(p1, p2, angle=-PI/2) # Negative angle pushes it inward
-            arc.set_stroke(color=BLUE_A, width=2 * (level/depth), opacity=0.8)
-            farey_group.add(arc)
-            
-            # Recurse
-            add_arcs(a, mid, level - 1)
-            add_arcs(mid, b, level - 1)
-
-        # Start with a few main sectors
-        sectors = [0, PI/2, PI, 3*PI/2, 2*PI]
-        for i in range(len(sectors)-1):
-            add_arcs(sectors[i], sectors[i+1], depth)
-            
-        return farey_group
-
     def get_complex_graph(self, n_nodes=10):
         """Generates a complete-like cyclic graph."""
         # Manually creating nodes and edges for 3D compatibility
@@ -199,45 +168,12 @@ class Part1_Intro(VoiceoverScene, ThreeDScene):
                     
         return g_group
 
-    def get_fractal_tree(self, iterations=4):
-        """Generates a 3D branching tree."""
-        tree_group = VGroup()
-        
-        def branch(start_pos, length, angle, theta_offset, depth):
-            if depth == 0:
-                return
-            
-            # Calculate end position (simplified 2D logic rotated in 3D)
-            end_pos = start_pos + np.array([
-                length * np.cos(angle),
-                length * np.sin(angle),
-                length * np.sin(angle + theta_offset) # Add Z variation
-            ])
-            
-            line = Line3D(start=start_pos, end=end_pos, color=interpolate_color(ORANGE, WHITE, depth/iterations))
-            line.set_stroke(width=depth)
-            tree_group.add(line)
-            
-            # Recurse
-            branch(end_pos, length * 0.7, angle + PI/6, theta_offset + 0.5, depth - 1)
-            branch(end_pos, length * 0.7, angle - PI/6, theta_offset - 0.5, depth - 1)
-
-        branch(np.array([0, -1.5, 0]), 1.0, PI/2, 0, iterations)
-        return tree_group
-
     def get_dlo_visualization(self):
         """Generates a dense linear order (like Rationals) visualization."""
-        dlo = VGroup()
+        # Add "dense" ticks, as one path; the line is drawn over the field's own baseline
+        ticks = TickField([random.uniform(-3, 3) for _ in range(50)], 0.2, x_range=(-3, 3), width=6, color=BLUE_A)
         line = Line(start=LEFT*3, end=RIGHT*3, color=BLUE)
-        dlo.add(line)
-        
-        # Add "dense" ticks
-        for _ in range(50):
-            x = random.uniform(-3, 3)
-            tick = Line(start=UP*0.1, end=DOWN*0.1, color=BLUE_A).move_to(np.array([x, 0, 0]))
-            dlo.add(tick)
-            
-        return dlo
+        return VGroup(ticks, line)
 
     def get_acf_plane(self):
         """Generates a complex plane visualization (ACF)."""
@@ -251,11 +187,8 @@ class Part1_Intro(VoiceoverScene, ThreeDScene):
         acf.add(grid)
         
         # Algebraic points (random scatter)
-        for _ in range(30):
-            x = random.uniform(-3, 3)
-            y = random.uniform(-3, 3)
-            dot = Dot3D(point=np.array([x, y, 0]), radius=0.05, color=PURPLE_A)
-            acf.add(dot)
+        points = [(random.uniform(-3, 3), random.uniform(-3, 3)) for _ in range(30)]
+        acf.add(PointCloud(points, color=PURPLE_A, radius=0.05))
             
         return acf
 
@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from manimations.interning import tex
+
 class ZenosParadox(Scene):
     def construct(self):
         # Title
@@ -55,9 +57,9 @@ class ZenosParadox(Scene):
         temp_fractions = []
         for j in range(5):
             if j == 0:
-                temp_frac = MathTex(f"\\frac{{1}}{{{2**(j+1)}}}", font_size=48)
+                temp_frac = tex(f"\\frac{{1}}{{{2**(j+1)}}}", font_size=48)
             else:
-                temp_frac = MathTex(f"+ \\frac{{1}}{{{2**(j+1)}}}", font_size=48)
+                temp_frac = tex(f"+ \\frac{{1}}{{{2**(j+1)}}}", font_size=48)
             temp_fractions.append(temp_frac)
         
         temp_group = VGroup(*temp_fractions)
@@ -91,13 +93,13 @@ class ZenosParadox(Scene):
             
             # Create the fraction term
             if i == 0:
-                current_frac = MathTex(
+                current_frac = tex(
                     f"\\frac{{1}}{{{2**(i+1)}}}",
                     font_size=48,
                     color=colors[i % len(colors)]
                 )
             else:
-                current_frac = MathTex(
+                current_frac = tex(
                     f"+ \\frac{{1}}{{{2**(i+1)}}}",
                     font_size=48,
                     color=colors[i % len(colors)]
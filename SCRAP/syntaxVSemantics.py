@@ -3,6 +3,8 @@ from manim_voiceover import VoiceoverScene
 from manim_voiceover.services.recorder import RecorderService
 import networkx as nx
 
+from manimations.farey import get_farey_graph
+
 SYNTAX_COLOR = WHITE 
 SEMANTICS_HIGHLIGHT = YELLOW 
 
@@ -53,7 +55,7 @@ class SyntaxVsSemantics(VoiceoverScene):
         num_line = NumberLine(x_range=[-3, 3, 1], length=4, include_numbers=True, font_size=24).move_to(semantics_center + UP * 1.2).set_color(BLUE_B)
         dag = self.get_dag_graph().scale(0.5).move_to(semantics_center + DOWN * 0.5 + LEFT * 1.5)
         tree_graph = self.get_tree_graph().scale(0.5).move_to(semantics_center + DOWN * 0.5 + RIGHT * 1.5)
-        farey = self.get_farey_graph(radius=1.2, depth=2).move_to(semantics_center + DOWN * 2.5 + RIGHT * 1.5)
+        farey = get_farey_graph(radius=1.2, depth=2).move_to(semantics_center + DOWN * 2.5 + RIGHT * 1.5)
         manifold_2d = ParametricFunction(
             lambda t: np.array([1.2 * np.sin(2 * t), 1.2 * np.sin(t), 0]), 
             t_range=[0, TAU], color=GREEN_D
@@ -172,21 +174,3 @@ class SyntaxVsSemantics(VoiceoverScene):
     def get_tree_graph(self):
         nx_tree = nx.balanced_tree(r=2, h=3)
         return Graph(list(nx_tree.nodes), list(nx_tree.edges), layout="kamada_kawai", vertex_config={"radius": 0.08, "color": GREEN_B}, edge_config={"color": GREEN_E, "stroke_width": 1})
-
-    def get_farey_graph(self, radius=2, depth=3):
-        farey_group = VGroup()
-        farey_group.add(Circle(radius=radius, color=WHITE, stroke_opacity=0.5))
-        def add_arcs(a, b, level):
-            if level == 0: return
-            mid = (a + b) / 2
-            p1 = np.array([radius * np.cos(a), radius * np.sin(a), 0])
-            p2 = np.array([radius * np.cos(b), radius * np.sin(b), 0])
-            arc = ArcBetweenPoints(p1, p2, angle=-PI/2) 
-            arc.set_stroke(color=RED_A, width=2 * (level/depth), opacity=0.8)
-            farey_group.add(arc)
-            add_arcs(a, mid, level - 1)
-            add_arcs(mid, b, level - 1)
-        sectors = [0, PI/2, PI, 3*PI/2, 2*PI]
-        for i in range(len(sectors)-1):
-            add_arcs(sectors[i], sectors[i+1], depth)
-        return farey_group
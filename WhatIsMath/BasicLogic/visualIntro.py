@@ -4,6 +4,8 @@ from manim_voiceover.services.recorder import RecorderService
 import random
 import numpy as np
 
+from manimations.surfaces import VectorizedSurface
+
 # ==========================================
 # SCENE 1: INTRODUCTION
 # ==========================================
@@ -21,7 +23,7 @@ class MathIntro(VoiceoverScene, ThreeDScene):
 
         def get_seifert_surface():
             # Approximated by a 3-twisted ribbon (Trefoil knot spanning surface)
-            return Surface(
+            return VectorizedSurface(
                 lambda u, v: np.array([
                     (2 + v * np.cos(3*u/2)) * np.cos(u),
                     (2 + v * np.cos(3*u/2)) * np.sin(u),
@@ -32,7 +34,7 @@ class MathIntro(VoiceoverScene, ThreeDScene):
 
         def get_boys_surface():
             # A simplified topological immersion (Cross-cap/Roman surface variant)
-            return Surface(
+            return VectorizedSurface(
                 lambda u, v: np.array([
                     np.sin(2*u) * np.cos(v)**2,
                     np.sin(u) * np.sin(2*v),
@@ -42,7 +44,7 @@ class MathIntro(VoiceoverScene, ThreeDScene):
             ).set_color(PINK)
 
         def get_monkey_saddle():
-            return Surface(
+            return VectorizedSurface(
                 lambda u, v: np.array([u, v, (u**3 - 3*u*v**2) * 0.2]),
                 u_range=[-2, 2], v_range=[-2, 2], resolution=(20, 20)
             ).set_color(MAROON)
@@ -3,6 +3,9 @@ from manim_voiceover import VoiceoverScene
 from manim_voiceover.services.recorder import RecorderService
 import random
 
+from manimations.interning import tex
+from manimations.truth_tables import TruthTable, get_truth_table
+
 # ==========================================
 # SCENE 3: PROPOSITIONAL LOGIC & TRUTH TABLES
 # ==========================================
@@ -18,27 +21,16 @@ class PropositionalLogic(VoiceoverScene):
         # Variables: p, q, r, s ...
         vars_tex = MathTex("p", ",", "q", ",", "r", ",", "s", ",", r"\dots", font_size=48)
         vars_tex.move_to(UP * 2)
+        phi_tex = r"\varphi = (p \land \neg q) \to (r \lor s)"
+        phi = TruthTable(phi_tex)
 
         # ------------------------------------------
         # 2. BOOLEAN CONNECTIVES & 5/6 COL TABLES
         # ------------------------------------------
-        table_5col = MathTable(
-            [["0", "0", "0", "0", "1"], 
-             ["0", "1", "0", "1", "1"], 
-             ["1", "0", "0", "1", "0"], 
-             ["1", "1", "1", "1", "1"]],
-            col_labels=[MathTex("A"), MathTex("B"), MathTex(r"A \land B"), MathTex(r"A \lor B"), MathTex(r"A \to B")],
-            include_outer_lines=True
-        ).scale(0.35).move_to(DOWN * 1.5)
-
-        table_6col = MathTable(
-            [["0", "0", "0", "0", "1", "1"], 
-             ["0", "1", "0", "1", "1", "1"], 
-             ["1", "0", "0", "1", "0", "0"], 
-             ["1", "1", "1", "1", "1", "1"]],
-            col_labels=[MathTex("A"), MathTex("B"), MathTex(r"A \land B"), MathTex(r"A \lor B"), MathTex(r"A \to B"), MathTex(r"\neg A \lor B")],
-            include_outer_lines=True
-        ).scale(0.35).move_to(table_5col.get_center())
+        connectives = [r"A \land B", r"A \lor B", r"A \to B"]
+        table_5col = get_truth_table(*connectives).scale(0.35).move_to(DOWN * 1.5)
+
+        table_6col = get_truth_table(*connectives, r"\neg A \lor B").scale(0.35).move_to(table_5col.get_center())
 
         # ------------------------------------------
         # ANIMATIONS: PART 1
@@ -52,11 +44,11 @@ class PropositionalLogic(VoiceoverScene):
         with self.voiceover(text=script_2) as tracker:
             self.play(FadeIn(vars_tex, shift=RIGHT), run_time=1)
             
-            # Generate random 0s and 1s with NO arrows
+            # A random row of phi's truth table, shown as 0s and 1s with NO arrows
+            world = phi.assignment(random.randrange(phi.rows))
             assignments = VGroup()
-            for i in [0, 2, 4, 6]:  # Indices of p, q, r, s in the MathTex
-                val = str(random.choice([0, 1]))
-                num = MathTex(val, font_size=36, color=YELLOW).next_to(vars_tex[i], UP, buff=0.3)
+            for i, name in zip([0, 2, 4, 6], phi.variables):  # Indices of p, q, r, s in the MathTex
+                num = tex(str(world[name]), font_size=36, color=YELLOW).next_to(vars_tex[i], UP, buff=0.3)
                 assignments.add(num)
             
             self.play(FadeIn(assignments, shift=DOWN), run_time=1)
@@ -68,7 +60,7 @@ class PropositionalLogic(VoiceoverScene):
             connectives_list = MathTex(r"\{ \land, \lor, \to, \neg \}", font_size=48).next_to(vars_tex, DOWN, buff=0.5)
             self.play(FadeIn(connectives_list, shift=DOWN), run_time=1)
             
-            complex_formula = MathTex(r"\varphi = (p \land \neg q) \to (r \lor s)", font_size=48).set_color(TEAL).next_to(connectives_list, DOWN, buff=0.5)
+            complex_formula = MathTex(phi_tex, font_size=48).set_color(TEAL).next_to(connectives_list, DOWN, buff=0.5)
             self.play(Write(complex_formula), run_time=1.5)
             
             self.wait(max(0, tracker.duration - 2.5))
@@ -96,8 +88,11 @@ class PropositionalLogic(VoiceoverScene):
         # ------------------------------------------
         
         # Big formula at top
-        big_formula_v = MathTex(r"\varphi = (p \to (q \to r)) \to ((p \land q) \to r)").to_edge(UP).set_color(GREEN)
-        table_detailed = self.get_detailed_valid_table().move_to(DOWN * 0.5)
+        valid_tex = r"\varphi = (p \to (q \to r)) \to ((p \land q) \to r)"
+        valid = TruthTable(valid_tex)
+        big_formula_v = MathTex(valid_tex).to_edge(UP).set_color(GREEN)
+        # 8 columns computing: p, q, r, (q->r), p->(q->r), (p^q), (p^q)->r, phi
+        table_detailed = get_truth_table(valid, steps=True).scale(0.32).move_to(DOWN * 0.5)
 
         status_text = Text("", font_size=36, weight=BOLD).to_edge(RIGHT).shift(LEFT * 1)
 
@@ -124,14 +119,16 @@ class PropositionalLogic(VoiceoverScene):
         script_9 = "If all rows evaluate to 1, as is the case with this formula, then we say that the formula is logically valid."
         with self.voiceover(text=script_9) as tracker:
             box = SurroundingRectangle(table_detailed.get_columns()[7][1:], color=GREEN, buff=0.1)
-            status_text.become(Text("Logically Valid", font_size=36, color=GREEN).to_edge(RIGHT).shift(LEFT * 0.5))
+            status_text.become(Text(valid.verdict, font_size=36, color=GREEN).to_edge(RIGHT).shift(LEFT * 0.5))
             self.play(Create(box), FadeIn(status_text, shift=LEFT), run_time=1)
             self.wait(max(0, tracker.duration - 1))
 
 
         # --- TRANSITION TO UNSATISFIABLE ---
-        big_formula_u = MathTex(r"\psi_{unsat} = (p \land \neg p) \land (q \lor r)").to_edge(UP).set_color(RED)
-        table_u = self.get_8_row_table(r"\psi_{unsat}", ["0"] * 8).move_to(DOWN * 0.5)
+        unsat_tex = r"\psi_{unsat} = (p \land \neg p) \land (q \lor r)"
+        unsat = TruthTable(unsat_tex)
+        big_formula_u = MathTex(unsat_tex).to_edge(UP).set_color(RED)
+        table_u = get_truth_table(unsat).scale(0.35).move_to(DOWN * 0.5)
 
         script_10 = "If all rows evaluate to 0, then we say that the formula is unsatisfiable."
         with self.voiceover(text=script_10) as tracker:
@@ -155,15 +152,16 @@ class PropositionalLogic(VoiceoverScene):
             
             # Write the new '0's
             col_values_u = table_u.get_columns()[3][1:]
-            status_text.become(Text("Unsatisfiable", font_size=36, color=RED).to_edge(RIGHT).shift(LEFT * 0.5))
+            status_text.become(Text(unsat.verdict, font_size=36, color=RED).to_edge(RIGHT).shift(LEFT * 0.5))
             self.play(Write(col_values_u), FadeIn(status_text, shift=LEFT), run_time=0.8)
             self.wait(max(0, tracker.duration - 2.8))
 
 
         # --- TRANSITION TO SATISFIABLE ---
-        big_formula_s = MathTex(r"\psi_{sat} = (p \lor q) \to r").to_edge(UP).set_color(YELLOW)
-        results_sat = ["1", "1", "0", "1", "0", "1", "0", "1"]
-        table_s = self.get_8_row_table(r"\psi_{sat}", results_sat).move_to(DOWN * 0.5)
+        sat_tex = r"\psi_{sat} = (p \lor q) \to r"
+        sat = TruthTable(sat_tex)
+        big_formula_s = MathTex(sat_tex).to_edge(UP).set_color(YELLOW)
+        table_s = get_truth_table(sat).scale(0.35).move_to(DOWN * 0.5)
 
         script_11 = "And if at least one row is true, then we say that it is satisfiable."
         with self.voiceover(text=script_11) as tracker:
@@ -183,7 +181,7 @@ class PropositionalLogic(VoiceoverScene):
             )
             
             col_values_s = table_s.get_columns()[3][1:]
-            status_text.become(Text("Satisfiable", font_size=36, color=YELLOW).to_edge(RIGHT).shift(LEFT * 0.5))
+            status_text.become(Text(sat.verdict, font_size=36, color=YELLOW).to_edge(RIGHT).shift(LEFT * 0.5))
             self.play(Write(col_values_s), FadeIn(status_text, shift=LEFT), run_time=0.8)
             self.wait(max(0, tracker.duration - 2.4))
 
@@ -200,43 +198,3 @@ class PropositionalLogic(VoiceoverScene):
             self.wait(max(0, tracker.duration - 1))
 
         self.wait(2)
-
-    # --- Helper Functions ---
-    def get_detailed_valid_table(self):
-        # 8 columns computing: p, q, r, (q->r), p->(q->r), (p^q), (p^q)->r, phi
-        content = [
-            ["0", "0", "0", "1", "1", "0", "1", "1"],
-            ["0", "0", "1", "1", "1", "0", "1", "1"],
-            ["0", "1", "0", "0", "1", "0", "1", "1"],
-            ["0", "1", "1", "1", "1", "0", "1", "1"],
-            ["1", "0", "0", "1", "1", "0", "1", "1"],
-            ["1", "0", "1", "1", "1", "0", "1", "1"],
-            ["1", "1", "0", "0", "0", "1", "0", "1"],
-            ["1", "1", "1", "1", "1", "1", "1", "1"]
-        ]
-        col_labels = [
-            MathTex("p"), MathTex("q"), MathTex("r"),
-            MathTex(r"q \to r"),
-            MathTex(r"p \to (q \to r)"),
-            MathTex(r"p \land q"),
-            MathTex(r"(p \land q) \to r"),
-            MathTex(r"\varphi")
-        ]
-        return MathTable(content, col_labels=col_labels, include_outer_lines=True).scale(0.32)
-
-    def get_8_row_table(self, formula_tex, results):
-        content = [
-            ["0", "0", "0", results[0]],
-            ["0", "0", "1", results[1]],
-            ["0", "1", "0", results[2]],
-            ["0", "1", "1", results[3]],
-            ["1", "0", "0", results[4]],
-            ["1", "0", "1", results[5]],
-            ["1", "1", "0", results[6]],
-            ["1", "1", "1", results[7]]
-        ]
-        return MathTable(
-            content,
-            col_labels=[MathTex("p"), MathTex("q"), MathTex("r"), MathTex(formula_tex)],
-            include_outer_lines=True
-        ).scale(0.35)
\ No newline at end of file
@@ -2,6 +2,8 @@ from manim import *
 from manim_voiceover import VoiceoverScene
 from manim_voiceover.services.recorder import RecorderService
 
+from manimations.truth_tables import get_truth_table
+
 # ==========================================
 # SCENE 4: HILBERT CALCULUS & PROOFS AS PROGRAMS
 # ==========================================
@@ -230,28 +232,9 @@ class HilbertCalculus(VoiceoverScene):
         return VGroup(n1, n2, n3, n4, n5, edges)
 
     def get_a1_table(self):
-        # Axiom 1: phi -> (psi -> phi)
-        content = [
-            ["0", "0", "1", "1"],
-            ["0", "1", "0", "1"],
-            ["1", "0", "1", "1"],
-            ["1", "1", "1", "1"]
-        ]
-        return MathTable(
-            content,
-            col_labels=[MathTex(r"\varphi"), MathTex(r"\psi"), MathTex(r"\psi \to \varphi"), MathTex(r"\varphi \to (\psi \to \varphi)")],
-            include_outer_lines=True
-        ).scale(0.35)
+        # Axiom 1: phi -> (psi -> phi), with its intermediate column
+        return get_truth_table(r"\varphi \to (\psi \to \varphi)", steps=True).scale(0.35)
 
     def get_16_row_table(self):
-        # Dynamically generate 16 rows of binary inputs, all mapping to output '1'
-        content = []
-        for i in range(16):
-            b = f"{i:04b}" # Creates padded binary string like '0000', '0001', etc.
-            content.append([b[0], b[1], b[2], b[3], "1"])
-            
-        return MathTable(
-            content,
-            col_labels=[MathTex("p"), MathTex("q"), MathTex("r"), MathTex("s"), MathTex(r"\Phi")],
-            include_outer_lines=True
-        ).scale(0.22) # Scaled down nicely so 16 rows perfectly fit the lower half of the screen
\ No newline at end of file
+        # All 16 rows of the valid formula shown above it
+        return get_truth_table(r"\Phi = (p \land (q \to r)) \to (s \lor \neg s)").scale(0.22) # Scaled down nicely so 16 rows perfectly fit the lower half of the screen
\ No newline at end of file
@@ -4,6 +4,9 @@ from manim_voiceover.services.recorder import RecorderService
 import networkx as nx
 import numpy as np
 
+from manimations.farey import get_farey_graph
+from manimations.truth_tables import get_truth_table
+
 # ==========================================
 # SCENE 5: TRANSITION TO FIRST-ORDER LOGIC
 # ==========================================
@@ -53,7 +56,7 @@ class TransitionToFOL(VoiceoverScene):
         # Right Side: Mathematical Structures
         dag = self.get_dag_graph().scale(0.5).move_to(semantics_center + UP * 0.5 + LEFT * 1.5)
         tree_graph = self.get_tree_graph().scale(0.5).move_to(semantics_center + UP * 0.5 + RIGHT * 1.5)
-        farey = self.get_farey_graph(radius=1.2, depth=2).move_to(semantics_center + DOWN * 1.5 + RIGHT * 1.5)
+        farey = get_farey_graph(radius=1.2, depth=2).move_to(semantics_center + DOWN * 1.5 + RIGHT * 1.5)
         manifold_2d = ParametricFunction(
             lambda t: np.array([1.2 * np.sin(2 * t), 1.2 * np.sin(t), 0]), 
             t_range=[0, TAU], color=GREEN_D
@@ -121,23 +124,10 @@ class TransitionToFOL(VoiceoverScene):
     # Helper Functions 
     # ---------------------------------------------------
     def get_big_truth_table(self):
-        content = [
-            ["0", "0", "0", "1", "1", "1"],
-            ["0", "0", "1", "1", "1", "1"],
-            ["0", "1", "0", "0", "1", "1"],
-            ["0", "1", "1", "1", "1", "1"],
-            ["1", "0", "0", "1", "1", "1"],
-            ["1", "0", "1", "1", "1", "1"],
-            ["1", "1", "0", "0", "0", "1"],
-            ["1", "1", "1", "1", "1", "1"]
-        ]
-        col_labels = [
-            MathTex("p"), MathTex("q"), MathTex("r"),
-            MathTex(r"q \to r"),
-            MathTex(r"p \to (q \to r)"),
-            MathTex(r"\varphi")
-        ]
-        return MathTable(content, col_labels=col_labels, include_outer_lines=True).scale(0.35)
+        return get_truth_table(
+            r"\varphi = (p \to (q \to r)) \to ((p \land q) \to r)",
+            steps=[r"q \to r", r"p \to (q \to r)"],
+        ).scale(0.35)
 
     def get_dag_graph(self):
         nx_graph = nx.DiGraph()
@@ -146,22 +136,4 @@ class TransitionToFOL(VoiceoverScene):
 
     def get_tree_graph(self):
         nx_tree = nx.balanced_tree(r=2, h=3)
-        return Graph(list(nx_tree.nodes), list(nx_tree.edges), layout="kamada_kawai", vertex_config={"radius": 0.08, "color": GREEN_B}, edge_config={"color": GREEN_E, "stroke_width": 1})
-
-    def get_farey_graph(self, radius=2, depth=3):
-        farey_group = VGroup()
-        farey_group.add(Circle(radius=radius, color=WHITE, stroke_opacity=0.5))
-        def add_arcs(a, b, level):
-            if level == 0: return
-            mid = (a + b) / 2
-            p1 = np.array([radius * np.cos(a), radius * np.sin(a), 0])
-            p2 = np.array([radius * np.cos(b), radius * np.sin(b), 0])
-            arc = ArcBetweenPoints(p1, p2, angle=-PI/2) 
-            arc.set_stroke(color=RED_A, width=2 * (level/depth), opacity=0.8)
-            farey_group.add(arc)
-            add_arcs(a, mid, level - 1)
-            add_arcs(mid, b, level - 1)
-        sectors = [0, PI/2, PI, 3*PI/2, 2*PI]
-        for i in range(len(sectors)-1):
-            add_arcs(sectors[i], sectors[i+1], depth)
-        return farey_group
\ No newline at end of file
+        return Graph(list(nx_tree.nodes), list(nx_tree.edges), layout="kamada_kawai", vertex_config={"radius": 0.08, "color": GREEN_B}, edge_config={"color": GREEN_E, "stroke_width": 1})
\ No newline at end of file
@@ -3,6 +3,9 @@ from manim_voiceover import VoiceoverScene
 from manim_voiceover.services.recorder import RecorderService
 import numpy as np
 
+from manimations.graphs import get_mini_graph
+from manimations.ticks import TickField
+
 # ==========================================
 # SCENE 9: INCOMPLETE THEORIES & DLOWE
 # ==========================================
@@ -30,8 +33,8 @@ class IncompleteTheoriesAndDLOWE(VoiceoverScene):
         # Semantics Right (Abstract Mod Box from previous scenes)
         mod_sigma = MathTex(r"Mod(\Sigma)", font_size=36, color=YELLOW).move_to(semantics_center + UP * 3)
         valid_graphs = VGroup(
-            self.get_mini_graph("line"), self.get_mini_graph("tree"), self.get_mini_graph("bool_alg"),
-            self.get_mini_graph("disconnected"), self.get_mini_graph("lattice"), self.get_mini_graph("pentagon_dag")
+            get_mini_graph("line"), get_mini_graph("tree"), get_mini_graph("bool_alg"),
+            get_mini_graph("disconnected"), get_mini_graph("lattice"), get_mini_graph("pentagon_dag")
         )
         for i, g in enumerate(valid_graphs):
             row = i // 3
@@ -155,14 +158,9 @@ class IncompleteTheoriesAndDLOWE(VoiceoverScene):
         lo_2_label = MathTex(r"\mathbb{N} \to", font_size=24).next_to(lo_2, LEFT)
         
         # Ruler-style Rationals
-        lo_3 = Line(LEFT*2, RIGHT*2)
-        lo_3_ticks = VGroup()
-        for i in range(33): # 4 units * 8 segments
-            h = 0.2 if i % 8 == 0 else 0.08
-            tick = Line(DOWN*h/2, UP*h/2).move_to(lo_3.get_left() + RIGHT * (i * 4/32))
-            lo_3_ticks.add(tick)
-        lo_3_group = VGroup(lo_3, lo_3_ticks)
-        lo_3_label = MathTex(r"\mathbb{Q}", font_size=24).next_to(lo_3_group, LEFT)
+        eighths = np.arange(33) # 4 units * 8 segments
+        lo_3 = TickField(eighths / 8, np.where(eighths % 8 == 0, 0.2, 0.08), x_range=(0, 4), width=4)
+        lo_3_label = MathTex(r"\mathbb{Q}", font_size=24).next_to(lo_3, LEFT)
         
         # Real segment (0,1)
         lo_4 = Line(LEFT*2, RIGHT*2, stroke_width=6, color=BLUE)
@@ -174,7 +172,7 @@ class IncompleteTheoriesAndDLOWE(VoiceoverScene):
         linear_models = VGroup(
             VGroup(lo_1).move_to(semantics_center + UP * 1.5),
             VGroup(lo_2_label, lo_2).move_to(semantics_center + UP * 0.5),
-            VGroup(lo_3_label, lo_3_group).move_to(semantics_center + DOWN * 0.5),
+            VGroup(lo_3_label, lo_3).move_to(semantics_center + DOWN * 0.5),
             VGroup(lo_4_label, lo_4_group).move_to(semantics_center + DOWN * 1.5)
         )
         lo_dots = MathTex(r"\vdots").move_to(semantics_center + DOWN * 2.5)
@@ -212,7 +210,7 @@ class IncompleteTheoriesAndDLOWE(VoiceoverScene):
         with self.voiceover(text=script_14) as tracker:
             self.play(FadeOut(gap_arrow), FadeOut(cross), run_time=0.5)
             # Emphasize density in Q
-            q_dot = Dot(lo_3.point_from_proportion(0.125), color=YELLOW, radius=0.06)
+            q_dot = Dot(lo_3.n2p(0.5), color=YELLOW, radius=0.06)
             q_arrow = Arrow(UP, DOWN, color=YELLOW).scale(0.5).next_to(q_dot, UP, buff=0.1)
             self.play(FadeIn(q_dot), GrowArrow(q_arrow), run_time=1)
             self.wait(max(0.1, tracker.duration - 1.5))
@@ -290,46 +288,3 @@ class IncompleteTheoriesAndDLOWE(VoiceoverScene):
             self.wait(max(0.1, tracker.duration - 1.5))
 
         self.wait(2)
-
-
-    # ---------------------------------------------------
-    # Helper Function 
-    # ---------------------------------------------------
-    def get_mini_graph(self, g_type):
-        group = VGroup()
-        if g_type == "line": 
-            n1, n2, n3 = Dot(LEFT*0.5), Dot(ORIGIN), Dot(RIGHT*0.5)
-            e1, e2 = Arrow(n1, n2, buff=0.05), Arrow(n2, n3, buff=0.05)
-            e3 = Arrow(n1, n3, buff=0.05, path_arc=-0.6)
-            group.add(n1, n2, n3, e1, e2, e3)
-        elif g_type == "tree": 
-            n1, n2, n3 = Dot(UP*0.3), Dot(LEFT*0.4 + DOWN*0.3), Dot(RIGHT*0.4 + DOWN*0.3)
-            e1, e2 = Arrow(n1, n2, buff=0.05), Arrow(n1, n3, buff=0.05)
-            group.add(n1, n2, n3, e1, e2)
-        elif g_type == "bool_alg": 
-            n0 = Dot(DOWN*0.5)
-            n1a, n1b, n1c = Dot(LEFT*0.5), Dot(ORIGIN), Dot(RIGHT*0.5)
-            n3 = Dot(UP*0.5)
-            edges = [Arrow(n0,n1a,buff=0), Arrow(n0,n1b,buff=0), Arrow(n0,n1c,buff=0),
-                     Arrow(n1a,n3,buff=0), Arrow(n1b,n3,buff=0), Arrow(n1c,n3,buff=0),
-                     Arrow(n0,n3,buff=0.05, path_arc=0.8, stroke_opacity=0.5)]
-            group.add(n0, n1a, n1b, n1c, n3, *edges)
-        elif g_type == "disconnected": 
-            n1, n2 = Dot(LEFT*0.4), Dot(RIGHT*0.4)
-            n3, n4 = Dot(UP*0.4), Dot(DOWN*0.4)
-            e1 = Arrow(n3, n4, buff=0.05)
-            group.add(n1, n2, n3, n4, e1)
-        elif g_type == "lattice": 
-            n1, n2, n3, n4 = Dot(UP*0.4), Dot(LEFT*0.4), Dot(RIGHT*0.4), Dot(DOWN*0.4)
-            e1, e2 = Arrow(n1, n2, buff=0.05), Arrow(n1, n3, buff=0.05)
-            e3, e4 = Arrow(n2, n4, buff=0.05), Arrow(n3, n4, buff=0.05)
-            e5 = Arrow(n1, n4, buff=0.05, path_arc=0.3)
-            group.add(n1, n2, n3, n4, e1, e2, e3, e4, e5)
-        elif g_type == "pentagon_dag": 
-            n1, n2, n3 = Dot(UP*0.4), Dot(LEFT*0.4 + UP*0.1), Dot(RIGHT*0.4 + UP*0.1)
-            n4, n5 = Dot(LEFT*0.2 + DOWN*0.4), Dot(RIGHT*0.2 + DOWN*0.4)
-            edges = [Arrow(n1,n2,buff=0.05), Arrow(n1,n3,buff=0.05), Arrow(n2,n4,buff=0.05), Arrow(n3,n5,buff=0.05),
-                     Arrow(n1,n4,buff=0.05), Arrow(n1,n5,buff=0.05)]
-            group.add(n1, n2, n3, n4, n5, *edges)
-            
-        return group.scale(0.55)
\ No newline at end of file
@@ -2,6 +2,8 @@ from manim import *
 from manim_voiceover import VoiceoverScene
 from manim_voiceover.services.gtts import GTTSService # Or your preferred TTS service
 
+from manimations.graphs import get_mini_graph
+
 class SyntaxVsSemantics(VoiceoverScene):
     def construct(self):
         self.set_speech_service(GTTSService())
@@ -61,12 +63,12 @@ class SyntaxVsSemantics(VoiceoverScene):
 
         # 12 Total Structures (6 Valid, 6 Invalid)
         valid_graphs = VGroup(
-            self.get_mini_graph("line"), self.get_mini_graph("tree"), self.get_mini_graph("bool_alg"),
-            self.get_mini_graph("disconnected"), self.get_mini_graph("lattice"), self.get_mini_graph("pentagon_dag")
+            get_mini_graph("line"), get_mini_graph("tree"), get_mini_graph("bool_alg"),
+            get_mini_graph("disconnected"), get_mini_graph("lattice"), get_mini_graph("pentagon_dag")
         )
         invalid_graphs = VGroup(
-            self.get_mini_graph("reflexive"), self.get_mini_graph("symmetric"), self.get_mini_graph("cycle"),
-            self.get_mini_graph("dense_dag"), self.get_mini_graph("square_cycle"), self.get_mini_graph("non_transitive_line")
+            get_mini_graph("reflexive"), get_mini_graph("symmetric"), get_mini_graph("cycle"),
+            get_mini_graph("dense_dag"), get_mini_graph("square_cycle"), get_mini_graph("non_transitive_line")
         )
         all_graphs = VGroup(*valid_graphs, *invalid_graphs)
         
@@ -231,73 +233,3 @@ class SyntaxVsSemantics(VoiceoverScene):
             self.wait(max(0, tracker.duration - 1))
 
         self.wait(2)
-
-
-    # ---------------------------------------------------
-    # Helper Function for 12 Extended Mini-Graphs
-    # ---------------------------------------------------
-    def get_mini_graph(self, g_type):
-        group = VGroup()
-        if g_type == "line": 
-            n1, n2, n3 = Dot(LEFT*0.5), Dot(ORIGIN), Dot(RIGHT*0.5)
-            e1, e2 = Arrow(n1, n2, buff=0.05), Arrow(n2, n3, buff=0.05)
-            e3 = Arrow(n1, n3, buff=0.05, path_arc=-0.6)
-            group.add(n1, n2, n3, e1, e2, e3)
-        elif g_type == "tree": 
-            n1, n2, n3 = Dot(UP*0.3), Dot(LEFT*0.4 + DOWN*0.3), Dot(RIGHT*0.4 + DOWN*0.3)
-            e1, e2 = Arrow(n1, n2, buff=0.05), Arrow(n1, n3, buff=0.05)
-            group.add(n1, n2, n3, e1, e2)
-        elif g_type == "bool_alg": 
-            n0 = Dot(DOWN*0.5)
-            n1a, n1b, n1c = Dot(LEFT*0.5), Dot(ORIGIN), Dot(RIGHT*0.5)
-            n3 = Dot(UP*0.5)
-            edges = [Arrow(n0,n1a,buff=0), Arrow(n0,n1b,buff=0), Arrow(n0,n1c,buff=0),
-                     Arrow(n1a,n3,buff=0), Arrow(n1b,n3,buff=0), Arrow(n1c,n3,buff=0),
-                     Arrow(n0,n3,buff=0.05, path_arc=0.8, stroke_opacity=0.5)]
-            group.add(n0, n1a, n1b, n1c, n3, *edges)
-        elif g_type == "disconnected": 
-            n1, n2 = Dot(LEFT*0.4), Dot(RIGHT*0.4)
-            n3, n4 = Dot(UP*0.4), Dot(DOWN*0.4)
-            e1 = Arrow(n3, n4, buff=0.05)
-            group.add(n1, n2, n3, n4, e1)
-        elif g_type == "lattice": 
-            n1, n2, n3, n4 = Dot(UP*0.4), Dot(LEFT*0.4), Dot(RIGHT*0.4), Dot(DOWN*0.4)
-            e1, e2 = Arrow(n1, n2, buff=0.05), Arrow(n1, n3, buff=0.05)
-            e3, e4 = Arrow(n2, n4, buff=0.05), Arrow(n3, n4, buff=0.05)
-            e5 = Arrow(n1, n4, buff=0.05, path_arc=0.3)
-            group.add(n1, n2, n3, n4, e1, e2, e3, e4, e5)
-        elif g_type == "pentagon_dag": 
-            n1, n2, n3 = Dot(UP*0.4), Dot(LEFT*0.4 + UP*0.1), Dot(RIGHT*0.4 + UP*0.1)
-            n4, n5 = Dot(LEFT*0.2 + DOWN*0.4), Dot(RIGHT*0.2 + DOWN*0.4)
-            edges = [Arrow(n1,n2,buff=0.05), Arrow(n1,n3,buff=0.05), Arrow(n2,n4,buff=0.05), Arrow(n3,n5,buff=0.05),
-                     Arrow(n1,n4,buff=0.05), Arrow(n1,n5,buff=0.05)]
-            group.add(n1, n2, n3, n4, n5, *edges)
-        elif g_type == "reflexive": 
-            n1 = Dot(ORIGIN)
-            e1 = Arc(radius=0.2, start_angle=0, angle=3*PI/2).next_to(n1, UP, buff=0).shift(DOWN*0.1)
-            e1.add_tip(tip_length=0.1)
-            group.add(n1, e1)
-        elif g_type == "symmetric": 
-            n1, n2 = Dot(LEFT*0.4), Dot(RIGHT*0.4)
-            e1 = Arrow(n1, n2, buff=0.05, path_arc=-0.3)
-            e2 = Arrow(n2, n1, buff=0.05, path_arc=-0.3)
-            group.add(n1, n2, e1, e2)
-        elif g_type == "cycle": 
-            n1, n2, n3 = Dot(UP*0.4), Dot(LEFT*0.4 + DOWN*0.3), Dot(RIGHT*0.4 + DOWN*0.3)
-            e1, e2, e3 = Arrow(n1, n2, buff=0.05), Arrow(n2, n3, buff=0.05), Arrow(n3, n1, buff=0.05)
-            group.add(n1, n2, n3, e1, e2, e3)
-        elif g_type == "dense_dag": 
-            n1, n2, n3, n4 = Dot(LEFT*0.5+UP*0.5), Dot(RIGHT*0.5+UP*0.5), Dot(LEFT*0.5+DOWN*0.5), Dot(RIGHT*0.5+DOWN*0.5)
-            e1, e2 = Arrow(n1, n3, buff=0.05), Arrow(n2, n4, buff=0.05)
-            e3, e4 = Arrow(n1, n4, buff=0.05), Arrow(n2, n3, buff=0.05)
-            group.add(n1, n2, n3, n4, e1, e2, e3, e4)
-        elif g_type == "square_cycle": 
-            n1, n2, n3, n4 = Dot(UL*0.3), Dot(UR*0.3), Dot(DR*0.3), Dot(DL*0.3)
-            e1, e2, e3, e4 = Arrow(n1,n2,buff=0.05), Arrow(n2,n3,buff=0.05), Arrow(n3,n4,buff=0.05), Arrow(n4,n1,buff=0.05)
-            group.add(n1, n2, n3, n4, e1, e2, e3, e4)
-        elif g_type == "non_transitive_line": 
-            n1, n2, n3 = Dot(LEFT*0.4), Dot(ORIGIN), Dot(RIGHT*0.4)
-            e1, e2 = Arrow(n1, n2, buff=0.05), Arrow(n2, n3, buff=0.05)
-            group.add(n1, n2, n3, e1, e2)
-            
-        return group.scale(0.55)
\ No newline at end of file
@@ -3,6 +3,8 @@ from manim_voiceover import VoiceoverScene
 from manim_voiceover.services.recorder import RecorderService
 import numpy as np
 
+from manimations.surfaces import VectorizedSurface
+
 class MathematicalLogicDeepDive(VoiceoverScene, ThreeDScene):
     def construct(self):
         self.set_speech_service(RecorderService(transcription_model=None))
@@ -190,11 +192,11 @@ class MathematicalLogicDeepDive(VoiceoverScene, ThreeDScene):
         torus.move_to(LEFT * 4.5)
         torus.rotate(PI/4, axis=RIGHT).rotate(PI/6, axis=UP)
 
-        saddle = Surface(hyperbolic_saddle, u_range=[-1.5, 1.5], v_range=[-1.5, 1.5], resolution=(20, 20)).set_style(fill_color=TEAL, fill_opacity=0.7, stroke_color=WHITE, stroke_width=0.5)
+        saddle = VectorizedSurface(hyperbolic_saddle, u_range=[-1.5, 1.5], v_range=[-1.5, 1.5], resolution=(20, 20)).set_style(fill_color=TEAL, fill_opacity=0.7, stroke_color=WHITE, stroke_width=0.5)
         saddle.move_to(ORIGIN)
         saddle.rotate(PI/3, axis=RIGHT).rotate(PI/4, axis=UP)
 
-        mobius = Surface(mobius_func, u_range=[0, 2*PI], v_range=[-0.5, 0.5], resolution=(40, 15)).set_style(fill_color=PURPLE, fill_opacity=0.7, stroke_color=WHITE, stroke_width=0.5)
+        mobius = VectorizedSurface(mobius_func, u_range=[0, 2*PI], v_range=[-0.5, 0.5], resolution=(40, 15)).set_style(fill_color=PURPLE, fill_opacity=0.7, stroke_color=WHITE, stroke_width=0.5)
         mobius.move_to(RIGHT * 4.5)
         mobius.rotate(PI/2, axis=RIGHT).rotate(PI/4, axis=UP)
 
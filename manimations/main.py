@@ -1,6 +1,257 @@
-def main():
-    print("Hello from manimations!")
+import argparse
+import fnmatch
+import json
+import sys
+
+from manimations import bench, precompile, profiler, texbatch, texcache, voicestore
+from manimations.discovery import REPO_ROOT, SCENE_ROOTS, discover_scenes
+from manimations.render import (
+    QUALITY_DIRS, default_workers, profile_path, render_all, state_dir, timeline_all, timeline_path, worker_env,
+)
+
+
+def select_scenes(args):
+    jobs = discover_scenes(args.root, args.folders or SCENE_ROOTS)
+    if args.scenes:
+        jobs = [
+            j for j in jobs
+            if any(fnmatch.fnmatch(j.name, pat) or fnmatch.fnmatch(j.key, pat) for pat in args.scenes)
+        ]
+    return jobs
+
+
+def cmd_list(args):
+    for job in select_scenes(args):
+        print(f"{job.weight:8.1f}  {job.key}")
+
+
+def cmd_render(args):
+    jobs = select_scenes(args)
+    if not jobs:
+        print("No scenes matched.")
+        return 1
+    workers = args.jobs or default_workers()
+    if args.timeline_only:
+        return cmd_timeline(args, jobs, workers)
+    print(f"Rendering {len(jobs)} scenes at -q{args.quality} on {workers} workers")
+    results = render_all(
+        jobs,
+        quality=args.quality,
+        workers=workers,
+        extra_args=args.manim_args,
+        verbose=args.verbose,
+        root=args.root,
+        force=args.force,
+        tex_cache=not args.no_tex_cache,
+        precompile=not args.no_precompile,
+        split=args.split,
+        profile=args.profile,
+        offline_speech=args.offline_speech,
+        voice_store=not args.no_voice_store,
+        stream_audio=not args.no_stream_audio,
+        lod=not args.no_lod,
+    )
+    failed = [r for r in results if not r.ok]
+    print(f"{len(results) - len(failed)} rendered, {len(jobs) - len(results)} unchanged, {len(failed)} failed")
+    if args.profile:
+        print_profile(jobs, args.root)
+    return 1 if failed else 0
+
+
+def print_profile(jobs, root, top=30):
+    paths = [profile_path(j, root) for j in jobs if profile_path(j, root).exists()]
+    if not paths:
+        print("No profiles recorded.")
+        return 1
+    records = profiler.load_profiles(paths)
+    folded = paths[0].parent / "profile.folded"
+    profiler.write_folded(records, folded)
+    print(profiler.report(records, root, top))
+    print(f"Flame graph input: {folded}")
+
+
+def cmd_profile(args):
+    return print_profile(select_scenes(args), args.root, args.top)
+
+
+def cmd_tex_cache(args):
+    store = texcache.default_store(args.root)
+    if args.action == "import":
+        added, seen = texcache.import_media_tex(args.root, store)
+        print(f"Imported {added} new SVGs ({seen} found in media/Tex folders) into {store}")
+    count, size = texcache.store_stats(store)
+    print(f"{count} formulas, {size / 1e6:.1f} MB in {store}")
+
+
+def cmd_voice_store(args):
+    store = voicestore.default_store(args.root)
+    if args.action == "import":
+        added, seen = voicestore.import_media_voiceovers(args.root, store)
+        print(f"Imported {added} new narration entries ({seen} found in media/voiceovers caches) into {store}")
+        if updated := voicestore.add_durations(store):
+            print(f"Recorded the duration of {updated} entries stored without one")
+    entries, clips, size = voicestore.store_stats(store)
+    print(f"{entries} narration entries, {clips} audio files, {size / 1e6:.1f} MB in {store}")
+
+
+def cmd_timeline(args, jobs, workers):
+    print(f"Timing {len(jobs)} scenes at -q{args.quality} on {workers} workers (nothing is rendered)")
+    results = timeline_all(jobs, args.quality, workers, args.manim_args, args.verbose, args.root,
+                           tex_cache=not args.no_tex_cache, offline_speech=args.offline_speech,
+                           voice_store=not args.no_voice_store)
+    total = 0.0
+    for result in results:
+        if result.ok:
+            timeline = json.loads(timeline_path(result.job, args.root).read_text())
+            total += timeline["duration"]
+            slack = sum(b.get("slack", 0) for b in timeline["blocks"])
+            print(f"{timeline['duration']:8.1f}s  {len(timeline['blocks']):3d} voiceovers  {slack:6.1f}s past narration  {result.job.key}")
+    failed = [r for r in results if not r.ok]
+    print(f"{total:.1f}s in total; timelines in {timeline_path(jobs[0], args.root).parent}, {len(failed)} failed")
+    return 1 if failed else 0
+
+
+def cmd_bench(args):
+    if not args.scenes:
+        args.scenes = bench.BENCH_SCENES
+    jobs = select_scenes(args)
+    if not jobs:
+        print("No scenes matched.")
+        return 1
+    history_path = args.history or state_dir(args.root) / "bench.json"
+    history = bench.load_history(history_path)
+    print(f"Benchmarking {len(jobs)} scenes at -ql, one at a time")
+    results = bench.run_bench(jobs, worker_env(args.root, offline_speech=args.offline_speech), args.root, args.repeat)
+
+    found = bench.regressions(history, results, args.threshold)
+    for key, metric, baseline, value in found:
+        print(f"REGRESSION  {key}: {metric} {baseline:g} -> {value:g}")
+    if args.record:
+        history.append(bench.new_entry(results, args.root))
+        bench.save_history(history, history_path)
+        print(f"Recorded in {history_path}")
+    failed = len(results) < len(jobs)
+    return 1 if found or failed else 0
+
+
+def cmd_precompile(args):
+    jobs = select_scenes(args)
+    store = texcache.default_store(args.root)
+    compiled, cached, failed = precompile.precompile(jobs, args.jobs, store, batch_size=args.batch_size)
+    print(f"{compiled} compiled, {cached} already in the store, {failed} failed")
+    return 1 if failed else 0
+
+
+def cmd_tex_bench(args):
+    documents = precompile.documents_for(select_scenes(args))
+    documents = dict(list(documents.items())[:args.count])
+    if not documents:
+        print("No literal formulas found.")
+        return 1
+    workers = args.jobs or default_workers()
+    print(f"Compiling {len(documents)} formulas on {workers} workers, each way into an empty store")
+    rates = texbatch.benchmark(documents, workers, args.batch_size)
+    for label, (rate, seconds, failed) in rates.items():
+        print(f"{label:>16}: {rate:7.1f} formulas/s ({seconds:.1f}s, {failed} failed)")
+    (base, *_), (batched, *_) = rates.values()
+    if not base:
+        print("Nothing compiled one formula per document; no speedup to report.")
+        return 1
+    print(f"{batched / base:.1f}x")
+
+
+def add_selection_args(parser):
+    parser.add_argument("scenes", nargs="*", help="Scene names or 'path::Scene' globs (default: all)")
+    parser.add_argument("--root", default=REPO_ROOT, help="Repo checkout to scan")
+    parser.add_argument("--folder", dest="folders", action="append",
+                        help=f"Limit discovery to a top-level folder (default: {', '.join(SCENE_ROOTS)})")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="manimations", description="Build tooling for the video series.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_list = sub.add_parser("list", help="List discovered scenes with their cost estimate")
+    add_selection_args(p_list)
+    p_list.set_defaults(func=cmd_list)
+
+    p_render = sub.add_parser("render", help="Render scenes in parallel")
+    add_selection_args(p_render)
+    p_render.add_argument("-q", "--quality", choices=list(QUALITY_DIRS), default="l")
+    p_render.add_argument("-j", "--jobs", type=int, help="Worker processes (default: available cores)")
+    p_render.add_argument("-v", "--verbose", action="store_true", help="Stream every manim log line")
+    p_render.add_argument("-f", "--force", action="store_true", help="Re-render scenes whose inputs are unchanged")
+    p_render.add_argument("--profile", action="store_true",
+                          help="Render uncached and report where each self.play / self.wait spent its time")
+    p_render.add_argument("--timeline-only", action="store_true",
+                          help="Run construct without drawing and write each scene's timeline as JSON and CSV")
+    p_render.add_argument("--split", type=int, default=1, metavar="N",
+                          help="Render each voiceover scene as up to N segments in parallel, cut at voiceover blocks")
+    p_render.add_argument("--offline-speech", action="store_true",
+                          help="Narrate with silence of the estimated length where no audio exists yet")
+    p_render.add_argument("--no-tex-cache", action="store_true",
+                          help="Compile LaTeX into each folder's media/Tex instead of the shared store")
+    p_render.add_argument("--no-voice-store", action="store_true",
+                          help="Look narration up in each folder's media/voiceovers/cache.json instead of the store")
+    p_render.add_argument("--no-stream-audio", action="store_true",
+                          help="Let manim build the soundtrack in memory and remux it, as it does by default")
+    p_render.add_argument("--no-lod", action="store_true",
+                          help="Draw every mobject in full, however few pixels it covers")
+    p_render.add_argument("--no-precompile", action="store_true",
+                          help="Skip compiling the scenes' literal formulas up front")
+    p_render.add_argument("--manim-args", nargs=argparse.REMAINDER, default=[],
+                          help="Extra flags passed through to `manim render`")
+    p_render.set_defaults(func=cmd_render)
+
+    p_prof = sub.add_parser("profile", help="Report the profiles left by `render --profile`")
+    add_selection_args(p_prof)
+    p_prof.add_argument("--top", type=int, default=30, help="Call sites to show (default: 30)")
+    p_prof.set_defaults(func=cmd_profile)
+
+    p_bench = sub.add_parser("bench", help="Benchmark representative scenes and flag regressions")
+    add_selection_args(p_bench)
+    p_bench.add_argument("--repeat", type=int, default=1, help="Runs per scene; the fastest is kept")
+    p_bench.add_argument("--threshold", type=float, default=bench.DEFAULT_THRESHOLD,
+                         help="Relative slowdown / memory growth that counts as a regression (default: 0.15)")
+    p_bench.add_argument("--history", help="History file (default: .manimations/bench.json)")
+    p_bench.add_argument("--no-record", dest="record", action="store_false",
+                         help="Compare only; don't append this run to the history")
+    p_bench.add_argument("--offline-speech", action="store_true",
+                         help="Narrate with silence of the estimated length where no audio exists yet")
+    p_bench.set_defaults(func=cmd_bench)
+
+    p_pre = sub.add_parser("precompile", help="Compile every literal Tex / MathTex into the shared store")
+    add_selection_args(p_pre)
+    p_pre.add_argument("-j", "--jobs", type=int, help="Parallel LaTeX processes (default: available cores)")
+    p_pre.add_argument("--batch-size", type=int, default=texbatch.DEFAULT_BATCH_SIZE,
+                       help="Formulas typeset per LaTeX document (1: one document each)")
+    p_pre.set_defaults(func=cmd_precompile)
+
+    p_tex_bench = sub.add_parser("tex-bench", help="Formulas per second, batched vs. one LaTeX run per formula")
+    add_selection_args(p_tex_bench)
+    p_tex_bench.add_argument("-n", "--count", type=int, default=200, help="Formulas to compile (default: 200)")
+    p_tex_bench.add_argument("-j", "--jobs", type=int, help="Parallel LaTeX processes (default: available cores)")
+    p_tex_bench.add_argument("--batch-size", type=int, default=texbatch.DEFAULT_BATCH_SIZE)
+    p_tex_bench.set_defaults(func=cmd_tex_bench)
+
+    p_tex = sub.add_parser("tex-cache", help="Inspect or seed the shared LaTeX store")
+    p_tex.add_argument("action", choices=["stats", "import"], nargs="?", default="stats",
+                       help="'import' copies the SVGs already compiled in every media/Tex folder")
+    p_tex.add_argument("--root", default=REPO_ROOT, help="Repo checkout to scan")
+    p_tex.set_defaults(func=cmd_tex_cache)
+
+    p_voice = sub.add_parser("voice-store", help="Inspect or seed the shared voiceover store")
+    p_voice.add_argument("action", choices=["stats", "import"], nargs="?", default="stats",
+                         help="'import' adds every entry of every media/voiceovers/cache.json")
+    p_voice.add_argument("--root", default=REPO_ROOT, help="Repo checkout to scan")
+    p_voice.set_defaults(func=cmd_voice_store)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args) or 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Render tooling and shared helpers for the Manim-Code video series."""
@@ -0,0 +1,212 @@
+"""Streaming soundtrack assembly for scenes with many narration clips.
+
+manim decodes each clip passed to add_sound into a pydub AudioSegment as it
+is added and overlays it onto one soundtrack held in memory, copying the
+whole soundtrack every time; at the end it exports that as a WAV, converts
+the WAV to AAC and remuxes the movie with it. With forty clips the copying
+dominates and the soundtrack's size grows with the length of the video.
+
+Here add_sound only notes which clip starts when. Once the video has been
+concatenated, the clips are decoded in order and mixed a block at a time
+straight into the AAC encoder of the final mp4, in step with the video
+packets being copied across, so only the clips currently playing are open
+and nothing is re-encoded but the narration itself. Anything this does not
+cover (gif / webm output, add_sound keyword arguments) goes through manim.
+"""
+
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+# Set by the parent on workers that should assemble the soundtrack this way
+STREAM_AUDIO_ENV = "MANIMATIONS_STREAM_AUDIO"
+
+# Samples mixed per block (about a quarter of a second)
+BLOCK = 11025
+
+
+@dataclass
+class Placement:
+    path: Path
+    time: float
+    gain: float | None = None
+
+    @property
+    def scale(self):
+        return 1.0 if self.gain is None else 10 ** (self.gain / 20)
+
+
+class _Clip:
+    """A clip being decoded, resampled to the soundtrack's format, a block at a time."""
+
+    def __init__(self, placement, rate, layout):
+        import av
+
+        self.placement = placement
+        self.container = av.open(str(placement.path))
+        self.resampler = av.AudioResampler(format="fltp", layout=layout, rate=rate)
+        self.frames = self.container.decode(audio=0)
+        self.pending = []  # decoded arrays not yet mixed
+        self.position = round(placement.time * rate)  # soundtrack sample of pending[0][:, 0]
+        self.done = False
+
+    def _decode(self):
+        for frame in self.frames:
+            arrays = [f.to_ndarray() for f in self.resampler.resample(frame)]
+            if arrays:
+                return arrays
+        arrays = [f.to_ndarray() for f in self.resampler.resample(None)]
+        self.container.close()
+        self.done = not arrays
+        return arrays
+
+    def mix_into(self, mix, start):
+        """Adds the clip's samples falling in [start, start + mix width) to mix."""
+        stop = start + mix.shape[1]
+        while not self.done and self.position < stop:
+            if not self.pending:
+                self.pending = self._decode()
+                continue
+            chunk = self.pending[0]
+            end = self.position + chunk.shape[1]
+            lo, hi = max(self.position, start), min(end, stop)
+            if hi > lo:
+                mix[:, lo - start:hi - start] += chunk[:, lo - self.position:hi - self.position] * self.placement.scale
+            if end <= stop:
+                self.pending.pop(0)
+                self.position = end
+            else:
+                self.pending[0] = chunk[:, stop - self.position:]
+                self.position = stop
+
+    @property
+    def end(self):
+        return self.position
+
+
+def _probe(placements):
+    """(sample rate, channel layout) that loses nothing from any clip, as pydub's overlay would pick."""
+    import av
+
+    rate, channels = 0, 1
+    for placement in placements:
+        with av.open(str(placement.path)) as container:
+            stream = container.streams.audio[0]
+            rate = max(rate, stream.rate)
+            channels = max(channels, stream.channels)
+    return rate, "mono" if channels == 1 else "stereo"
+
+
+def mixed_blocks(placements, rate, layout, block=BLOCK):
+    """The soundtrack as consecutive float arrays (channels x samples), from 0 to the end of the last clip."""
+    import numpy as np
+
+    placements = sorted(placements, key=lambda p: p.time)
+    channels = 1 if layout == "mono" else 2
+    active, upcoming = [], list(placements)
+    start = 0
+    while active or upcoming:
+        stop = start + block
+        while upcoming and round(upcoming[0].time * rate) < stop:
+            active.append(_Clip(upcoming.pop(0), rate, layout))
+        mix = np.zeros((channels, block), dtype=np.float32)
+        for clip in active:
+            clip.mix_into(mix, start)
+        finished = [c for c in active if c.done]
+        active = [c for c in active if not c.done]
+        if not active and not upcoming:
+            mix = mix[:, :max([c.end for c in finished] + [start]) - start]
+        if mix.shape[1]:
+            yield np.clip(mix, -1.0, 1.0)
+        start = stop
+
+
+def _seconds(container, stream):
+    """Length of stream (or failing that the whole container) in seconds."""
+    import av
+
+    if stream.duration is not None:
+        return float(stream.duration * stream.time_base)
+    return container.duration / av.time_base
+
+
+def mux_soundtrack(movie_path, placements):
+    """Rewrites movie_path with the mixed placements as an AAC track, cut at the end of the video; the video packets are copied."""
+    import av
+
+    movie_path = Path(movie_path)
+    rate, layout = _probe(placements)
+    temp_path = movie_path.with_name(f"{movie_path.stem}_temp{movie_path.suffix}")
+    with av.open(str(movie_path)) as video_input, av.open(str(temp_path), mode="w") as output:
+        output.metadata.update(video_input.metadata)
+        video_stream = video_input.streams.video[0]
+        output_video = output.add_stream_from_template(template=video_stream)
+        output_audio = output.add_stream("aac", rate=rate, layout=layout)
+
+        blocks = mixed_blocks(placements, rate, layout)
+        written = 0  # soundtrack samples encoded so far
+        # manim muxes with shortest=1: narration running past the last frame doesn't lengthen the movie
+        length = round(_seconds(video_input, video_stream) * rate)
+
+        def encode_until(seconds):
+            nonlocal written
+            for mix in blocks:
+                mix = mix[:, :length - written]
+                if not mix.shape[1]:
+                    return
+                frame = av.AudioFrame.from_ndarray(mix, format="fltp", layout=layout)
+                frame.sample_rate = rate
+                frame.pts = written
+                written += mix.shape[1]
+                output.mux(output_audio.encode(frame))
+                if written >= min(seconds * rate, length):
+                    return
+
+        for packet in video_input.demux(video_stream):
+            # Skip the flushing packets demux ends with
+            if packet.dts is None:
+                continue
+            # Keep the narration level with the video so the muxer buffers little of either
+            if packet.pts is not None:
+                encode_until(float(packet.pts * packet.time_base))
+            packet.stream = output_video
+            output.mux(packet)
+        encode_until(float("inf"))
+        output.mux(output_audio.encode(None))
+    shutil.move(str(temp_path), str(movie_path))
+
+
+def install():
+    """Record add_sound calls and mix them into the movie while it is combined."""
+    from manim import config
+    from manim.scene.scene_file_writer import SceneFileWriter
+    from manim.utils.sounds import get_full_sound_file_path
+
+    add_sound = SceneFileWriter.add_sound
+    combine_to_movie = SceneFileWriter.combine_to_movie
+
+    def replay(self):
+        """Hands what was recorded so far to manim's own soundtrack, which takes over from here on."""
+        for placement in getattr(self, "placements", None) or []:
+            add_sound(self, placement.path, placement.time, placement.gain)
+        self.placements = None
+
+    def record_sound(self, sound_file, time=None, gain=None, **kwargs):
+        placements = getattr(self, "placements", [])
+        if placements is None or time is None or kwargs:
+            replay(self)
+            return add_sound(self, sound_file, time, gain, **kwargs)
+        placements.append(Placement(get_full_sound_file_path(sound_file), time, gain))
+        self.placements = placements
+
+    def combine_with_soundtrack(self):
+        placements = getattr(self, "placements", None)
+        if not placements or config.format == "gif" or config.movie_file_extension != ".mp4":
+            replay(self)
+            return combine_to_movie(self)
+        combine_to_movie(self)  # video only: manim has not seen any sound
+        if self.movie_file_path.exists():
+            mux_soundtrack(self.movie_file_path, placements)
+
+    SceneFileWriter.add_sound = record_sound
+    SceneFileWriter.combine_to_movie = combine_with_soundtrack
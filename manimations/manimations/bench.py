@@ -0,0 +1,160 @@
+"""Render benchmark: a fixed set of representative scenes, timed against their own history.
+
+Each scene is rendered at -ql on the CPU (Cairo, no preview window), with
+manim's cache disabled and Python's and numpy's random generators seeded, so
+two runs of the same code do the same work. Videos go to a scratch folder,
+never over the committed ones. Formulas still come from the shared LaTeX
+store, so the numbers measure rendering rather than LaTeX.
+"""
+
+import datetime
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from manimations.discovery import REPO_ROOT
+from manimations.render import manim_command, state_dir
+
+# Set by the parent: scratch folder the benchmarked render writes its video to
+BENCH_ENV = "MANIMATIONS_BENCH"
+
+# One scene per kind of workload: text-heavy, recursive trees, dense plots,
+# a long narrated essay, graph helpers shared across the WhatIsMath videos
+BENCH_SCENES = [
+    "HISTORY OF INFINITY/Diagonal/cantor_diagonal.py::CantorDiagonal",
+    "HISTORY OF INFINITY/numberClasses/TreeTest.py::BinaryTreeToRealLine",
+    "HISTORY OF INFINITY/Rienmann/rienmann.py::RiemannSumArea",
+    "HISTORY OF INFINITY/InfinityEssay/math_uni.py::Part1_Intro",
+    "WhatIsMath/Part1/7modeltheory.py::GraphAxiomsAndTheories",
+]
+
+# A metric is a regression when it exceeds the median of the last few runs by this much
+DEFAULT_THRESHOLD = 0.15
+BASELINE_RUNS = 5
+
+
+def install(video_dir):
+    """Deterministic scene, video written under video_dir."""
+    import random
+
+    import numpy as np
+    from manim import config
+
+    random.seed(0)
+    np.random.seed(0)
+    config.video_dir = f"{Path(video_dir).as_posix()}/{{module_name}}/{{quality}}"
+
+
+def count_frames(path):
+    import av
+
+    with av.open(str(path)) as container:
+        stream = container.streams.video[0]
+        return stream.frames or sum(1 for _ in container.decode(stream))
+
+
+def bench_scene(job, env, log_path):
+    """Renders one scene from scratch. Returns its metrics, or None if the render failed."""
+    scratch = Path(tempfile.mkdtemp(prefix="manimations-bench-"))
+    try:
+        env = dict(env, **{BENCH_ENV: str(scratch)})
+        command = manim_command(job, "l", ["--disable_caching"])
+        with open(log_path, "w", encoding="utf-8") as log:
+            start = time.perf_counter()
+            proc = subprocess.Popen(command, cwd=job.workdir, env=env, stdin=subprocess.DEVNULL,
+                                    stdout=log, stderr=subprocess.STDOUT)
+            # wait4 rather than wait: it reports this child's own peak memory
+            _, status, usage = os.wait4(proc.pid, 0)
+            wall = time.perf_counter() - start
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        videos = list(scratch.rglob(f"{job.name}.mp4"))
+        if proc.returncode != 0 or not videos:
+            return None
+        return {
+            "wall": round(wall, 3),
+            "rss_mb": round(usage.ru_maxrss / 1024, 1),  # kilobytes on Linux
+            "frames": count_frames(videos[0]),
+            "bytes": videos[0].stat().st_size,
+        }
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def run_bench(jobs, env, root=REPO_ROOT, repeat=1, say=print):
+    """{key: metrics} for each job; with repeat > 1 the fastest run of each is kept."""
+    logs = state_dir(root) / "logs"
+    logs.mkdir(exist_ok=True)
+    results = {}
+    for job in jobs:
+        runs = []
+        for _ in range(repeat):
+            metrics = bench_scene(job, env, logs / f"bench_{job.name}.log")
+            if metrics is None:
+                say(f"FAIL  {job.key} (see {logs / f'bench_{job.name}.log'})")
+                break
+            runs.append(metrics)
+        if runs:
+            results[job.key] = min(runs, key=lambda m: m["wall"])
+            m = results[job.key]
+            say(f"{m['wall']:8.2f}s {m['rss_mb']:8.1f} MB {m['frames']:6d} frames {m['bytes'] / 1e6:7.2f} MB  {job.key}")
+    return results
+
+
+# --- HISTORY ---
+
+def load_history(path):
+    path = Path(path)
+    return json.loads(path.read_text()) if path.exists() else []
+
+
+def save_history(history, path):
+    path = Path(path)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(history, indent=2))
+    os.replace(tmp, path)
+
+
+def current_commit(root=REPO_ROOT):
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=root, capture_output=True,
+                              text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def new_entry(results, root=REPO_ROOT):
+    from manim import __version__ as manim_version
+
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": current_commit(root),
+        "manim": manim_version,
+        "results": results,
+    }
+
+
+def regressions(history, results, threshold=DEFAULT_THRESHOLD):
+    """[(key, metric, baseline, value)] where wall time or memory grew past the threshold.
+
+    The baseline is the median of the last BASELINE_RUNS recorded runs of the
+    scene. Frame counts and file sizes are reported when they change at all,
+    since the same code should produce the same video.
+    """
+    found = []
+    for key, metrics in results.items():
+        previous = [entry["results"][key] for entry in history if key in entry["results"]][-BASELINE_RUNS:]
+        if not previous:
+            continue
+        for metric in ("wall", "rss_mb"):
+            baseline = statistics.median(p[metric] for p in previous)
+            if metrics[metric] > baseline * (1 + threshold):
+                found.append((key, metric, baseline, metrics[metric]))
+        for metric in ("frames", "bytes"):
+            if metrics[metric] != previous[-1][metric]:
+                found.append((key, metric, previous[-1][metric], metrics[metric]))
+    return found
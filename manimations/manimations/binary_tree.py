@@ -0,0 +1,101 @@
+"""The full binary tree of finite 0/1 sequences, laid out a level at a time with NumPy.
+
+Node i of level k is the sequence of the k binary digits of i; its children
+are 2i (append 0) and 2i + 1 (append 1), a step up and spread / 2**k to
+either side. Since the spread halves every level, the node of a sequence
+b1 b2 ... bk sits above the middle of the dyadic interval [0.b1...bk,
+0.b1...bk + 2**-k] of a NumberLine of length 10 centred over the root (for
+the default spread of 2.5), so every infinite path heads straight for its
+real number. All edges between two levels are one path, and
+the nodes of a level are one PointCloud, so depth 12 is a few dozen mobjects.
+Only the shallow levels get MathTex labels.
+
+    from manimations.binary_tree import BinaryTree, Descend
+    tree = BinaryTree(depth=10, step=0.5)
+    self.play(Descend(tree, "0101010101", end=number_line.n2p(1 / 3)))
+"""
+
+import numpy as np
+from manim import (
+    BLUE, DOWN, GREEN, ORANGE, PINK, PURPLE, RED, RIGHT, UP, WHITE, YELLOW,
+    Create, MathTex, VGroup, VMobject, linear,
+)
+
+from manimations.points import PointCloud
+from manimations.trees import segment_points
+
+LEVEL_COLORS = (BLUE, GREEN, RED, ORANGE, PURPLE, PINK)
+
+# Font size of the labels per level; deeper levels are unlabelled
+LABEL_SIZES = (32, 24, 24, 18, 12)
+
+
+def node_levels(depth, root=DOWN * 3.5, step=0.7, spread=2.5):
+    """[(2**k, 3) node positions] for levels 0 to depth."""
+    levels = [np.array([root], dtype=float)]
+    for k in range(depth):
+        parents = np.repeat(levels[-1], 2, axis=0)
+        sides = np.tile([-1.0, 1.0], len(levels[-1])) * spread / 2**k
+        levels.append(parents + step * UP + sides[:, None] * RIGHT)
+    return levels
+
+
+def dyadic_value(bits):
+    """The real 0.b1b2...bk in binary."""
+    return int(bits, 2) / 2 ** len(bits) if bits else 0.0
+
+
+def sequence_tex(bits):
+    return rf"\langle {','.join(bits)} \rangle"
+
+
+class BinaryTree(VGroup):
+    """Binary tree to depth: self.edges[k - 1] joins levels k - 1 and k, self.nodes[k] and self.labels[k] are level k."""
+
+    def __init__(self, depth=5, root=DOWN * 3.5, step=0.7, spread=2.5, node_radius=0.08,
+                 edge_color=YELLOW, label_sizes=LABEL_SIZES):
+        super().__init__()
+        levels = node_levels(depth, root, step, spread)
+        self.edges = []
+        for k in range(1, depth + 1):
+            edges = VMobject()
+            edges.set_points(segment_points(np.repeat(levels[k - 1], 2, axis=0), levels[k]))
+            edges.set_stroke(edge_color, width=2 * 0.75 ** max(k - 2, 0))
+            self.edges.append(edges)
+        # Nodes shrink once they would come within a diameter of their neighbours
+        self.nodes = [
+            PointCloud(positions, color=LEVEL_COLORS[k % len(LEVEL_COLORS)], radius=min(node_radius, spread / 2 ** (k - 2) / 3))
+            for k, positions in enumerate(levels)
+        ]
+        self.labels = [
+            VGroup(*(
+                MathTex(sequence_tex(format(i, f"0{k}b") if k else ""), font_size=size, color=WHITE)
+                .next_to(position, UP, buff=0.05 + node_radius)
+                for i, position in enumerate(levels[k])
+            ))
+            for k, size in enumerate(label_sizes[:depth + 1])
+        ]
+        self.add(*self.edges, *self.nodes, *self.labels)
+
+    @property
+    def depth(self):
+        return len(self.edges)
+
+    def position(self, bits):
+        """Where the node of the sequence bits now stands."""
+        return self.nodes[len(bits)].positions[int(bits, 2) if bits else 0].copy()
+
+    def path(self, bits, end=None, color=RED, stroke_width=4):
+        """Polyline from the root through every prefix of bits (and on to end, if given)."""
+        corners = [self.position(bits[:k]) for k in range(len(bits) + 1)]
+        if end is not None:
+            corners.append(np.asarray(end, dtype=float))
+        return VMobject(stroke_color=color, stroke_width=stroke_width).set_points_as_corners(corners)
+
+
+class Descend(Create):
+    """Draws the path through bits from the root, an edge at a time at an even pace, then on to end if given."""
+
+    def __init__(self, tree, bits, end=None, color=RED, stroke_width=4, **kwargs):
+        kwargs.setdefault("rate_func", linear)
+        super().__init__(tree.path(bits, end, color, stroke_width), **kwargs)
@@ -0,0 +1,148 @@
+import ast
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+
+# Repo checkout that holds the video folders (manimations/manimations/ -> repo)
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Folders that make up the published series
+SCENE_ROOTS = ["HISTORY OF INFINITY", "WhatIsMath", "WhatIsMathNew"]
+
+# Manim base classes a renderable scene derives from
+SCENE_BASES = {
+    "Scene", "VoiceoverScene", "ThreeDScene", "MovingCameraScene",
+    "ZoomedScene", "VectorScene", "LinearTransformationScene",
+}
+
+# Rough relative cost of each self.<call> inside construct.
+# A voiceover block holds several seconds of narration, so it weighs the most.
+CALL_WEIGHTS = {"play": 1.0, "wait": 0.5, "move_camera": 1.0, "voiceover": 4.0}
+
+
+@dataclass
+class SceneJob:
+    path: Path
+    name: str
+    root: Path
+    weight: float = 1.0
+    n_plays: int = 0
+    is_voiceover: bool = False
+
+    @property
+    def key(self):
+        """Stable identifier used in logs and caches: 'folder/file.py::Scene'."""
+        return f"{self.path.relative_to(self.root).as_posix()}::{self.name}"
+
+    @property
+    def workdir(self):
+        """Scenes are rendered from their own folder so media/ and images resolve."""
+        return self.path.parent
+
+
+def _base_names(class_def):
+    for base in class_def.bases:
+        if isinstance(base, ast.Name):
+            yield base.id
+        elif isinstance(base, ast.Attribute):
+            yield base.attr
+
+
+def _range_count(iter_node):
+    """Number of iterations of `for _ in range(<literal>)`, else 1."""
+    if (
+        isinstance(iter_node, ast.Call)
+        and isinstance(iter_node.func, ast.Name)
+        and iter_node.func.id == "range"
+        and iter_node.args
+        and all(isinstance(a, ast.Constant) and isinstance(a.value, int) for a in iter_node.args)
+    ):
+        bounds = [a.value for a in iter_node.args]
+        return max(len(range(*bounds)), 1)
+    if isinstance(iter_node, (ast.List, ast.Tuple)):
+        return max(len(iter_node.elts), 1)
+    return 1
+
+
+def _weigh(node, factor=1.0):
+    """Sums CALL_WEIGHTS over self.<call>(...) nodes, scaling loop bodies by their trip count."""
+    weight, plays = 0.0, 0
+    if isinstance(node, (ast.For, ast.AsyncFor)):
+        factor *= _range_count(node.iter)
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "self"
+        and node.func.attr in CALL_WEIGHTS
+    ):
+        weight += CALL_WEIGHTS[node.func.attr] * factor
+        if node.func.attr in ("play", "wait"):
+            plays += int(factor)
+    for child in ast.iter_child_nodes(node):
+        w, p = _weigh(child, factor)
+        weight += w
+        plays += p
+    return weight, plays
+
+
+def scenes_in_file(path, root=REPO_ROOT):
+    """Parses a script without importing it and returns a SceneJob per Scene subclass."""
+    try:
+        with warnings.catch_warnings():
+            # Old scripts use "\p"-style escapes in plain strings
+            warnings.simplefilter("ignore", SyntaxWarning)
+            tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    except (SyntaxError, UnicodeDecodeError):
+        return []
+
+    classes = [n for n in tree.body if isinstance(n, ast.ClassDef)]
+    scene_names = set()
+    voiceover_names = set()
+    # Resolve local inheritance (class B(A) where A is a scene defined above)
+    changed = True
+    while changed:
+        changed = False
+        for cls in classes:
+            bases = set(_base_names(cls))
+            if cls.name not in scene_names and bases & (SCENE_BASES | scene_names):
+                scene_names.add(cls.name)
+                changed = True
+            if cls.name not in voiceover_names and bases & ({"VoiceoverScene"} | voiceover_names):
+                voiceover_names.add(cls.name)
+                changed = True
+
+    jobs = []
+    for cls in classes:
+        if cls.name not in scene_names:
+            continue
+        weight, plays = _weigh(cls)
+        jobs.append(SceneJob(
+            path=Path(path).resolve(),
+            name=cls.name,
+            root=Path(root).resolve(),
+            weight=max(weight, 1.0),
+            n_plays=plays,
+            is_voiceover=cls.name in voiceover_names,
+        ))
+    return jobs
+
+
+def iter_scene_files(root=REPO_ROOT, folders=SCENE_ROOTS):
+    """Yields every .py script under the series folders, skipping media/ output trees."""
+    for folder in folders:
+        base = Path(root) / folder
+        if not base.is_dir():
+            continue
+        for path in sorted(base.rglob("*.py")):
+            if "media" in path.relative_to(base).parts or "__pycache__" in path.parts:
+                continue
+            yield path
+
+
+def discover_scenes(root=REPO_ROOT, folders=SCENE_ROOTS):
+    """Every Scene / VoiceoverScene subclass in the series, in file order."""
+    jobs = []
+    for path in iter_scene_files(root, folders):
+        jobs.extend(scenes_in_file(path, root))
+    return jobs
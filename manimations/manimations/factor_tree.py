@@ -0,0 +1,240 @@
+"""Prime factor trees of any integer, laid out as tidy trees with the edges of each level in one path.
+
+A node n splits into two children whose prime factors are dealt out from the
+largest down, each to the side with the smaller product so far, so the two
+products come out close to sqrt(n) and the tree is about log2(number of
+prime factors) deep. Leaves (the primes) stand a leaf_gap apart in order,
+and every other node stands over the middle of its two children, so subtrees
+never overlap. Numbers are factored by trial division over a cached sieve,
+then Pollard's rho for whatever is left, so Gödel-number-sized composites
+are instant. Labels come from manimations.interning, so the hundreds of 2s
+and 3s of a row of trees are copies of one MathTex each.
+
+A FactorForest holds the trees of many numbers (a number line's worth) with
+every tree's edges between levels k - 1 and k in self.edges[k - 1] and their
+numbers in self.labels[k]:
+
+    from manimations.factor_tree import FactorForest, FactorTree, GrowFactorTree
+    tree = FactorTree(1792, root=UP * 2, font_size=24)
+    self.play(GrowFactorTree(tree))
+    forest = FactorForest(range(2, 201), [line.n2p(n) for n in range(2, 201)], root_labels=False)
+"""
+
+import math
+import random
+from functools import lru_cache
+
+import numpy as np
+from manim import DOWN, ORIGIN, RIGHT, UP, WHITE, YELLOW, AnimationGroup, FadeIn, Succession, VGroup, VMobject
+
+from manimations.interning import tex
+from manimations.trees import GrowBranches, segment_points
+
+# Primes below this are found by the sieve; trial division goes this far
+SIEVE_LIMIT = 1 << 16
+
+# Miller-Rabin with these bases is exact below 3.3e24
+WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+@lru_cache(maxsize=None)
+def small_primes(limit=SIEVE_LIMIT):
+    """Every prime up to limit, as a list."""
+    sieve = np.ones(limit + 1, dtype=bool)
+    sieve[:2] = False
+    for p in range(2, math.isqrt(limit) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = False
+    return np.flatnonzero(sieve).tolist()
+
+
+def is_prime(n):
+    if n < 2:
+        return False
+    for p in WITNESSES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for a in WITNESSES:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _rho_divisor(n):
+    """A proper divisor of the odd composite n, by Brent's variant of Pollard's rho."""
+    rng = random.Random(n)
+    while True:
+        y, c, batch = rng.randrange(1, n), rng.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += batch
+            r *= 2
+        if g == n:
+            # The batch overshot: step through it one at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def _large_factors(n):
+    if is_prime(n):
+        return [n]
+    d = _rho_divisor(n)
+    return _large_factors(d) + _large_factors(n // d)
+
+
+def prime_factors(n):
+    """Prime factors of n >= 1 with multiplicity, ascending."""
+    if n < 1:
+        raise ValueError(f"Only positive integers have prime factors, not {n}")
+    factors = []
+    for p in small_primes():
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+    if n > 1:
+        factors += _large_factors(n)
+    return sorted(factors)
+
+
+def split_factors(factors):
+    """factors dealt to two sides, largest first, each to the side with the smaller product; smaller side first."""
+    sides, logs = ([], []), [0.0, 0.0]
+    for p in sorted(factors, reverse=True):
+        side = 0 if logs[0] <= logs[1] else 1
+        sides[side].append(p)
+        logs[side] += math.log(p)
+    return sorted(sides, key=math.prod)
+
+
+def factor_layout(n):
+    """(values, parents, depths, slots) of n's factor tree in breadth-first order.
+
+    parents[i] is -1 for the root; slots are x positions in leaf widths,
+    leaves one apart and the root at 0.
+    """
+    nodes = []
+
+    def place(factors, parent, depth, next_slot):
+        index = len(nodes)
+        nodes.append([math.prod(factors), parent, depth, 0.0])
+        if len(factors) < 2:
+            nodes[index][3] = next_slot
+            return next_slot + 1
+        children = []
+        for side in split_factors(factors):
+            children.append(len(nodes))
+            next_slot = place(side, index, depth + 1, next_slot)
+        nodes[index][3] = (nodes[children[0]][3] + nodes[children[1]][3]) / 2
+        return next_slot
+
+    place(prime_factors(n) or [1], -1, 0, 0.0)
+    order = sorted(range(len(nodes)), key=lambda i: nodes[i][2])
+    renumber = {old: new for new, old in enumerate(order)}
+    values = [nodes[i][0] for i in order]
+    parents = np.array([renumber.get(nodes[i][1], -1) for i in order])
+    depths = np.array([nodes[i][2] for i in order])
+    slots = np.array([nodes[i][3] for i in order]) - nodes[0][3]
+    return values, parents, depths, slots
+
+
+def number_tex(n, max_digits=12):
+    """n in full, or to three figures if it has more than max_digits digits."""
+    digits = str(n)
+    if len(digits) <= max_digits:
+        return digits
+    return rf"\approx {digits[0]}.{digits[1:3]} \times 10^{{{len(digits) - 1}}}"
+
+
+class FactorForest(VGroup):
+    """Factor trees of numbers, rooted at roots; the root labels can be left off (a number line already shows them)."""
+
+    def __init__(self, numbers, roots, step=0.7, leaf_gap=0.5, font_size=24, color=WHITE, leaf_color=None,
+                 edge_color=YELLOW, stroke_width=2, root_labels=True, max_digits=12):
+        super().__init__()
+        values, parents, depths, positions = [], [], [], []
+        for n, root in zip(numbers, roots):
+            tree_values, tree_parents, tree_depths, slots = factor_layout(n)
+            offset = len(values)
+            values += tree_values
+            parents.append(np.where(tree_parents < 0, -1, tree_parents + offset))
+            depths.append(tree_depths)
+            positions.append(np.asarray(root, dtype=float) + slots[:, None] * leaf_gap * RIGHT + tree_depths[:, None] * step * DOWN)
+        self.values = values
+        self.parents = np.concatenate(parents) if parents else np.zeros(0, dtype=int)
+        self.depths = np.concatenate(depths) if depths else np.zeros(0, dtype=int)
+        self.positions = np.vstack(positions) if positions else np.zeros((0, 3))
+
+        is_leaf = np.ones(len(values), dtype=bool)
+        is_leaf[self.parents[self.parents >= 0]] = False
+        tops, bottoms = self.positions.copy(), self.positions.copy()
+        self.labels = [VGroup() for _ in range(self.depths.max(initial=-1) + 1)]
+        for i, (value, depth, position) in enumerate(zip(values, self.depths, self.positions)):
+            if depth == 0 and not root_labels:
+                continue
+            label_color = leaf_color if leaf_color is not None and is_leaf[i] else color
+            label = tex(number_tex(value, max_digits), font_size=font_size, color=label_color).move_to(position)
+            tops[i], bottoms[i] = label.get_top(), label.get_bottom()
+            self.labels[depth].add(label)
+
+        self.edges = []
+        for depth in range(1, len(self.labels)):
+            children = np.flatnonzero(self.depths == depth)
+            edges = VMobject()
+            edges.set_points(segment_points(bottoms[self.parents[children]], tops[children]))
+            edges.set_stroke(edge_color, width=stroke_width)
+            self.edges.append(edges)
+        self.add(*self.edges, *self.labels)
+
+    @property
+    def depth(self):
+        return len(self.edges)
+
+    def level(self, k):
+        """The numbers at depth k with the edges leading down to them."""
+        return VGroup(self.labels[k]) if k == 0 else VGroup(self.edges[k - 1], self.labels[k])
+
+
+class FactorTree(FactorForest):
+    """The factor tree of n, its root label at root."""
+
+    def __init__(self, n, root=ORIGIN, **kwargs):
+        self.n = n
+        super().__init__([n], [root], **kwargs)
+
+
+class GrowFactorTree(Succession):
+    """Fades in the roots, then each level in turn: its edges grow down and its numbers fade in at their ends."""
+
+    def __init__(self, forest, **kwargs):
+        steps = [FadeIn(forest.labels[0], shift=UP * 0.2)] if forest.labels and len(forest.labels[0]) else []
+        steps += [
+            AnimationGroup(GrowBranches(VGroup(edges)), FadeIn(labels, shift=UP * 0.2), lag_ratio=0.5)
+            for edges, labels in zip(forest.edges, forest.labels[1:])
+        ]
+        super().__init__(*steps, **kwargs)
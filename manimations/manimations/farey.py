@@ -0,0 +1,103 @@
+"""The Farey graph in the Poincaré disk, drawn as one VMobject per generation of edges.
+
+Vertices are the rationals p/q (and 1/0) on the boundary circle, placed by the
+Cayley transform x -> (x - i) / (x + i), so 1/0, -1, 0 and 1 sit at angles 0,
+pi/2, pi and 3pi/2. Two rationals are joined when they are Farey neighbours
+(|ps - qr| = 1); every generation of edges comes from taking the mediant of
+the pairs of the one before, which is done for all pairs at once with NumPy.
+Each edge is the true hyperbolic geodesic: the arc of the circle meeting the
+boundary at right angles (the edge 0 -- 1/0 is a diameter).
+
+The Bezier points of every generation are memoized by (radius, depth), and
+each generation is a single VMobject with a subpath per edge, so depth 10
+(4000-odd edges) costs a dozen mobjects rather than thousands.
+
+    from manimations.farey import get_farey_graph
+    farey = get_farey_graph(radius=1.2, depth=2)
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from manim import RED_A, WHITE, Circle, VGroup, VMobject
+
+# The four quadrants between 1/0 (taken as -1/0 going round), -1, 0, 1 and 1/0
+FIRST_NEIGHBOURS = np.array([[-1, 0], [-1, 1], [0, 1], [1, 1], [1, 0]])
+
+# Cubic pieces per geodesic: each spans at most a quarter turn of its circle
+PIECES = 2
+
+
+def farey_generations(depth):
+    """[(left, right)] per generation, each an (n, 2) array of (p, q) pairs; the first holds the depth-1 edges."""
+    if depth < 1:
+        raise ValueError(f"The Farey graph needs a depth of at least 1, not {depth}")
+    left, right = FIRST_NEIGHBOURS[:-1], FIRST_NEIGHBOURS[1:]
+    generations = [(np.vstack([left, [[0, 1]]]), np.vstack([right, [[1, 0]]]))]  # plus the diameter 0 -- 1/0
+    for _ in range(depth - 1):
+        mediant = left + right
+        left, right = np.vstack([left, mediant]), np.vstack([mediant, right])
+        generations.append((left, right))
+    return generations
+
+
+def boundary_angle(fractions):
+    """Angle on the boundary circle of each p/q under the Cayley transform."""
+    return 2 * np.arctan2(-fractions[:, 1], fractions[:, 0])
+
+
+def _arc_handles(span):
+    return 4 / 3 * np.tan(span / 4)
+
+
+def geodesic_points(alpha, beta, radius):
+    """Cubic Bezier points (4 per piece, PIECES per edge) of the geodesics between boundary angles alpha and beta."""
+    half = np.abs(np.angle(np.exp(1j * (beta - alpha)))) / 2  # half the boundary angle between the ends
+    p1 = radius * np.exp(1j * alpha)
+    p2 = radius * np.exp(1j * beta)
+    straight = np.isclose(half, np.pi / 2)
+    half = np.where(straight, np.pi / 4, half)  # placeholder; diameters are replaced below
+
+    # The orthogonal circle: centred on the bisector, radius R tan(half)
+    centre = radius * np.exp(1j * np.angle(p1 + p2)) / np.cos(half)
+    r = radius * np.tan(half)
+    start = np.angle(p1 - centre)
+    sweep = np.angle((p2 - centre) / (p1 - centre))  # the short way round, through the disk
+
+    t = np.arange(PIECES + 1) / PIECES
+    angles = start[:, None] + sweep[:, None] * t  # (edges, PIECES + 1)
+    on_circle = centre[:, None] + r[:, None] * np.exp(1j * angles)
+    tangent = 1j * np.exp(1j * angles) * (r * _arc_handles(sweep / PIECES))[:, None]
+    pieces = np.stack([
+        on_circle[:, :-1],
+        on_circle[:, :-1] + tangent[:, :-1],
+        on_circle[:, 1:] - tangent[:, 1:],
+        on_circle[:, 1:],
+    ], axis=2)  # (edges, PIECES, 4)
+
+    line = p1[:, None] + (p2 - p1)[:, None] * np.linspace(0, 1, 3 * PIECES + 1)
+    line_pieces = np.stack([line[:, i:i + 4] for i in range(0, 3 * PIECES, 3)], axis=1)
+    pieces = np.where(straight[:, None, None], line_pieces, pieces)
+
+    flat = pieces.reshape(-1)
+    return np.column_stack([flat.real, flat.imag, np.zeros(len(flat))])
+
+
+@lru_cache(maxsize=None)
+def farey_points(radius, depth):
+    """Bezier points of each generation of edges, memoized; generation 0 is the outermost."""
+    return tuple(
+        geodesic_points(boundary_angle(left), boundary_angle(right), radius)
+        for left, right in farey_generations(depth)
+    )
+
+
+def get_farey_graph(radius=2, depth=3, color=RED_A):
+    """Boundary circle plus one VMobject per generation, thinner the deeper it is."""
+    farey_group = VGroup(Circle(radius=radius, color=WHITE, stroke_opacity=0.5))
+    for generation, points in enumerate(farey_points(radius, depth)):
+        edges = VMobject()
+        edges.set_points(points.copy())
+        edges.set_stroke(color=color, width=2 * (depth - generation) / depth, opacity=0.8)
+        farey_group.add(edges)
+    return farey_group
@@ -0,0 +1,174 @@
+"""Grids of symbols (digit matrices like Cantor's diagonal) with each distinct glyph shaped once.
+
+A SymbolGrid keeps its cells as arrays, symbols and RGBA colours indexed by
+(row, col), and draws them by translating the outline of each symbol, shaped
+by Text (or MathTex) the first time it is needed, to every cell holding it.
+Each row is a VGroup with one path per symbol and colour in it, so
+`Write(grid.rows[i])` writes a row and a 100 x 100 grid of 0s and 1s is 200
+paths, built with NumPy in milliseconds. A tiny marker (the centre of cell
+(0, 0) and two short axes) travels with the grid, so cells can still be
+addressed after it is moved, scaled or rotated:
+
+    grid.cell_center(row, col)           where a cell now is
+    grid.highlight(cells, color)         squares around cells, as one path
+    grid.set_cell_color(cells, color) / grid.set_symbol(cells, symbols)
+    FlipCells(grid, cells)               cells turn over like cards to their complement
+    RecolorCells(grid, cells, color)     cells fade to a new colour
+
+    from manimations.glyphs import FlipCells, SymbolGrid
+    grid = SymbolGrid(np.random.randint(0, 2, (50, 50)), font_size=10, cell=(0.15, 0.15))
+    self.play(FlipCells(grid, [(i, i) for i in range(50)], color=BLUE))
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from manim import ORIGIN, RIGHT, UP, WHITE, YELLOW, Animation, MathTex, Text, VGroup, VMobject, color_to_rgba, rgb_to_color
+
+from manimations.trees import segment_points
+
+# Length of the marker's axes: short, so they never stick out of the grid's bounding box
+FRAME = 1e-3
+
+# What a binary digit shows on its other side
+COMPLEMENT = {"0": "1", "1": "0"}
+
+
+@lru_cache(maxsize=None)
+def glyph_outline(symbol, font_size, tex=False):
+    """Bezier points of symbol, shaped once, centred on the origin the way move_to would centre it."""
+    if not symbol.strip():
+        return np.zeros((0, 3))
+    mobject = MathTex(symbol, font_size=font_size) if tex else Text(symbol, font_size=font_size)
+    points = np.vstack([m.points for m in mobject.family_members_with_points()])
+    return points - mobject.get_center()
+
+
+def _cells(cells):
+    """(rows, cols) index arrays of a list of (row, col)."""
+    rows, cols = np.array(cells, dtype=int).reshape(-1, 2).T
+    return rows, cols
+
+
+class SymbolGrid(VGroup):
+    """entries[i][j] (anything str() takes) at cell (i, j); rows go down and columns right from origin, cell apart."""
+
+    def __init__(self, entries, font_size=20, cell=(0.4, 0.5), origin=ORIGIN, color=WHITE, tex=False):
+        super().__init__()
+        self.symbols = np.array([[str(entry) for entry in row] for row in entries], dtype=object)
+        self.font_size, self.tex, self.cell = font_size, tex, cell
+        self.rgbas = np.tile(color_to_rgba(color), (*self.symbols.shape, 1))
+        # Vertical scale of each cell's glyph, for FlipCells
+        self.squash = np.ones(self.symbols.shape)
+        origin = np.asarray(origin, dtype=float)
+        self.marker = VMobject(stroke_width=0, fill_opacity=0)
+        self.marker.set_points([origin, origin + FRAME * RIGHT, origin + FRAME * UP, origin])
+        self.rows = [VGroup() for _ in range(len(self.symbols))]
+        self.add(*self.rows, self.marker)
+        self.redraw()
+
+    def frame(self):
+        """(centre of cell (0, 0), unit axis along the rows, unit axis up the columns) where the grid now stands."""
+        origin, right, up = self.marker.points[:3]
+        return origin, (right - origin) / FRAME, (up - origin) / FRAME
+
+    def cell_centers(self, rows, cols):
+        origin, along, up = self.frame()
+        rows, cols = np.asarray(rows), np.asarray(cols)
+        return origin + (cols * self.cell[0])[..., None] * along - (rows * self.cell[1])[..., None] * up
+
+    def cell_center(self, row, col):
+        return self.cell_centers(row, col)
+
+    def redraw(self):
+        """Rebuilds every row's paths from the arrays."""
+        _, along, up = self.frame()
+        symbols, symbol_ids = np.unique(self.symbols.ravel(), return_inverse=True)
+        rows, cols = np.indices(self.symbols.shape).reshape(2, -1)
+        rgbas = self.rgbas.reshape(-1, 4)
+        squash = self.squash.ravel()
+        _, colour_ids = np.unique(np.rint(rgbas * 255).astype(np.int64) @ [1 << 24, 1 << 16, 1 << 8, 1], return_inverse=True)
+        _, squash_ids = np.unique(squash, return_inverse=True)
+        keys = ((rows * len(symbols) + symbol_ids) * (colour_ids.max() + 1) + colour_ids) * (squash_ids.max() + 1) + squash_ids
+        order = np.argsort(keys, kind="stable")
+        _, firsts = np.unique(keys[order], return_index=True)
+        centres = self.cell_centers(rows, cols)
+
+        paths = [[] for _ in self.rows]
+        for cells in np.split(order, firsts[1:]):
+            first = cells[0]
+            outline = glyph_outline(symbols[symbol_ids[first]], self.font_size, self.tex)
+            if not len(outline):
+                continue
+            offsets = outline[:, :1] * along + squash[first] * outline[:, 1:2] * up
+            path = VMobject(fill_color=rgb_to_color(rgbas[first, :3]), fill_opacity=rgbas[first, 3], stroke_width=0)
+            path.set_points((centres[cells, None, :] + offsets).reshape(-1, 3))
+            paths[rows[first]].append(path)
+        for row, row_paths in zip(self.rows, paths):
+            # The row VGroups stay the same objects, so a scene holding one sees the change
+            row.submobjects = row_paths
+        return self
+
+    def set_symbol(self, cells, symbols):
+        """symbols is one symbol for every cell or one per cell."""
+        self.symbols[_cells(cells)] = np.array(symbols, dtype=str).astype(object) if np.ndim(symbols) else str(symbols)
+        return self.redraw()
+
+    def set_cell_color(self, cells, color, opacity=1.0):
+        self.rgbas[_cells(cells)] = color_to_rgba(color, opacity)
+        return self.redraw()
+
+    def highlight(self, cells, color=YELLOW, side=0.3, fill_opacity=0.2, stroke_width=3):
+        """Squares of side around cells, as one path; it is not part of the grid."""
+        _, along, up = self.frame()
+        corners = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1], [-1, -1]]) * side / 2
+        squares = self.cell_centers(*_cells(cells))[:, None, :] + corners[:, :1] * along + corners[:, 1:] * up
+        path = VMobject()
+        path.set_points(segment_points(squares[:, :-1].reshape(-1, 3), squares[:, 1:].reshape(-1, 3)))
+        return path.set_stroke(color, width=stroke_width).set_fill(color, opacity=fill_opacity)
+
+
+class FlipCells(Animation):
+    """Turns cells over like cards; the far side shows symbols (the complement of a binary digit by default), in color if given."""
+
+    def __init__(self, grid, cells, symbols=None, color=None, **kwargs):
+        self.cells = _cells(cells)
+        current = grid.symbols[self.cells]
+        if symbols is None:
+            symbols = [COMPLEMENT.get(symbol, symbol) for symbol in current]
+        self.far_symbols = np.broadcast_to(np.array(symbols, dtype=str).astype(object), current.shape)
+        self.far_rgbas = None if color is None else color_to_rgba(color)
+        super().__init__(grid, **kwargs)
+
+    def begin(self):
+        self.near_symbols = self.mobject.symbols[self.cells].copy()
+        self.near_rgbas = self.mobject.rgbas[self.cells].copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)
+        grid = self.mobject
+        turned = alpha >= 0.5
+        grid.symbols[self.cells] = self.far_symbols if turned else self.near_symbols
+        grid.rgbas[self.cells] = self.far_rgbas if turned and self.far_rgbas is not None else self.near_rgbas
+        # Edge-on half way through
+        grid.squash[self.cells] = abs(1 - 2 * alpha)
+        grid.redraw()
+
+
+class RecolorCells(Animation):
+    """Fades cells from their colours to color."""
+
+    def __init__(self, grid, cells, color, opacity=1.0, **kwargs):
+        self.cells = _cells(cells)
+        self.target = color_to_rgba(color, opacity)
+        super().__init__(grid, **kwargs)
+
+    def begin(self):
+        self.start = self.mobject.rgbas[self.cells].copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)
+        self.mobject.rgbas[self.cells] = (1 - alpha) * self.start + alpha * self.target
+        self.mobject.redraw()
@@ -0,0 +1,101 @@
+"""Mini directed graphs for the model-theory galleries (7modeltheory, 8CompleteTheories, 9DLOWE, GraphAxioms).
+
+Each graph is a plain description: node positions and an edge list, where an
+edge is (tail, head) or (tail, head, Arrow keyword arguments), and (n, n) is
+a loop. A graph is built once per render into a prototype, and every request
+for it gets a copy, which is much cheaper than laying out its dots, arrows
+and tips again.
+
+    from manimations.graphs import get_mini_graph
+    gallery = VGroup(*(get_mini_graph(name) for name in ["line", "tree", "cycle"]))
+"""
+
+from functools import lru_cache
+
+from manim import DL, DOWN, DR, LEFT, ORIGIN, PI, RIGHT, UL, UP, UR, Arc, Arrow, Dot, VGroup
+
+MINI_GRAPH_SCALE = 0.55
+
+EDGE_BUFF = 0.05
+
+MINI_GRAPHS = {
+    "line": (
+        [LEFT * 0.5, ORIGIN, RIGHT * 0.5],
+        [(0, 1), (1, 2), (0, 2, {"path_arc": -0.6})],
+    ),
+    "tree": (
+        [UP * 0.3, LEFT * 0.4 + DOWN * 0.3, RIGHT * 0.4 + DOWN * 0.3],
+        [(0, 1), (0, 2)],
+    ),
+    "bool_alg": (
+        [DOWN * 0.5, LEFT * 0.5, ORIGIN, RIGHT * 0.5, UP * 0.5],
+        [(0, 1, {"buff": 0}), (0, 2, {"buff": 0}), (0, 3, {"buff": 0}),
+         (1, 4, {"buff": 0}), (2, 4, {"buff": 0}), (3, 4, {"buff": 0}),
+         (0, 4, {"path_arc": 0.8, "stroke_opacity": 0.5})],
+    ),
+    "disconnected": (
+        [LEFT * 0.4, RIGHT * 0.4, UP * 0.4, DOWN * 0.4],
+        [(2, 3)],
+    ),
+    "lattice": (
+        [UP * 0.4, LEFT * 0.4, RIGHT * 0.4, DOWN * 0.4],
+        [(0, 1), (0, 2), (1, 3), (2, 3), (0, 3, {"path_arc": 0.3})],
+    ),
+    "pentagon_dag": (
+        [UP * 0.4, LEFT * 0.4 + UP * 0.1, RIGHT * 0.4 + UP * 0.1, LEFT * 0.2 + DOWN * 0.4, RIGHT * 0.2 + DOWN * 0.4],
+        [(0, 1), (0, 2), (1, 3), (2, 4), (0, 3), (0, 4)],
+    ),
+    "reflexive": (
+        [ORIGIN],
+        [(0, 0)],
+    ),
+    "symmetric": (
+        [LEFT * 0.4, RIGHT * 0.4],
+        [(0, 1, {"path_arc": -0.3}), (1, 0, {"path_arc": -0.3})],
+    ),
+    "cycle": (
+        [UP * 0.4, LEFT * 0.4 + DOWN * 0.3, RIGHT * 0.4 + DOWN * 0.3],
+        [(0, 1), (1, 2), (2, 0)],
+    ),
+    "dense_dag": (
+        [LEFT * 0.5 + UP * 0.5, RIGHT * 0.5 + UP * 0.5, LEFT * 0.5 + DOWN * 0.5, RIGHT * 0.5 + DOWN * 0.5],
+        [(0, 2), (1, 3), (0, 3), (1, 2)],
+    ),
+    "square_cycle": (
+        [UL * 0.3, UR * 0.3, DR * 0.3, DL * 0.3],
+        [(0, 1), (1, 2), (2, 3), (3, 0)],
+    ),
+    "non_transitive_line": (
+        [LEFT * 0.4, ORIGIN, RIGHT * 0.4],
+        [(0, 1), (1, 2)],
+    ),
+}
+
+
+def _loop(node):
+    loop = Arc(radius=0.2, start_angle=0, angle=3 * PI / 2).next_to(node, UP, buff=0).shift(DOWN * 0.1)
+    loop.add_tip(tip_length=0.1)
+    return loop
+
+
+def graph_from_edges(positions, edges, scale=MINI_GRAPH_SCALE):
+    """VGroup of a Dot per position followed by an arrow per edge, in the order given."""
+    nodes = [Dot(point) for point in positions]
+    arrows = []
+    for tail, head, *options in edges:
+        if tail == head:
+            arrows.append(_loop(nodes[tail]))
+        else:
+            kwargs = {"buff": EDGE_BUFF, **(options[0] if options else {})}
+            arrows.append(Arrow(nodes[tail], nodes[head], **kwargs))
+    return VGroup(*nodes, *arrows).scale(scale)
+
+
+@lru_cache(maxsize=None)
+def _prototype(g_type):
+    return graph_from_edges(*MINI_GRAPHS[g_type])
+
+
+def get_mini_graph(g_type):
+    """A fresh copy of one of MINI_GRAPHS, free to move and recolor."""
+    return _prototype(g_type).copy()
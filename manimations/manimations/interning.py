@@ -0,0 +1,57 @@
+"""Interned labels: each distinct small MathTex or Text is built once per process and copied after that.
+
+Building a MathTex runs the TeX template, looks the SVG up in the store,
+parses it and builds its paths and colours every time, even for the
+hundredth "2" of a factor tree or "0" of a truth table. Text shapes with
+Pango and parses its SVG each time too. Here the first request for a label
+builds a prototype, keyed by its class, strings and keyword arguments (font
+size, colour, TeX template, ...), and every request gets a copy of it, which
+is just a copy of its points.
+
+    from manimations.interning import tex, text
+    leaf = tex("2", font_size=24).next_to(edge.get_end(), DOWN)
+    table = MathTable(rows, element_to_mobject=tex)
+
+Arguments that cannot be hashed (a colour given as an array, say) are
+built every time, as they would be without interning.
+"""
+
+from manim import MathTex, Text, config
+
+_PROTOTYPES = {}
+
+
+def _frozen(value):
+    """A hashable stand-in for a keyword argument's value; TypeError if there is none."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _frozen(v)) for key, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(v) for v in value)
+    if hasattr(value, "body") and hasattr(value, "tex_compiler"):
+        # A TexTemplate: equal templates typeset the same, whichever object they are
+        return ("template", value.tex_compiler, value.output_format, value.body)
+    hash(value)
+    return value
+
+
+def interned(cls, *args, **kwargs):
+    """cls(*args, **kwargs), built the first time and copied after that."""
+    if issubclass(cls, MathTex):
+        kwargs.setdefault("tex_template", config["tex_template"])
+    try:
+        key = (cls, _frozen(args), _frozen(kwargs))
+    except TypeError:
+        # An argument with no stable value to key on (an array, say): build it every time
+        return cls(*args, **kwargs)
+    prototype = _PROTOTYPES.get(key)
+    if prototype is None:
+        prototype = _PROTOTYPES[key] = cls(*args, **kwargs)
+    return prototype.copy()
+
+
+def tex(*tex_strings, **kwargs):
+    return interned(MathTex, *tex_strings, **kwargs)
+
+
+def text(string, **kwargs):
+    return interned(Text, string, **kwargs)
@@ -0,0 +1,85 @@
+"""Level of detail for the Cairo camera: nothing is drawn in more detail than its pixels can show.
+
+Before the camera draws a VMobject, its size on screen is taken from its
+projected points and the render's pixels per unit, so the quality, a moving
+camera's zoom and the 3D camera's projection are all accounted for. Then:
+
+- anything under SKIP_PIXELS across, stroke included, is not drawn;
+- a stroke thinner than STROKE_PIXELS is left out;
+- a filled, unstroked path under INK_PIXELS across (a glyph of a tiny label,
+  a far-off dot) is drawn as a square of the same colour and ink area
+  instead of its Bezier outline.
+
+At those sizes antialiasing already reduces each of them to a faint smudge
+of that much ink, so frames look the same, but the glyphs of a small label
+cost one rectangle each instead of Pango's dozens of curves.
+"""
+
+# Set by the parent on workers that should draw this way
+LOD_ENV = "MANIMATIONS_LOD"
+
+SKIP_PIXELS = 0.25
+
+STROKE_PIXELS = 0.3
+
+INK_PIXELS = 3
+
+
+def stroke_pixels(camera, vmobject, scale):
+    """Width in pixels of the widest visible stroke, background or not."""
+    widths = [
+        vmobject.get_stroke_width(background) * camera.cairo_line_width_multiple * scale
+        for background in (False, True)
+        if camera.get_stroke_rgbas(vmobject, background=background)[:, 3].max() > 0
+    ]
+    return max(widths, default=0)
+
+
+def ink_area(points):
+    """Area enclosed by the anchors of the cubic curves in points, by the shoelace formula."""
+    import numpy as np
+
+    start, end = points[0::4, :2], points[3::4, :2]
+    return abs(np.sum(start[:, 0] * end[:, 1] - end[:, 0] * start[:, 1])) / 2
+
+
+def draw_ink(camera, ctx, vmobject, points, fill_rgbas):
+    side = ink_area(points) ** 0.5
+    if side == 0:
+        return
+    x, y = (points[:, :2].min(axis=0) + points[:, :2].max(axis=0)) / 2
+    ctx.new_path()
+    ctx.rectangle(x - side / 2, y - side / 2, side, side)
+    camera.set_cairo_context_color(ctx, fill_rgbas, vmobject)
+    ctx.fill()
+
+
+def install():
+    """Measure every VMobject the Cairo camera draws, and draw it no finer than it shows."""
+    import numpy as np
+    from manim.camera.camera import Camera
+
+    display_vectorized = Camera.display_vectorized
+
+    def display_with_lod(self, vmobject, ctx):
+        points = self.transform_points_pre_display(vmobject, vmobject.points)
+        if len(points) == 0:
+            return display_vectorized(self, vmobject, ctx)
+        scale = self.pixel_width / self.frame_width
+        extent = np.ptp(points[:, :2], axis=0).max() * scale
+        stroke = stroke_pixels(self, vmobject, scale)
+        if extent + stroke < SKIP_PIXELS:
+            return self
+        if stroke >= STROKE_PIXELS:
+            return display_vectorized(self, vmobject, ctx)
+        fill_rgbas = self.get_fill_rgbas(vmobject)
+        if fill_rgbas[:, 3].max() == 0:
+            return self
+        if extent < INK_PIXELS:
+            draw_ink(self, ctx, vmobject, points, fill_rgbas)
+        else:
+            self.set_cairo_context_path(ctx, vmobject)
+            self.apply_fill(ctx, vmobject)
+        return self
+
+    Camera.display_vectorized = display_with_lod
@@ -0,0 +1,199 @@
+import ast
+import hashlib
+import json
+import os
+import threading
+import warnings
+from importlib import metadata
+from pathlib import Path
+
+from manimations import voicestore
+from manimations.discovery import scenes_in_file
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+VOICEOVER_CACHE = Path("media") / "voiceovers" / "cache.json"
+
+
+def _sha(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _parse(path):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", SyntaxWarning)
+        return ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+
+
+def _normalize(text):
+    # manim-voiceover collapses whitespace before looking text up
+    return " ".join(text.split())
+
+
+# --- INPUTS OF A SCENE ---
+
+def local_imports(path):
+    """Files a script pulls in besides manim: sibling modules and manimations helpers, recursively."""
+    seen = set()
+    pending = [Path(path).resolve()]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        for node in ast.walk(_parse(current)):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            for name in names:
+                parts = name.split(".")
+                if parts[0] == "manimations":
+                    base = PACKAGE_DIR.joinpath(*parts[1:])
+                else:
+                    base = current.parent.joinpath(*parts)
+                for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+                    if candidate.is_file():
+                        pending.append(candidate.resolve())
+    seen.discard(Path(path).resolve())
+    return sorted(seen)
+
+
+def _base_names(node):
+    return [base.id if isinstance(base, ast.Name) else base.attr
+            for base in node.bases if isinstance(base, (ast.Name, ast.Attribute))]
+
+
+def scene_source(job):
+    """The script minus the other scenes defined in it, so editing one part leaves its siblings current.
+
+    Scenes the job inherits from in the same script stay in: editing them changes it.
+    """
+    lines = job.path.read_text(encoding="utf-8").splitlines(keepends=True)
+    body = _parse(job.path).body
+    classes = {node.name: node for node in body if isinstance(node, ast.ClassDef)}
+    ancestors, pending = set(), [job.name]
+    while pending:
+        node = classes.get(pending.pop())
+        for base in _base_names(node) if node else []:
+            if base not in ancestors:
+                ancestors.add(base)
+                pending.append(base)
+    siblings = {j.name for j in scenes_in_file(job.path, job.root)} - {job.name} - ancestors
+    for node in reversed(body):
+        if isinstance(node, ast.ClassDef) and node.name in siblings:
+            start = min([node.lineno] + [d.lineno for d in node.decorator_list]) - 1
+            del lines[start:node.end_lineno]
+    return "".join(lines)
+
+
+def string_literals(source):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", SyntaxWarning)
+        tree = ast.parse(source)
+    return {_normalize(n.value) for n in ast.walk(tree) if isinstance(n, ast.Constant) and isinstance(n.value, str)}
+
+
+def voiceover_entries(job, source):
+    """Narration entries whose text appears in the scene's source, from the voice store or else cache.json."""
+    texts = string_literals(source)
+    found = {}
+    cache_file = job.workdir / VOICEOVER_CACHE
+    try:
+        entries = json.loads(cache_file.read_text()) if cache_file.exists() else []
+    except json.JSONDecodeError:
+        entries = []
+    for entry in entries:
+        text = _normalize(entry.get("input_text", ""))
+        if text in texts:
+            # cache.json gains a duplicate on every lookup; the last one wins
+            found[text] = [entry]
+    store = voicestore.default_store(job.root)
+    if store.exists():
+        for text in texts:
+            if stored := voicestore.entries_for_text(store, text):
+                found[text] = stored
+    return [entry for t in sorted(found) for entry in found[t]]
+
+
+def referenced_files(job, source):
+    """Images and other assets the scene names by a literal path next to its script."""
+    files = []
+    for literal in string_literals(source):
+        if not literal or len(literal) > 255 or "\n" in literal:
+            continue
+        candidate = job.workdir / literal
+        try:
+            if candidate.is_file() and candidate.suffix != ".py":
+                files.append(candidate)
+        except OSError:
+            continue
+    return sorted(files)
+
+
+def _manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def scene_digest(job, quality="l", extra_args=()):
+    """Hash of everything a render depends on; equal digests mean an identical video."""
+    h = hashlib.sha256()
+    source = scene_source(job)
+
+    def feed(label, data):
+        h.update(label.encode() + b"\0" + data + b"\0")
+
+    feed("scene", f"{job.key}@{quality}".encode())
+    feed("args", json.dumps(list(extra_args)).encode())
+    feed("manim", _manim_version().encode())
+    feed("source", source.encode())
+    for helper in local_imports(job.path):
+        feed(f"helper:{helper.name}", helper.read_bytes())
+    for asset in referenced_files(job, source):
+        feed(f"asset:{asset.name}", asset.read_bytes())
+    for entry in voiceover_entries(job, source):
+        feed("voiceover", json.dumps(entry.get("input_data", entry), sort_keys=True).encode())
+        blob = entry.get("audio", {}).get(entry.get("final_audio"))
+        if blob:
+            # Stored clips are named by the same hash of their contents
+            feed("audio", Path(blob).stem.encode())
+        else:
+            audio = job.workdir / "media" / "voiceovers" / entry.get("final_audio", "")
+            feed("audio", _sha(audio.read_bytes()).encode() if audio.is_file() else b"missing")
+    return h.hexdigest()
+
+
+# --- MANIFEST ---
+
+class BuildManifest:
+    """Digest of the inputs of the last successful render of each scene, per quality."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.entries = {}
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text())
+            except json.JSONDecodeError:
+                self.entries = {}
+
+    def is_current(self, job, digest, output, quality="l"):
+        entry = self.entries.get(f"{job.key}@{quality}")
+        return entry is not None and entry["digest"] == digest and Path(output).is_file()
+
+    def record(self, job, digest, output, quality="l"):
+        with self.lock:
+            self.entries[f"{job.key}@{quality}"] = {"digest": digest, "output": str(output)}
+            self.save()
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.entries, indent=2, sort_keys=True))
+        os.replace(tmp, self.path)
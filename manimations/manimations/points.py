@@ -0,0 +1,229 @@
+"""Point clouds: many dots kept as arrays of positions, colours, opacities and radii.
+
+A PointCloud draws its dots as a few filled paths, one per colour and
+opacity step, with a disc subpath per dot, so ten thousand "algebraic points"
+cost a handful of Cairo fills instead of ten thousand Dots. Its own points
+are the dot centres followed by a small frame (a centre and two short axes),
+so moving, scaling or rotating the cloud carries both the dots and the plane
+their discs lie in. The animations below change the arrays for every dot at
+once and redraw:
+
+    Twinkle                        each dot flickers at its own rate, back to full by the end
+    Drift                          every dot glides by its own offset in the cloud's plane
+    FadeInPoints / FadeOutPoints   dots appear / vanish one by one in random order
+
+    from manimations.points import PointCloud, Twinkle
+    stars = PointCloud(np.random.uniform(-3, 3, (10000, 2)), color=GOLD_A, radius=0.02)
+    self.play(Twinkle(stars, run_time=4))
+"""
+
+from abc import ABCMeta, abstractmethod
+
+import numpy as np
+from manim import RIGHT, UP, WHITE, Animation, VMobject, color_to_rgb, interpolate, rgb_to_color
+
+# Opacity steps dots are grouped by; each (colour, step) pair is one path
+OPACITY_LEVELS = 32
+
+# Length of the frame's axes: short, so they never stick out of the cloud's bounding box
+FRAME = 1e-3
+
+
+def _unit_circle():
+    """(16, 2) Bezier points of the unit circle as four quarter arcs, anticlockwise from (1, 0)."""
+    start = np.arange(4) * np.pi / 2
+    end = start + np.pi / 2
+    handle = 4 / 3 * np.tan(np.pi / 8)
+    p0, p3 = np.column_stack([np.cos(start), np.sin(start)]), np.column_stack([np.cos(end), np.sin(end)])
+    t0, t3 = np.column_stack([-np.sin(start), np.cos(start)]), np.column_stack([-np.sin(end), np.cos(end)])
+    return np.stack([p0, p0 + handle * t0, p3 - handle * t3, p3], axis=1).reshape(-1, 2)
+
+
+UNIT_CIRCLE = _unit_circle()
+
+
+def disc_points(centres, radii, along, up):
+    """Bezier points of a disc per centre, in the plane spanned by along and up."""
+    offsets = UNIT_CIRCLE[:, :1] * along + UNIT_CIRCLE[:, 1:] * up
+    return (centres[:, None, :] + radii[:, None, None] * offsets).reshape(-1, 3)
+
+
+def _as_rgbs(color, count):
+    """One colour, a list of colours or an (n, 3) array, as an (n, 3) RGB array."""
+    if isinstance(color, np.ndarray) and color.ndim == 2:
+        return color.astype(float)
+    if isinstance(color, (list, tuple)):
+        return np.array([color_to_rgb(c) for c in color])
+    return np.tile(color_to_rgb(color), (count, 1))
+
+
+class PointCloud(VMobject):
+    """Dots at positions ((n, 2) or (n, 3)); color, radius and opacity are one value or one per dot.
+
+    A VMobject, so it goes in a VGroup; its own points are never stroked or filled.
+    """
+
+    def __init__(self, positions, color=WHITE, radius=0.05, opacity=1.0, **kwargs):
+        kwargs.update(stroke_width=0, fill_opacity=0)
+        super().__init__(**kwargs)
+        positions = np.asarray(positions, dtype=float)
+        if positions.shape[1] == 2:
+            positions = np.column_stack([positions, np.zeros(len(positions))])
+        centre = positions.mean(axis=0) if len(positions) else np.zeros(3)
+        self.points = np.vstack([positions, centre, centre + FRAME * RIGHT, centre + FRAME * UP])
+        self.rgbs = _as_rgbs(color, len(positions))
+        self.radii = np.broadcast_to(radius, len(positions)).astype(float)
+        self.opacities = np.broadcast_to(opacity, len(positions)).astype(float)
+        self.redraw()
+
+    @property
+    def positions(self):
+        return self.points[:-3]
+
+    @positions.setter
+    def positions(self, positions):
+        self.points[:-3] = positions
+
+    def frame(self):
+        """(centre, unit axis, unit axis) of the plane the discs are drawn in, where the cloud now stands."""
+        centre, right, up = self.points[-3:]
+        return centre, (right - centre) / FRAME, (up - centre) / FRAME
+
+    def redraw(self):
+        """Rebuilds the paths from the arrays."""
+        _, along, up = self.frame()
+        levels = np.rint(np.clip(self.opacities, 0, 1) * OPACITY_LEVELS).astype(int)
+        keys = np.rint(self.rgbs * 255).astype(int) @ [1 << 16, 1 << 8, 1] * (OPACITY_LEVELS + 1) + levels
+        shown = np.flatnonzero(levels)
+        shown = shown[np.argsort(keys[shown], kind="stable")]
+        discs = disc_points(self.positions[shown], self.radii[shown], along, up).reshape(-1, len(UNIT_CIRCLE), 3)
+        _, firsts = np.unique(keys[shown], return_index=True)
+
+        paths = []
+        for group in np.split(np.arange(len(shown)), firsts[1:]) if len(shown) else []:
+            first = shown[group[0]]
+            opacity = levels[first] / OPACITY_LEVELS
+            path = VMobject(fill_color=rgb_to_color(self.rgbs[first]), fill_opacity=opacity, stroke_width=0)
+            path.set_points(discs[group].reshape(-1, 3))
+            paths.append(path)
+        self.submobjects = paths
+        return self
+
+    def _restyle(self, color=None, opacity=None):
+        if color is not None:
+            self.rgbs = _as_rgbs(color, len(self.rgbs))
+        if opacity is not None:
+            self.opacities = np.broadcast_to(opacity, len(self.opacities)).astype(float)
+        return self.redraw()
+
+    # The style setters restyle the dots; the cloud's own fill and stroke stay at 0.
+    # VMobject.__init__ calls them before there are any dots.
+
+    def set_fill(self, color=None, opacity=None, family=True):
+        if not hasattr(self, "rgbs"):
+            return super().set_fill(color, 0, family)
+        return self._restyle(color, opacity)
+
+    def set_stroke(self, color=None, width=None, opacity=None, background=False, family=True):
+        """A dot is all fill, so its colour and opacity take the stroke's; width has nothing to change."""
+        if not hasattr(self, "rgbs"):
+            return super().set_stroke(color, 0, opacity, background, family)
+        return self._restyle(color, opacity)
+
+    def set_color(self, color=WHITE, family=True):
+        return self._restyle(color)
+
+    def set_opacity(self, opacity, family=True):
+        return self._restyle(opacity=opacity)
+
+    def fade(self, darkness=0.5, family=True):
+        return self._restyle(opacity=self.opacities * (1 - darkness))
+
+    def interpolate_color(self, mobject1, mobject2, alpha):
+        # The paths are interpolated alongside; this keeps the arrays in step with them
+        super().interpolate_color(mobject1, mobject2, alpha)
+        for name in ("rgbs", "radii", "opacities"):
+            setattr(self, name, interpolate(getattr(mobject1, name), getattr(mobject2, name), alpha))
+
+
+class _PointsAnimation(Animation, metaclass=ABCMeta):
+    """Recomputes the cloud's arrays from where they started, each frame, and redraws."""
+
+    def begin(self):
+        cloud = self.mobject
+        self.start_positions = cloud.positions.copy()
+        self.start_opacities = cloud.opacities.copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        self.update_arrays(self.mobject, self.rate_func(alpha))
+        self.mobject.redraw()
+
+    @abstractmethod
+    def update_arrays(self, cloud, alpha):
+        """Sets the cloud's arrays for alpha, after the rate function."""
+
+
+class Twinkle(_PointsAnimation):
+    """Every dot dims by up to amplitude and recovers, 1 to cycles times, at a rate of its own."""
+
+    def __init__(self, cloud, amplitude=0.7, cycles=3, seed=0, **kwargs):
+        self.amplitude = amplitude
+        self.rates = np.random.default_rng(seed).integers(1, cycles + 1, len(cloud.opacities))
+        super().__init__(cloud, **kwargs)
+
+    def update_arrays(self, cloud, alpha):
+        cloud.opacities = self.start_opacities * (1 - self.amplitude * np.sin(np.pi * self.rates * alpha) ** 2)
+
+
+class Drift(_PointsAnimation):
+    """Moves every dot by its own offset in the cloud's plane, (n, 2) in the cloud's units; random if not given."""
+
+    def __init__(self, cloud, offsets=None, distance=0.2, seed=0, **kwargs):
+        if offsets is None:
+            rng = np.random.default_rng(seed)
+            angles = rng.uniform(0, 2 * np.pi, len(cloud.opacities))
+            offsets = distance * rng.uniform(0.5, 1, len(angles))[:, None] * np.column_stack([np.cos(angles), np.sin(angles)])
+        self.offsets = np.asarray(offsets, dtype=float)
+        super().__init__(cloud, **kwargs)
+
+    def begin(self):
+        _, along, up = self.mobject.frame()
+        self.shifts = self.offsets[:, :1] * along + self.offsets[:, 1:2] * up
+        super().begin()
+
+    def update_arrays(self, cloud, alpha):
+        cloud.positions = self.start_positions + alpha * self.shifts
+
+
+class FadeInPoints(_PointsAnimation):
+    """Dots fade in one by one in random order; each takes 1 - lag of the run time."""
+
+    def __init__(self, cloud, lag=0.8, seed=0, **kwargs):
+        self.lag = lag
+        self.starts = lag * np.random.default_rng(seed).random(len(cloud.opacities))
+        kwargs.setdefault("introducer", True)
+        super().__init__(cloud, **kwargs)
+
+    def shown(self, alpha):
+        return np.clip((alpha - self.starts) / (1 - self.lag), 0, 1)
+
+    def update_arrays(self, cloud, alpha):
+        cloud.opacities = self.start_opacities * self.shown(alpha)
+
+
+class FadeOutPoints(FadeInPoints):
+    """Dots fade out one by one in random order, then the cloud is removed, at its full opacity again."""
+
+    def __init__(self, cloud, lag=0.8, seed=0, **kwargs):
+        kwargs.setdefault("introducer", False)
+        kwargs.setdefault("remover", True)
+        super().__init__(cloud, lag, seed, **kwargs)
+
+    def shown(self, alpha):
+        return 1 - super().shown(alpha)
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        self.mobject.opacities = self.start_opacities
+        self.mobject.redraw()
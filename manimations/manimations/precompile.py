@@ -0,0 +1,239 @@
+"""Ahead-of-time LaTeX: compile every literal Tex / MathTex in the scripts before rendering starts.
+
+Scene construction otherwise waits on one latex + dvisvgm pair per formula,
+one after the other. The formulas are read from the scripts' syntax trees,
+so nothing is imported; anything built at run time (f-strings, variables) is
+simply left for the render to compile as before.
+"""
+
+import ast
+import contextlib
+import re
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+
+from manimations import texbatch, texcache
+
+# Default tex_environment and arg_separator of each class, as in manim's tex_mobject.py.
+# A separator of None means the class never splits its input.
+TEX_CLASSES = {
+    "MathTex": ("align*", " "),
+    "Tex": ("center", ""),
+    "SingleStringMathTex": ("align*", None),
+    # manimations.interning.tex, an interned MathTex
+    "tex": ("align*", " "),
+}
+
+# Tables whose cells are built with MathTex(cell)
+TABLE_CLASSES = {"MathTable"}
+
+# element_to_mobject values that still build a cell with MathTex(cell)
+MATHTEX_CELLS = {"MathTex", "tex"}
+
+# Stands in for an argument whose value is only known at run time
+DYNAMIC = object()
+
+
+@dataclass(frozen=True)
+class TexRequest:
+    """One SingleStringMathTex manim will compile: expression as written, before special-string fixes."""
+    expression: str
+    environment: str | None
+    template: str | None = None  # attribute of TexTemplateLibrary; None is the folder's default
+
+
+# --- EXTRACTION ---
+
+def _call_name(call):
+    if isinstance(call.func, ast.Name):
+        return call.func.id
+    if isinstance(call.func, ast.Attribute):
+        return call.func.attr
+    return None
+
+
+def _literal(node):
+    """The value of a str / number literal, else DYNAMIC."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (str, int, float)) and not isinstance(node.value, bool):
+        return str(node.value)
+    return DYNAMIC
+
+
+def _keyword(call, name, default):
+    for kw in call.keywords:
+        if kw.arg == name:
+            if isinstance(kw.value, ast.Constant) and (kw.value.value is None or isinstance(kw.value.value, str)):
+                return kw.value.value
+            return DYNAMIC
+    if any(kw.arg is None for kw in call.keywords):  # **kwargs could carry it
+        return DYNAMIC
+    return default
+
+
+def _isolated_substrings(call):
+    """Literal substrings_to_isolate plus tex_to_color_map keys; DYNAMIC if either is computed."""
+    found = []
+    for kw in call.keywords:
+        if kw.arg == "substrings_to_isolate":
+            if not isinstance(kw.value, (ast.List, ast.Tuple, ast.Set)):
+                return DYNAMIC
+            found.extend(_literal(e) for e in kw.value.elts)
+        elif kw.arg == "tex_to_color_map":
+            if not isinstance(kw.value, ast.Dict):
+                return DYNAMIC
+            found.extend(_literal(k) if k is not None else DYNAMIC for k in kw.value.keys)
+    return DYNAMIC if DYNAMIC in found else found
+
+
+def _template(call):
+    """None for the default template, the TexTemplateLibrary name, or DYNAMIC."""
+    for kw in call.keywords:
+        if kw.arg == "tex_template":
+            value = kw.value
+            if (
+                isinstance(value, ast.Attribute)
+                and isinstance(value.value, ast.Name)
+                and value.value.id == "TexTemplateLibrary"
+            ):
+                return value.attr
+            return DYNAMIC
+    return None
+
+
+def split_tex_strings(tex_strings, isolate=()):
+    """MathTex._break_up_tex_strings: split on {{ ... }} and around the isolated substrings."""
+    pieces = sum((re.split("{{(.*?)}}", s) for s in tex_strings), [])
+    pattern = "|".join(f"({re.escape(s)})" for s in isolate)
+    if pattern:
+        pieces = sum((re.split(pattern, s) for s in pieces), [])
+    return [p for p in pieces if p]
+
+
+def _requests_for_tex(call, cls):
+    default_env, default_sep = TEX_CLASSES[cls]
+    strings = [_literal(a) for a in call.args]
+    environment = _keyword(call, "tex_environment", default_env)
+    template = _template(call)
+    if not strings or DYNAMIC in strings or environment is DYNAMIC or template is DYNAMIC:
+        return []
+    if default_sep is None:
+        return [TexRequest(strings[0], environment, template)]
+
+    separator = _keyword(call, "arg_separator", default_sep)
+    isolate = _isolated_substrings(call)
+    if separator is DYNAMIC or separator is None or isolate is DYNAMIC:
+        return []
+    return _mathtex_requests(strings, environment, template, separator, isolate)
+
+
+def _mathtex_requests(strings, environment="align*", template=None, separator=" ", isolate=()):
+    pieces = split_tex_strings(strings, isolate)
+    # The whole string is compiled once, then every piece again on its own
+    return [TexRequest(e, environment, template) for e in [separator.join(pieces), *pieces]]
+
+
+def _requests_for_table(call):
+    if not call.args or any(kw.arg is None for kw in call.keywords):
+        return []
+    for kw in call.keywords:
+        if kw.arg == "element_to_mobject" and not (isinstance(kw.value, ast.Name) and kw.value.id in MATHTEX_CELLS):
+            return []
+    rows = call.args[0]
+    if not isinstance(rows, (ast.List, ast.Tuple)):
+        return []
+    requests = []
+    for row in rows.elts:
+        if not isinstance(row, (ast.List, ast.Tuple)):
+            continue
+        for cell in row.elts:
+            if (value := _literal(cell)) is not DYNAMIC:
+                requests.extend(_mathtex_requests([value]))
+    return requests
+
+
+def tex_in_file(path):
+    """Every TexRequest that can be read off a script's literal Tex / MathTex / MathTable calls."""
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", SyntaxWarning)
+            tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    except (SyntaxError, UnicodeDecodeError):
+        return []
+
+    requests = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        name = _call_name(node)
+        if name in TEX_CLASSES:
+            requests.extend(_requests_for_tex(node, name))
+        elif name in TABLE_CLASSES:
+            requests.extend(_requests_for_table(node))
+    return requests
+
+
+# --- COMPILATION ---
+
+_folder_templates = {}
+
+
+def folder_tex_template(workdir):
+    """config.tex_template as a render started from workdir sees it (a manim.cfg there may change it)."""
+    workdir = Path(workdir)
+    if workdir not in _folder_templates:
+        from manim import config
+        from manim._config.utils import ManimConfig, make_config_parser
+
+        if (workdir / "manim.cfg").exists():
+            with contextlib.chdir(workdir):
+                _folder_templates[workdir] = ManimConfig().digest_parser(make_config_parser()).tex_template
+        else:
+            _folder_templates[workdir] = config.tex_template
+    return _folder_templates[workdir]
+
+
+def texcodes(requests_by_folder):
+    """Complete .tex documents, keyed by hash, for {workdir: [TexRequest]}. Values are (texcode, template)."""
+    from manim import SingleStringMathTex, TexTemplateLibrary
+
+    # _get_modified_expression only reads its argument, so a bare instance will do
+    modifier = SingleStringMathTex.__new__(SingleStringMathTex)
+    documents = {}
+    for workdir, requests in requests_by_folder.items():
+        for request in set(requests):
+            if request.template is None:
+                template = folder_tex_template(workdir)
+            else:
+                template = getattr(TexTemplateLibrary, request.template, None)
+                if template is None:
+                    continue
+            expression = modifier._get_modified_expression(request.expression)
+            texcode = texcache.texcode_for(expression, request.environment, template)
+            documents.setdefault(texcache.tex_key(texcode), (texcode, template))
+    return documents
+
+
+def documents_for(jobs):
+    """{key: (texcode, template)} for the literal formulas of the jobs' scripts."""
+    by_folder = {}
+    for path in sorted({job.path for job in jobs}):
+        by_folder.setdefault(path.parent, []).extend(tex_in_file(path))
+    return texcodes(by_folder)
+
+
+def precompile(jobs, workers=None, store=None, say=print, batch_size=texbatch.DEFAULT_BATCH_SIZE):
+    """Compiles the literal formulas of the jobs' scripts into the shared store. Returns (compiled, cached, failed).
+
+    Formulas are typeset batch_size to a document (texbatch.py); 1 runs latex once per formula.
+    """
+    store = Path(store or texcache.default_store())
+    documents = documents_for(jobs)
+    missing = {k: v for k, v in documents.items() if not texcache.store_path(store, k).exists()}
+    cached = len(documents) - len(missing)
+    if not missing:
+        return 0, cached, 0
+
+    say(f"Precompiling {len(missing)} formulas ({cached} already in the store)")
+    failed = texbatch.compile_many(missing, workers, store, batch_size)
+    return len(missing) - failed, cached, failed
@@ -0,0 +1,197 @@
+"""Per-animation render profile: where each self.play / self.wait spends its time.
+
+For every animation the worker records the call site in the scene's file
+(with the chain of helper methods that led to it), the wall time, frames
+written, the size of the scene, and how the time splits between
+
+    setup        compiling and beginning the animations
+    interpolate  Animation.interpolate on every frame
+    updaters     mobject / scene updaters
+    draw         Cairo painting the frame and copying it out
+    encode       libx264 encoding, on the file writer's own thread
+
+Main-thread categories are timed exclusively (time in an updater called from
+interpolate counts as updaters only); whatever is left of the wall time is
+reported as other. Encoding overlaps with drawing, so it is listed apart.
+"""
+
+import json
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+# Set by the parent: where the worker writes the scene's profile JSON
+PROFILE_ENV = "MANIMATIONS_PROFILE"
+
+# Profiled renders must draw every animation, not reuse cached partial movies
+PROFILE_ARGS = ["--disable_caching"]
+
+CATEGORIES = ["setup", "interpolate", "updaters", "draw"]
+
+
+class _Clock:
+    """Charges main-thread time to whichever category is innermost."""
+
+    def __init__(self):
+        self.record = None
+        self.stack = []
+        self.mark = time.perf_counter()
+
+    def _charge(self):
+        now = time.perf_counter()
+        if self.record is not None and self.stack:
+            self.record[self.stack[-1]] += now - self.mark
+        self.mark = now
+
+    def timed(self, category, fn):
+        def wrapper(*args, **kwargs):
+            if threading.current_thread() is not threading.main_thread():
+                return fn(*args, **kwargs)
+            self._charge()
+            self.stack.append(category)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._charge()
+                self.stack.pop()
+        return wrapper
+
+
+def _scene_stack(source_file):
+    """'function:line' for each frame in the scene's own file, outermost first."""
+    stack = []
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_code.co_filename == source_file:
+            stack.append(f"{frame.f_code.co_name}:{frame.f_lineno}")
+        frame = frame.f_back
+    return stack[::-1]
+
+
+def install(path):
+    """Profile every animation of the scene and write the records to path as JSON when it ends."""
+    import inspect
+
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene import Scene
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    clock = _Clock()
+    records = []
+    encode_lock = threading.Lock()
+    play = CairoRenderer.play
+    add_frame = CairoRenderer.add_frame
+    open_stream = SceneFileWriter.open_partial_movie_stream
+    encode = SceneFileWriter.encode_and_write_frame
+    finish = SceneFileWriter.finish
+
+    def profiled_play(self, scene, *args, **kwargs):
+        source_file = inspect.getsourcefile(type(scene))
+        record = dict.fromkeys([*CATEGORIES, "encode"], 0.0)
+        record.update(scene=type(scene).__name__, file=source_file, index=self.num_plays,
+                      stack=_scene_stack(source_file), frames=0)
+        clock.record = record
+        start = time.perf_counter()
+        play(self, scene, *args, **kwargs)
+        record["wall"] = time.perf_counter() - start
+        clock.record = None
+
+        animations = scene.animations or []
+        record["kind"] = "wait" if all(type(a).__name__ == "Wait" for a in animations) else "play"
+        record["animations"] = [type(a).__name__ for a in animations]
+        record["family"] = len(scene.get_mobject_family_members())
+        moving = {id(m): m for mob in scene.moving_mobjects or [] for m in mob.get_family()}
+        record["moving_points"] = sum(len(getattr(m, "points", ())) for m in moving.values())
+        record["other"] = record["wall"] - sum(record[c] for c in CATEGORIES)
+        records.append(record)
+
+    def counting_add_frame(self, frame, num_frames=1):
+        if clock.record is not None and not self.skip_animations:
+            clock.record["frames"] += num_frames
+        return add_frame(self, frame, num_frames)
+
+    def open_profiled_stream(self, *args, **kwargs):
+        self.profile_record = clock.record
+        return open_stream(self, *args, **kwargs)
+
+    def timed_encode(self, frame, num_frames):
+        start = time.perf_counter()
+        encode(self, frame, num_frames)
+        record = getattr(self, "profile_record", None)
+        if record is not None:
+            with encode_lock:
+                record["encode"] += time.perf_counter() - start
+
+    def write_profile(self):
+        finish(self)
+        Path(path).write_text(json.dumps(records, indent=2))
+
+    CairoRenderer.play = profiled_play
+    CairoRenderer.add_frame = counting_add_frame
+    Scene.compile_animation_data = clock.timed("setup", Scene.compile_animation_data)
+    Scene.begin_animations = clock.timed("setup", Scene.begin_animations)
+    Scene.update_to_time = clock.timed("interpolate", Scene.update_to_time)
+    Scene.update_mobjects = clock.timed("updaters", Scene.update_mobjects)
+    Scene.update_meshes = clock.timed("updaters", Scene.update_meshes)
+    Scene.update_self = clock.timed("updaters", Scene.update_self)
+    CairoRenderer.update_frame = clock.timed("draw", CairoRenderer.update_frame)
+    CairoRenderer.get_frame = clock.timed("draw", CairoRenderer.get_frame)
+    CairoRenderer.save_static_frame_data = clock.timed("draw", CairoRenderer.save_static_frame_data)
+    SceneFileWriter.open_partial_movie_stream = open_profiled_stream
+    SceneFileWriter.encode_and_write_frame = timed_encode
+    SceneFileWriter.finish = write_profile
+
+
+# --- REPORTS ---
+
+def load_profiles(paths):
+    records = []
+    for path in paths:
+        records.extend(json.loads(Path(path).read_text()))
+    return records
+
+
+def by_call_site(records, root=None):
+    """Records summed per source line (a line inside a loop runs many animations)."""
+    sites = defaultdict(lambda: defaultdict(float))
+    for r in records:
+        file = Path(r["file"])
+        if root is not None and file.is_relative_to(root):
+            file = file.relative_to(root)
+        line = r["stack"][-1].rsplit(":", 1)[1] if r["stack"] else "?"
+        site = sites[(r["scene"], f"{file.as_posix()}:{line}")]
+        site["calls"] += 1
+        for key in ("wall", "frames", *CATEGORIES, "other", "encode"):
+            site[key] += r[key]
+        site["family"] = max(site["family"], r["family"])
+        site["moving_points"] = max(site["moving_points"], r["moving_points"])
+    return sorted(sites.items(), key=lambda item: item[1]["wall"], reverse=True)
+
+
+def report(records, root=None, top=30):
+    """Text table of the most expensive call sites."""
+    header = (f"{'wall s':>8} {'calls':>5} {'frames':>6} {'mobjs':>6} {'points':>8} "
+              + " ".join(f"{c[:6]:>6}" for c in [*CATEGORIES, "other", "encode"]) + "  site")
+    lines = [header]
+    total = sum(r["wall"] for r in records) or 1.0
+    for (scene, site), s in by_call_site(records, root)[:top]:
+        lines.append(
+            f"{s['wall']:8.2f} {int(s['calls']):5d} {int(s['frames']):6d} {int(s['family']):6d} "
+            f"{int(s['moving_points']):8d} "
+            + " ".join(f"{s[c]:6.2f}" for c in [*CATEGORIES, "other", "encode"])
+            + f"  {site} ({scene}, {100 * s['wall'] / total:.0f}%)"
+        )
+    return "\n".join(lines)
+
+
+def write_folded(records, path):
+    """Collapsed stacks ('Scene;construct:12;helper:40;draw 1234', microseconds) for flamegraph.pl / speedscope."""
+    folded = defaultdict(int)
+    for r in records:
+        prefix = ";".join([r["scene"], *r["stack"]])
+        for category in [*CATEGORIES, "other"]:
+            if r[category] > 0:
+                folded[f"{prefix};{category}"] += int(r[category] * 1e6)
+    Path(path).write_text("".join(f"{stack} {value}\n" for stack, value in sorted(folded.items())))
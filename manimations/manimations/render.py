@@ -0,0 +1,398 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+
+from manimations import audio, texcache, voicestore
+from manimations.discovery import REPO_ROOT
+from manimations.lod import LOD_ENV
+from manimations.manifest import BuildManifest, scene_digest
+from manimations.precompile import precompile as precompile_tex
+from manimations.profiler import PROFILE_ARGS, PROFILE_ENV
+from manimations.segments import SEED_ENV, SEGMENT_ENV, plan_segments
+from manimations.timeline import TIMELINE_ARGS, TIMELINE_ENV, write_csv
+
+# Where the tooling keeps its own state (render history, logs, caches)
+STATE_DIR_NAME = ".manimations"
+
+# Output folder manim uses for each -q flag
+QUALITY_DIRS = {"l": "480p15", "m": "720p30", "h": "1080p60", "p": "1440p60", "k": "2160p60"}
+
+# Set on workers whose scenes should narrate with speech.OfflineSpeechService.
+# (speech.py itself imports manim_voiceover, so the name lives here.)
+OFFLINE_SPEECH_ENV = "MANIMATIONS_OFFLINE_SPEECH"
+
+ANIMATION_LINE = re.compile(r"Animation (\d+)")
+
+
+@dataclass
+class RenderResult:
+    job: object
+    returncode: int
+    seconds: float
+    log_path: Path
+
+    @property
+    def ok(self):
+        return self.returncode == 0
+
+
+def state_dir(root=REPO_ROOT):
+    path = Path(root) / STATE_DIR_NAME
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def default_workers():
+    return os.process_cpu_count() or 1
+
+
+def output_path(job, quality="l"):
+    """The mp4 manim writes for a job when media_dir is left at its default."""
+    return job.workdir / "media" / "videos" / job.path.stem / QUALITY_DIRS[quality] / f"{job.name}.mp4"
+
+
+# --- RENDER HISTORY (used to schedule the longest jobs first) ---
+
+def _history_path(root):
+    return state_dir(root) / "render_times.json"
+
+
+def load_history(root=REPO_ROOT):
+    path = _history_path(root)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except json.JSONDecodeError:
+        return {}
+
+
+def save_history(history, root=REPO_ROOT):
+    path = _history_path(root)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(history, indent=2, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def schedule(jobs, quality="l", history=None):
+    """Longest-processing-time-first: known wall times from earlier runs, else the static weight.
+
+    Static weights are converted to seconds with the median seconds-per-weight
+    of the jobs that do have history, so both kinds of estimate sort together.
+    """
+    history = history or {}
+    seen = [(history[f"{j.key}@{quality}"], j.weight) for j in jobs if f"{j.key}@{quality}" in history]
+    ratios = sorted(t / w for t, w in seen if w > 0)
+    sec_per_weight = ratios[len(ratios) // 2] if ratios else 1.0
+
+    def estimate(job):
+        return history.get(f"{job.key}@{quality}", job.weight * sec_per_weight)
+
+    return sorted(jobs, key=estimate, reverse=True)
+
+
+# --- POOL ---
+
+def manim_command(job, quality="l", extra_args=()):
+    return [
+        sys.executable, "-m", "manimations.worker",
+        f"-q{quality}",
+        "--progress_bar", "none",
+        # Without the shared TeX store, other workers may be compiling in the
+        # same media/Tex folder and manim's cleanup would delete their .dvi files.
+        "--no_latex_cleanup",
+        *extra_args,
+        job.path.name, job.name,
+    ]
+
+
+class Progress:
+    """Serialises progress lines from the worker threads onto stdout."""
+
+    def __init__(self, total, verbose=False):
+        self.total = total
+        self.done = 0
+        self.verbose = verbose
+        self.lock = threading.Lock()
+
+    def say(self, message):
+        with self.lock:
+            print(message, flush=True)
+
+    def started(self, job):
+        self.say(f"[{self.done}/{self.total}] start  {job.key}")
+
+    def animation(self, job, index):
+        self.say(f"[{self.done}/{self.total}]        {job.key}: animation {index + 1}/~{job.n_plays}")
+
+    def skipped(self, job):
+        with self.lock:
+            self.done += 1
+            print(f"[{self.done}/{self.total}] skip  {job.key} (unchanged)", flush=True)
+
+    def finished(self, result):
+        with self.lock:
+            self.done += 1
+            status = "done " if result.ok else "FAIL "
+            print(f"[{self.done}/{self.total}] {status} {result.job.key} ({result.seconds:.1f}s)", flush=True)
+            if not result.ok:
+                print(f"        see {result.log_path}", flush=True)
+
+
+def _safe_name(job):
+    return re.sub(r"[^\w.-]+", "_", job.key)
+
+
+def _log_path(job, root):
+    logs = state_dir(root) / "logs"
+    logs.mkdir(exist_ok=True)
+    return logs / (_safe_name(job) + ".log")
+
+
+def _stream(job, command, env, log, progress):
+    """Runs one manim process, copying its output to log and per-animation lines to progress."""
+    proc = subprocess.Popen(
+        command,
+        cwd=job.workdir,
+        env=env,
+        stdin=subprocess.DEVNULL,  # RecorderService must not block waiting for a mic
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+    )
+    for line in proc.stdout:
+        log.write(line)
+        match = ANIMATION_LINE.search(line)
+        if match and "Partial movie file written" in line:
+            progress.animation(job, int(match.group(1)))
+        elif progress.verbose:
+            progress.say(f"        {job.name} | {line.rstrip()}")
+    return proc.wait()
+
+
+def render_job(job, progress, quality="l", extra_args=(), root=REPO_ROOT, env=None):
+    """Runs one scene in its own process, streaming manim's per-animation log lines."""
+    log_path = _log_path(job, root)
+    env = dict(env or os.environ, COLUMNS="400")  # keep rich from wrapping log lines
+
+    progress.started(job)
+    start = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        returncode = _stream(job, manim_command(job, quality, extra_args), env, log, progress)
+    result = RenderResult(job, returncode, time.perf_counter() - start, log_path)
+    progress.finished(result)
+    return result
+
+
+def render_segmented(job, progress, quality="l", extra_args=(), root=REPO_ROOT, env=None, segments=2, slots=None):
+    """Renders a voiceover scene as up to `segments` animation ranges in parallel (see segments.py).
+
+    slots (a semaphore) bounds how many manim processes run at once across every job sharing it.
+    """
+    log_path = _log_path(job, root)
+    # Every pass starts its scene from the same seed, so random scenes hash the same in each
+    env = dict(env or os.environ, COLUMNS="400", **{SEED_ENV: "0"})
+    slots = slots or nullcontext()
+    probe_path = timeline_path(job, root)
+    probe_path.unlink(missing_ok=True)
+
+    progress.started(job)
+    start = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        def run(args, run_env):
+            with slots:
+                return _stream(job, manim_command(job, quality, args), run_env, log, progress)
+
+        probe_env = dict(env, **{TIMELINE_ENV: str(probe_path)})
+        ranges = []
+        if run([*TIMELINE_ARGS, *extra_args], probe_env) == 0 and probe_path.exists():
+            ranges = plan_segments(json.loads(probe_path.read_text()), segments)
+
+        if len(ranges) > 1:
+            progress.say(f"        {job.key}: {len(ranges)} segments, animations "
+                         + ", ".join(f"{first}-{last}" for first, last in ranges))
+            segment_env = dict(env, **{SEGMENT_ENV: "1"})
+            threads = [
+                threading.Thread(target=run, args=(["-n", f"{first},{last}", *extra_args], segment_env))
+                for first, last in ranges
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # Every animation is cached by now unless a segment failed, in which
+        # case this renders the gap; either way manim assembles the movie.
+        returncode = run(extra_args, env)
+    result = RenderResult(job, returncode, time.perf_counter() - start, log_path)
+    progress.finished(result)
+    return result
+
+
+def timeline_path(job, root=REPO_ROOT):
+    timelines = state_dir(root) / "timelines"
+    timelines.mkdir(exist_ok=True)
+    return timelines / (_safe_name(job) + ".json")
+
+
+def profile_path(job, root=REPO_ROOT):
+    profiles = state_dir(root) / "profiles"
+    profiles.mkdir(exist_ok=True)
+    return profiles / (_safe_name(job) + ".json")
+
+
+def timeline_job(job, progress, quality="l", extra_args=(), root=REPO_ROOT, env=None):
+    """Runs construct without drawing anything; leaves <key>.json and <key>.csv in .manimations/timelines."""
+    log_path = _log_path(job, root)
+    path = timeline_path(job, root)
+    path.unlink(missing_ok=True)
+    env = dict(env or os.environ, COLUMNS="400", **{TIMELINE_ENV: str(path)})
+
+    progress.started(job)
+    start = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        returncode = _stream(job, manim_command(job, quality, [*TIMELINE_ARGS, *extra_args]), env, log, progress)
+    if returncode == 0 and not path.exists():
+        returncode = 1
+    if returncode == 0:
+        write_csv(json.loads(path.read_text()), path.with_suffix(".csv"))
+    result = RenderResult(job, returncode, time.perf_counter() - start, log_path)
+    progress.finished(result)
+    return result
+
+
+def timeline_all(jobs, quality="l", workers=None, extra_args=(), verbose=False, root=REPO_ROOT, tex_cache=True,
+                 offline_speech=False, voice_store=True):
+    """Timelines for every job in parallel. Nothing is written to the voiceover cache unless new narration is generated."""
+    env = worker_env(root, tex_cache, offline_speech, voice_store)
+    progress = Progress(len(jobs), verbose=verbose)
+    with ThreadPoolExecutor(max_workers=workers or default_workers()) as pool:
+        return list(pool.map(lambda job: timeline_job(job, progress, quality, extra_args, root, env), jobs))
+
+
+def worker_env(root=REPO_ROOT, tex_cache=True, offline_speech=False, voice_store=True, stream_audio=True, lod=True):
+    env = dict(os.environ)
+    # Hooks are opted into per job; don't let any leak in from the caller's shell
+    for name in [n for n in env if n.startswith("MANIMATIONS_")]:
+        del env[name]
+    if tex_cache:
+        env[texcache.TEX_CACHE_ENV] = str(texcache.default_store(root))
+    if voice_store:
+        env[voicestore.VOICE_STORE_ENV] = str(voicestore.default_store(root))
+    if stream_audio:
+        env[audio.STREAM_AUDIO_ENV] = "1"
+    if lod:
+        env[LOD_ENV] = "1"
+    if offline_speech:
+        env[OFFLINE_SPEECH_ENV] = "1"
+    return env
+
+
+def render_all(jobs, quality="l", workers=None, extra_args=(), verbose=False, root=REPO_ROOT, force=False,
+               tex_cache=True, precompile=True, split=1, profile=False, offline_speech=False,
+               voice_store=True, stream_audio=True, lod=True):
+    """Renders the jobs across a pool of worker processes, longest first.
+
+    Scenes whose inputs hash the same as at their last successful render
+    (see manifest.py) keep their existing mp4 unless force is set. With
+    tex_cache, workers share the repo-wide LaTeX store from texcache.py, and
+    with precompile the literal formulas of the scenes left to render are
+    compiled into it first (precompile.py). With split > 1, voiceover scenes
+    are each rendered as up to that many parallel segments (segments.py).
+    With profile, every scene is rendered whole and uncached and leaves a
+    per-animation profile in .manimations/profiles (profiler.py).
+    With offline_speech, narration that has no audio yet is rendered as
+    silence of the estimated length (speech.py). With voice_store, narration
+    is looked up in and recorded to the repo-wide store (voicestore.py). With
+    stream_audio, the narration is mixed straight into the movie (audio.py). With
+    lod, nothing is drawn in more detail than its size in pixels shows (lod.py).
+    """
+    env = worker_env(root, tex_cache, offline_speech, voice_store, stream_audio, lod)
+    if profile:
+        extra_args = [*PROFILE_ARGS, *extra_args]
+        force, split = True, 1
+    history = load_history(root)
+    manifest = BuildManifest(state_dir(root) / "manifest.json")
+    progress = Progress(len(jobs), verbose=verbose)
+    results = []
+
+    # A render with placeholder narration, simplified drawing or a streamed soundtrack must not pass for one without
+    flags = [flag for flag, on in (("offline-speech", offline_speech), ("lod", lod), ("stream-audio", stream_audio)) if on]
+    digest_args = [*extra_args, *flags]
+    pending = []
+    for job in schedule(jobs, quality, history):
+        digest = scene_digest(job, quality, digest_args)
+        if not force and manifest.is_current(job, digest, output_path(job, quality), quality):
+            progress.skipped(job)
+        else:
+            pending.append(job)
+
+    if pending and tex_cache and precompile:
+        compiled, cached, failed = precompile_tex(pending, workers, texcache.default_store(root), say=progress.say)
+        if failed:
+            progress.say(f"{failed} formulas failed to compile; their scenes will report the error")
+
+    # Without the voice store, manim-voiceover rewrites media/voiceovers/cache.json
+    # on every lookup, so voiceover scenes sharing a folder take turns; other
+    # jobs skip ahead. The store's writes are atomic and need no such care.
+    serialize = not voice_store
+    busy_folders = set()
+    cond = threading.Condition()
+
+    def next_job():
+        with cond:
+            while pending:
+                for i, job in enumerate(pending):
+                    if not (serialize and job.is_voiceover and job.workdir in busy_folders):
+                        if serialize and job.is_voiceover:
+                            busy_folders.add(job.workdir)
+                        return pending.pop(i)
+                cond.wait()
+            return None
+
+    workers = workers or default_workers()
+    # Segments are extra processes; every manim process takes a slot, so -j bounds them all
+    slots = threading.Semaphore(workers)
+
+    def worker():
+        while (job := next_job()) is not None:
+            if split > 1 and job.is_voiceover:
+                result = render_segmented(job, progress, quality, extra_args, root, env, split, slots)
+            elif profile:
+                # A failed render must not leave the last run's profile to be reported
+                path = profile_path(job, root)
+                path.unlink(missing_ok=True)
+                job_env = dict(env, **{PROFILE_ENV: str(path)})
+                with slots:
+                    result = render_job(job, progress, quality, extra_args, root, job_env)
+            else:
+                with slots:
+                    result = render_job(job, progress, quality, extra_args, root, env)
+            with cond:
+                if job.is_voiceover:
+                    busy_folders.discard(job.workdir)
+                results.append(result)
+                if result.ok:
+                    history[f"{job.key}@{quality}"] = round(result.seconds, 2)
+                cond.notify_all()
+            if result.ok:
+                # Hashed again: the render may have recorded narration the scene had no audio for
+                manifest.record(job, scene_digest(job, quality, digest_args), output_path(job, quality), quality)
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    save_history(history, root)
+    return results
@@ -0,0 +1,107 @@
+"""Renders one long VoiceoverScene as several animation ranges at once.
+
+1. Probe: a timeline run (timeline.py) finds the animation index and scene
+   time at which each voiceover block starts, without drawing anything.
+2. The blocks are grouped into contiguous segments of similar length, and each
+   segment is rendered in its own process with `-n first,last`. Everything
+   before `first` is still executed, which rebuilds the mobjects exactly as
+   they stand at the cut, and the segment's partial movie files land in the
+   scene's usual cache folder.
+3. A final ordinary render finds every animation already cached, so manim
+   itself concatenates the partial movies and places the narration at the
+   same times as a single-process render would. Anything a segment failed to
+   produce is simply rendered there.
+
+manim hashes each animation from the mobjects it plays, and leaves random
+unseeded, so a scene drawing random values (scattered points, jittered
+ticks) would hash differently in every process and the final render would
+find nothing cached. All three passes therefore seed random and np.random
+the same way as the scene starts.
+"""
+
+import os
+from pathlib import Path
+
+# Set by the parent on the workers that render one segment each
+SEGMENT_ENV = "MANIMATIONS_SEGMENT"
+
+# Set by the parent on the probe, segment and final workers: the seed every scene starts from
+SEED_ENV = "MANIMATIONS_SEED"
+
+
+# --- WORKER HOOKS ---
+
+def install_seed(seed):
+    """Seed random and np.random as each scene is created, so every pass draws the same values."""
+    import random
+
+    import numpy as np
+    from manim import Scene
+
+    init = Scene.__init__
+
+    def seeded_init(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        random.seed(seed)
+        np.random.seed(seed)
+
+    Scene.__init__ = seeded_init
+
+
+def install_segment():
+    """Leave the partial movie files for the final render; never touch shared files."""
+    import manim_voiceover.services.base as speech_base
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    # The probe already added any new cache.json entry, and parallel writers would corrupt it
+    speech_base.append_voiceover_cache_entry = lambda *args, **kwargs: None
+    # The final render combines the movie and lays the narration under it;
+    # segments would overwrite each other's, and need not decode any audio
+    SceneFileWriter.finish = lambda self: None
+    SceneFileWriter.add_sound = lambda self, *args, **kwargs: None
+
+    open_stream = SceneFileWriter.open_partial_movie_stream
+    close_stream = SceneFileWriter.close_partial_movie_stream
+
+    # Two segments can produce the same animation hash; write privately, then rename
+    def open_private_stream(self, file_path=None):
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.final_partial_movie_file_path = Path(file_path)
+        private = self.final_partial_movie_file_path
+        open_stream(self, private.with_name(f"{private.stem}.{os.getpid()}.part{private.suffix}"))
+
+    def close_private_stream(self):
+        close_stream(self)
+        os.replace(self.partial_movie_file_path, self.final_partial_movie_file_path)
+
+    SceneFileWriter.open_partial_movie_stream = open_private_stream
+    SceneFileWriter.close_partial_movie_stream = close_private_stream
+
+
+# --- PLANNING ---
+
+def plan_segments(timeline, count):
+    """[(first, last)] animation ranges, cut only at voiceover blocks, of roughly equal scene time."""
+    total, duration = timeline["animations"], timeline["duration"]
+    if count < 2 or total == 0:
+        return [(0, total - 1)]
+
+    cuts = {}
+    for block in timeline["blocks"]:
+        cuts.setdefault(block["animation"], block["start"])
+    cuts.pop(0, None)
+
+    ranges = []
+    first, start_time = 0, 0.0
+    target = duration / count
+    for animation, time in sorted(cuts.items()):
+        if animation >= total or len(ranges) == count - 1:
+            break
+        if time - start_time >= target:
+            ranges.append((first, animation - 1))
+            first, start_time = animation, time
+            # Re-spread what is left over the segments still to fill
+            target = (duration - time) / (count - len(ranges))
+    ranges.append((first, total - 1))
+    return ranges
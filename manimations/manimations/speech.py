@@ -0,0 +1,140 @@
+"""Offline stand-in speech service: silent placeholder narration of a believable length.
+
+Scenes render at full speed on machines with no network or microphone. Each
+placeholder lasts as long as the text would take to read; the rates below
+were fitted to the 1500-odd narration clips recorded for this series. Real
+audio for the same text replaces a placeholder as soon as it exists (see
+stand_in_for), and since the scenes time themselves with tracker.duration,
+nothing has to be re-timed when it does.
+"""
+
+import json
+import os
+import re
+import wave
+from pathlib import Path
+
+from manim_voiceover.helper import remove_bookmarks
+from manim_voiceover.services.base import SpeechService, initialize_speech_service, path_to_string
+from manim_voiceover.tracker import AUDIO_OFFSET_RESOLUTION
+
+from manimations import voicestore
+
+SECONDS_PER_SYLLABLE = 0.18
+PAUSE_SECONDS = 0.16  # at each , ; : . ? ! inside the text
+LEAD_SECONDS = 0.65  # silence before and after the speech
+
+SAMPLE_RATE = 16000
+
+# service names in cache.json of the services this one can stand in for
+SERVICE_NAMES = {"GTTSService": "gtts", "RecorderService": "recorder"}
+
+WORD = re.compile(r"[A-Za-z']+|\d+|[^\sA-Za-z\d]+")
+
+
+def syllables(word):
+    """Vowel groups, less a silent final e; each digit is read as a syllable."""
+    if word.isdigit():
+        return len(word)
+    word = word.lower()
+    count = len(re.findall(r"[aeiouy]+", word))
+    if word.endswith("e") and not word.endswith(("le", "ee")) and count > 1:
+        count -= 1
+    return max(count, 1)
+
+
+def estimate_timing(text):
+    """(duration, word_boundaries) for text read aloud at the series' usual pace."""
+    boundaries = []
+    t = LEAD_SECONDS
+    for match in WORD.finditer(text):
+        token = match.group()
+        if not token[0].isalnum() and token[0] != "'":
+            if re.search(r"[,;:.?!]", token) and match.end() < len(text.rstrip()):
+                t += PAUSE_SECONDS
+            continue
+        boundaries.append({
+            "audio_offset": int(t * AUDIO_OFFSET_RESOLUTION),
+            "text_offset": match.start(),
+            "word_length": len(token),
+            "text": token,
+            "boundary_type": "Word",
+        })
+        t += syllables(token) * SECONDS_PER_SYLLABLE
+    return t + LEAD_SECONDS, boundaries
+
+
+def write_silence(path, duration):
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(bytes(2 * round(duration * SAMPLE_RATE)))
+
+
+class OfflineSpeechService(SpeechService):
+    """Silent, deterministic narration whose length is estimated from the text.
+
+    With stand_in_for set to another speech service, audio that service has
+    already produced for the same text is used instead of a placeholder.
+    """
+
+    def __init__(self, stand_in_for=None, **kwargs):
+        if stand_in_for is not None and "cache_dir" not in kwargs:
+            kwargs["cache_dir"] = stand_in_for.cache_dir
+        initialize_speech_service(self, kwargs)
+        self.real_service = SERVICE_NAMES.get(type(stand_in_for).__name__) if stand_in_for else None
+
+    def real_result(self, input_text, cache_dir):
+        """The stood-in service's cache entry for this text, if it has one (its settings aside)."""
+        if self.real_service is None:
+            return None
+        entries = []
+        if os.environ.get(voicestore.VOICE_STORE_ENV):
+            entries = voicestore.entries_for_text(voicestore.default_store(), input_text)
+        cache_file = Path(cache_dir) / "cache.json"
+        if cache_file.exists():
+            entries += json.loads(cache_file.read_text())
+        for entry in entries:
+            data = entry.get("input_data") or {}
+            if data.get("service") == self.real_service and data.get("input_text") == input_text:
+                return self.get_cached_result(data, cache_dir)
+        return None
+
+    def generate_from_text(self, text, cache_dir=None, path=None, **kwargs):
+        if cache_dir is None:
+            cache_dir = self.cache_dir
+
+        input_text = remove_bookmarks(text)
+        real = self.real_result(input_text, cache_dir)
+        if real is not None:
+            return real
+
+        input_data = {"input_text": input_text, "service": "offline"}
+        cached_result = self.get_cached_result(input_data, cache_dir)
+        if cached_result is not None:
+            return cached_result
+
+        audio_path = self.get_audio_basename(input_data) + ".wav" if path is None else path_to_string(path)
+        duration, word_boundaries = estimate_timing(input_text)
+        write_silence(Path(cache_dir) / audio_path, duration)
+        return {
+            "input_text": text,
+            "input_data": input_data,
+            "original_audio": audio_path,
+            "word_boundaries": word_boundaries,
+        }
+
+
+def install():
+    """Worker hook: scenes keep their set_speech_service(...) call but get placeholders for missing audio."""
+    from manim_voiceover import VoiceoverScene
+
+    set_speech_service = VoiceoverScene.set_speech_service
+
+    def set_offline_speech_service(self, speech_service, *args, **kwargs):
+        if not isinstance(speech_service, OfflineSpeechService):
+            speech_service = OfflineSpeechService(stand_in_for=speech_service)
+        return set_speech_service(self, speech_service, *args, **kwargs)
+
+    VoiceoverScene.set_speech_service = set_offline_speech_service
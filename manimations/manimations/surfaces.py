@@ -0,0 +1,168 @@
+"""Parametric surfaces evaluated over the whole grid at once, with the mesh cached on disk.
+
+manim's Surface builds its faces in (u, v) space and then maps every Bezier
+point through func(u, v) one at a time, sixteen calls per face: each handle
+is first pulled to a tiny fraction (pre_function_handle_to_anchor_scale_factor)
+of its way from its anchor, mapped, and pushed back out, so it ends up along
+func's finite-difference tangent at the anchor. Here func is called once,
+with arrays, on the grid of corners and on the four grids of corners nudged
+that fraction of a handle towards each neighbour, and the faces get the same
+points directly. Functions written with NumPy operations, like all the
+surfaces in this series, work unchanged; one that only accepts numbers is
+called point by point instead.
+
+The mapped points are kept in .manimations/meshes, keyed by func's source
+(plus the values of any constants and closure variables it uses), the
+u / v ranges and the resolution, so a later render skips evaluation
+entirely.
+
+    from manimations.surfaces import VectorizedSurface
+    saddle = VectorizedSurface(lambda u, v: np.array([u, v, u**3 - 3*u*v**2]), resolution=(100, 100))
+"""
+
+import dis
+import hashlib
+import inspect
+import os
+import tempfile
+import types
+from pathlib import Path
+
+import numpy as np
+from manim import Surface, ThreeDVMobject, VGroup
+
+from manimations.discovery import REPO_ROOT
+
+# Overrides where meshes are cached
+MESH_CACHE_ENV = "MANIMATIONS_MESH_CACHE"
+
+# Bump when the cached array layout or contents change
+MESH_FORMAT = 2
+
+# Surface's default pre_function_handle_to_anchor_scale_factor
+HANDLE_FACTOR = 1e-5
+
+
+def default_cache(root=REPO_ROOT):
+    return Path(os.environ.get(MESH_CACHE_ENV) or Path(root) / ".manimations" / "meshes")
+
+
+def function_key(func):
+    """Text identifying what func computes, or None if that can't be told from its source."""
+    try:
+        parts = [inspect.getsource(func)]
+    except (OSError, TypeError):
+        return None
+    code = func.__code__
+    closure = zip(code.co_freevars, [cell.cell_contents for cell in func.__closure__ or ()])
+    loaded = {ins.argval for ins in dis.get_instructions(code) if ins.opname == "LOAD_GLOBAL"}
+    used_globals = ((name, func.__globals__[name]) for name in sorted(loaded) if name in func.__globals__)
+    for name, value in [*closure, *used_globals]:
+        if isinstance(value, (bool, int, float, complex, str, tuple)):
+            parts.append(f"{name}={value!r}")
+        elif isinstance(value, types.FunctionType):
+            inner = function_key(value)
+            if inner is None:
+                return None
+            parts.append(f"{name}:{inner}")
+        elif not isinstance(value, (types.ModuleType, types.BuiltinFunctionType, type, np.ufunc)):
+            return None
+    return "\n".join(parts)
+
+
+def evaluate_grid(func, u_values, v_values):
+    """func over the grid as a (len(u_values), len(v_values), 3) array."""
+    u, v = np.meshgrid(u_values, v_values, indexing="ij")
+    try:
+        x, y, z = func(u, v)
+        return np.stack([np.broadcast_to(c, u.shape) for c in (x, y, z)], axis=-1).astype(float)
+    except (TypeError, ValueError):
+        # Not vectorized (e.g. an if on u): one call per point, as manim does
+        return np.array([[func(a, b) for b in v_values] for a in u_values], dtype=float)
+
+
+def _nudged(start, end, factor):
+    """Where Surface maps a handle from: factor of the way from start to the straight-line handle towards end."""
+    handle = (1 - 1 / 3) * start + 1 / 3 * end
+    return start + factor * (handle - start)
+
+
+def face_points(func, u_range, v_range, resolution, factor=HANDLE_FACTOR):
+    """(u cells, v cells, 16, 3) Bezier points of every face, in the order Surface gives them, as Surface maps them."""
+    u_res, v_res = (resolution, resolution) if isinstance(resolution, int) else resolution
+    u, v = np.linspace(*u_range, u_res + 1), np.linspace(*v_range, v_res + 1)
+    corners = evaluate_grid(func, u, v)
+
+    def handles(u_values, v_values, anchors):
+        return anchors + (1.0 / factor) * (evaluate_grid(func, u_values, v_values) - anchors)
+
+    # Handles at each corner, pointing to the next corner up / down u and v
+    up_u = handles(_nudged(u[:-1], u[1:], factor), v, corners[:-1])
+    down_u = handles(_nudged(u[1:], u[:-1], factor), v, corners[1:])
+    up_v = handles(u, _nudged(v[:-1], v[1:], factor), corners[:, :-1])
+    down_v = handles(u, _nudged(v[1:], v[:-1], factor), corners[:, 1:])
+
+    c00, c10, c11, c01 = corners[:-1, :-1], corners[1:, :-1], corners[1:, 1:], corners[:-1, 1:]
+    return np.stack([
+        c00, up_u[:, :-1], down_u[:, :-1], c10,  # (u1, v1) -> (u2, v1)
+        c10, up_v[1:], down_v[1:], c11,  # -> (u2, v2)
+        c11, down_u[:, 1:], up_u[:, 1:], c01,  # -> (u1, v2)
+        c01, down_v[:-1], up_v[:-1], c00,  # -> (u1, v1)
+    ], axis=2)
+
+
+def cached_face_points(func, u_range, v_range, resolution, factor=HANDLE_FACTOR, cache=None):
+    key = function_key(func)
+    if key is None:
+        return face_points(func, u_range, v_range, resolution, factor)
+    key += f"\n{MESH_FORMAT} {list(u_range)} {list(v_range)} {resolution} {factor!r}"
+    path = Path(cache or default_cache()) / f"{hashlib.sha256(key.encode()).hexdigest()[:16]}.npy"
+    if path.exists():
+        return np.load(path)
+    points = face_points(func, u_range, v_range, resolution, factor)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".npy")
+    with os.fdopen(fd, "wb") as f:
+        np.save(f, points)
+    os.replace(tmp, path)
+    return points
+
+
+class VectorizedSurface(Surface):
+    """Drop-in Surface whose func is evaluated on the whole grid at once, and cached unless cache=False."""
+
+    def __init__(self, func, *args, cache=True, **kwargs):
+        self.cache = cache
+        super().__init__(func, *args, **kwargs)
+
+    def _setup_in_uv_space(self):
+        u_values, v_values = self._get_u_values_and_v_values()
+        factor = self.pre_function_handle_to_anchor_scale_factor
+        if self.cache:
+            points = cached_face_points(self._func, self.u_range, self.v_range, self.resolution, factor)
+        else:
+            points = face_points(self._func, self.u_range, self.v_range, self.resolution, factor)
+
+        faces = VGroup()
+        for i in range(len(u_values) - 1):
+            for j in range(len(v_values) - 1):
+                face = ThreeDVMobject()
+                face.set_points(points[i, j])
+                face.u_index, face.v_index = i, j
+                face.u1, face.u2 = u_values[i:i + 2]
+                face.v1, face.v2 = v_values[j:j + 2]
+                faces.add(face)
+        faces.set_fill(color=self.fill_color, opacity=self.fill_opacity)
+        faces.set_stroke(color=self.stroke_color, width=self.stroke_width, opacity=self.stroke_opacity)
+        self.add(*faces)
+        if self.checkerboard_colors:
+            self.set_fill_by_checkerboard(*self.checkerboard_colors)
+        self._mapped = True
+
+    def apply_function(self, function, **kwargs):
+        # Surface.__init__ next maps the uv grid through func point by point;
+        # the faces above already hold the mapped points.
+        if getattr(self, "_mapped", False):
+            self._mapped = False
+            return self
+        return super().apply_function(function, **kwargs)
@@ -0,0 +1,150 @@
+"""Batched LaTeX: many formulas typeset as the pages of one document, with one latex and one dvisvgm run.
+
+Tiny formulas spend most of their compile time starting latex and dvisvgm.
+Here every formula becomes a page of its own, and each page is published to
+the shared store under the hash of the formula's usual single-formula
+document (texcache.tex_key), so MathTex lookups cannot tell the difference.
+A formula that defines a macro or steps a counter would change the pages
+after it, so it is compiled on its own.
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from manimations import texcache
+
+# Formulas per document. Past a few dozen the saving per formula is small,
+# and a broken formula costs more runs to bisect.
+DEFAULT_BATCH_SIZE = 32
+
+DOCUMENT = re.compile(r"\A(?P<head>.*?)\\begin\{document\}\n?(?P<body>.*?)\n?\\end\{document\}\s*\Z", re.S)
+STANDALONE = re.compile(r"\\documentclass\[(?P<options>[^\]]*)\]\{standalone\}")
+
+# Bodies that define macros or step counters would change the pages after them
+STATEFUL = re.compile(
+    r"\\(?:[gex]?def|let|global|(?:re)?newcommand|providecommand|DeclareMathOperator|(?:re)?newenvironment"
+    r"|newcounter|setcounter|addtocounter|(?:ref)?stepcounter|footnote)(?![a-zA-Z])"
+    r"|\\begin\{(?:equation|align|alignat|gather|multline|flalign|eqnarray)\}"
+)
+
+
+def split_document(texcode):
+    """(preamble, body) of a standalone preview document, or None if it cannot share a batch."""
+    match = DOCUMENT.match(texcode)
+    if not match:
+        return None
+    standalone = STANDALONE.search(match["head"])
+    if not standalone or "preview" not in [o.strip() for o in standalone["options"].split(",")]:
+        return None
+    if STATEFUL.search(match["body"]):
+        return None
+    return match["head"], match["body"]
+
+
+def batch_document(head, bodies):
+    """In standalone's multi mode every `standalone` environment is cropped to a page of its own."""
+    head = STANDALONE.sub(lambda m: rf"\documentclass[{m['options']},multi]{{standalone}}", head, count=1)
+    pages = "\n".join(f"\\begin{{standalone}}\n{body}\n\\end{{standalone}}" for body in bodies)
+    return f"{head}\\begin{{document}}\n{pages}\n\\end{{document}}\n"
+
+
+def _compile_pages(texcodes, tex_template, store):
+    """One latex + dvisvgm run for all of texcodes. False if anything went wrong."""
+    from manim.utils.tex_file_writing import make_tex_compilation_command
+
+    parts = [split_document(t) for t in texcodes]
+    if None in parts or len({head for head, _ in parts}) != 1:
+        return False
+
+    scratch = Path(store) / "tmp"
+    scratch.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=scratch) as workdir:
+        workdir = Path(workdir)
+        tex_file = workdir / "batch.tex"
+        tex_file.write_text(batch_document(parts[0][0], [body for _, body in parts]), encoding="utf-8")
+
+        compiler, output_format = tex_template.tex_compiler, tex_template.output_format
+        command = make_tex_compilation_command(compiler, output_format, tex_file, workdir)
+        if subprocess.run(command, stdout=subprocess.DEVNULL).returncode != 0:
+            return False
+        if subprocess.run(
+            texcache.dvisvgm_command(tex_file.with_suffix(output_format), workdir / "page-%p.svg", f"1-{len(texcodes)}"),
+            stdout=subprocess.DEVNULL,
+        ).returncode != 0:
+            return False
+        pages = sorted(workdir.glob("page-*.svg"), key=lambda p: int(p.stem.split("-")[1]))
+        # An empty formula may not produce a page, which would shift every later one
+        if len(pages) != len(texcodes):
+            return False
+        for texcode, page in zip(texcodes, pages):
+            texcache.publish(page, texcache.store_path(store, texcache.tex_key(texcode)))
+    return True
+
+
+def compile_batch(texcodes, tex_template, store):
+    """Compiles documents that share a preamble into the store. Returns how many failed.
+
+    A failed batch is split in half and retried, so one broken formula costs a
+    few extra runs rather than the whole batch; single formulas go through
+    texcache.compile_texcode, which reports the LaTeX error.
+    """
+    texcodes = [t for t in texcodes if not texcache.store_path(store, texcache.tex_key(t)).exists()]
+    if not texcodes:
+        return 0
+    if len(texcodes) == 1:
+        try:
+            texcache.compile_texcode(texcodes[0], tex_template, store)
+            return 0
+        except ValueError:
+            return 1
+    if _compile_pages(texcodes, tex_template, store):
+        return 0
+    middle = len(texcodes) // 2
+    return compile_batch(texcodes[:middle], tex_template, store) + compile_batch(texcodes[middle:], tex_template, store)
+
+
+def batches(documents, batch_size=DEFAULT_BATCH_SIZE):
+    """Groups {key: (texcode, template)} into (texcodes, template) lists of at most batch_size sharing a preamble."""
+    groups = {}
+    for texcode, template in documents.values():
+        parts = split_document(texcode)
+        # Documents that cannot be batched get a group of their own
+        head = parts[0] if parts else texcode
+        groups.setdefault((head, template.tex_compiler, template.output_format), ([], template))[0].append(texcode)
+    for texcodes, template in groups.values():
+        for start in range(0, len(texcodes), max(batch_size, 1)):
+            yield texcodes[start:start + max(batch_size, 1)], template
+
+
+def compile_many(documents, workers=None, store=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Compiles {key: (texcode, template)} into the store across a process pool. Returns how many failed."""
+    store = Path(store or texcache.default_store())
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers or os.process_cpu_count() or 1) as pool:
+        futures = [pool.submit(compile_batch, texcodes, template, store) for texcodes, template in batches(documents, batch_size)]
+        for future in as_completed(futures):
+            failed += future.result()
+    return failed
+
+
+# --- BENCHMARK ---
+
+def benchmark(documents, workers=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Formulas per second, one document per formula vs. batch_size per document, each into an empty store."""
+    rates = {}
+    for label, size in (("per formula", 1), (f"batches of {batch_size}", batch_size)):
+        store = Path(tempfile.mkdtemp(prefix="manimations-tex-bench-"))
+        try:
+            start = time.perf_counter()
+            failed = compile_many(documents, workers, store, size)
+            seconds = time.perf_counter() - start
+        finally:
+            shutil.rmtree(store, ignore_errors=True)
+        rates[label] = ((len(documents) - failed) / seconds, seconds, failed)
+    return rates
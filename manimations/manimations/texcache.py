@@ -0,0 +1,138 @@
+"""Repo-wide, content-addressed store for compiled LaTeX, shared by every render."""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+from manimations.discovery import REPO_ROOT
+
+# Worker processes find the store through this variable
+TEX_CACHE_ENV = "MANIMATIONS_TEX_CACHE"
+
+
+def default_store(root=REPO_ROOT):
+    """<store>/<first two hex digits>/<hash>.svg, under .manimations/tex unless overridden."""
+    return Path(os.environ.get(TEX_CACHE_ENV) or Path(root) / ".manimations" / "tex")
+
+
+def tex_key(texcode):
+    """Same hash manim uses for media/Tex file names, so existing caches can be imported."""
+    return hashlib.sha256(texcode.encode()).hexdigest()[:16]
+
+
+def store_path(store, key):
+    return Path(store) / key[:2] / f"{key}.svg"
+
+
+def texcode_for(expression, environment=None, tex_template=None):
+    from manim import config
+
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    if environment is not None:
+        return tex_template.get_texcode_for_expression_in_env(expression, environment)
+    return tex_template.get_texcode_for_expression(expression)
+
+
+# Parallel renders may ask for the same formula at once. Each compile runs in
+# its own temporary folder and the SVG is moved into place with os.replace,
+# so readers never see a half-written file; at worst it is compiled twice.
+
+def publish(src, dest):
+    """Atomically places a copy of src at dest."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=dest.parent, suffix=".part")
+    os.close(fd)
+    shutil.copyfile(src, tmp)
+    os.replace(tmp, dest)
+
+
+def dvisvgm_command(compiled, output, pages="1"):
+    """Same conversion manim runs on its .dvi / .pdf files; output may hold dvisvgm's %p page pattern."""
+    return [
+        "dvisvgm",
+        *(["--pdf"] if compiled.suffix == ".pdf" else []),
+        f"--page={pages}",
+        "--no-fonts",
+        "--verbosity=0",
+        f"--output={Path(output).as_posix()}",
+        compiled.as_posix(),
+    ]
+
+
+def compile_texcode(texcode, tex_template, store):
+    """Compiles a complete .tex document into the store and returns the SVG path."""
+    from manim.utils.tex_file_writing import make_tex_compilation_command, print_all_tex_errors
+
+    dest = store_path(store, tex_key(texcode))
+    if dest.exists():
+        return dest
+
+    scratch = Path(store) / "tmp"
+    scratch.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=scratch) as workdir:
+        workdir = Path(workdir)
+        tex_file = workdir / f"{tex_key(texcode)}.tex"
+        tex_file.write_text(texcode, encoding="utf-8")
+
+        compiler, output_format = tex_template.tex_compiler, tex_template.output_format
+        command = make_tex_compilation_command(compiler, output_format, tex_file, workdir)
+        if subprocess.run(command, stdout=subprocess.DEVNULL).returncode != 0:
+            print_all_tex_errors(tex_file.with_suffix(".log"), compiler, tex_file)
+            raise ValueError(f"{compiler} error converting to {output_format[1:]}. See log output above.")
+
+        svg_file = tex_file.with_suffix(".svg")
+        subprocess.run(dvisvgm_command(tex_file.with_suffix(output_format), svg_file), stdout=subprocess.DEVNULL)
+        if not svg_file.exists():
+            raise ValueError(f"dvisvgm could not convert {tex_file.with_suffix(output_format).name} to SVG.")
+        publish(svg_file, dest)
+    return dest
+
+
+def cached_tex_to_svg_file(expression, environment=None, tex_template=None):
+    """Drop-in replacement for manim.utils.tex_file_writing.tex_to_svg_file."""
+    from manim import config
+
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    texcode = texcode_for(expression, environment, tex_template)
+    return compile_texcode(texcode, tex_template, default_store())
+
+
+def install(store=None):
+    """Routes every Tex/MathTex built in this process through the shared store."""
+    import manim.mobject.text.tex_mobject as tex_mobject
+    import manim.utils.tex_file_writing as tex_file_writing
+
+    if store is not None:
+        os.environ[TEX_CACHE_ENV] = str(store)
+    tex_file_writing.tex_to_svg_file = cached_tex_to_svg_file
+    tex_mobject.tex_to_svg_file = cached_tex_to_svg_file
+
+
+# --- SEEDING FROM THE OLD PER-FOLDER CACHES ---
+
+def import_media_tex(root=REPO_ROOT, store=None):
+    """Copies every compiled SVG found in <folder>/media/Tex into the store. Returns (added, seen)."""
+    store = Path(store or default_store(root))
+    added = seen = 0
+    for tex_dir in sorted(Path(root).rglob("media/Tex")):
+        for tex_file in tex_dir.glob("*.tex"):
+            svg_file = tex_file.with_suffix(".svg")
+            if not svg_file.exists():
+                continue
+            seen += 1
+            # Key on the .tex contents rather than trusting the file name
+            dest = store_path(store, tex_key(tex_file.read_text(encoding="utf-8")))
+            if not dest.exists():
+                publish(svg_file, dest)
+                added += 1
+    return added, seen
+
+
+def store_stats(store):
+    svgs = list(Path(store).glob("*/*.svg"))
+    return len(svgs), sum(p.stat().st_size for p in svgs)
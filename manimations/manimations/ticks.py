@@ -0,0 +1,148 @@
+"""Rulers with many tick marks, kept as NumPy arrays and drawn as one path.
+
+A TickField is the baseline of an interval x_range followed by a straight
+subpath per tick, each centred on the baseline. Tick positions (in the units
+of x_range), heights and depths live in arrays next to the points, so a
+hundred thousand rationals are one mobject, and the animations below redraw
+every tick at once from those arrays each frame:
+
+    GrowTicks      ticks grow out of the baseline a depth at a time, coarsest first
+    RefineTicks    zooms the field onto a new x_range, with ever finer dyadic ticks
+                   growing in as their spacing on screen opens up
+
+The field can be moved, scaled and rotated like any mobject first; its frame
+(baseline and tick direction) is read back from its points.
+
+    from manimations.ticks import TickField, RefineTicks
+    rationals = TickField.dyadic(spacing=1 / 1024)
+    self.play(RefineTicks(rationals, x_range=(0.3, 0.31), run_time=6))
+"""
+
+import numpy as np
+from manim import OUT, Animation, VMobject
+
+from manimations.trees import segment_points
+
+
+def dyadic_ticks(x_range, spacing):
+    """(positions, levels) of the k / 2**n in x_range whose spacing, as a fraction of it, is at least spacing."""
+    lo, hi = x_range
+    finest = int(np.floor(np.log2(1 / (spacing * (hi - lo)))))
+    coarsest = int(np.ceil(np.log2(1 / (hi - lo))))
+    step = 2.0 ** -finest
+    k = np.arange(np.ceil(lo / step), np.floor(hi / step) + 1).astype(np.int64)
+    # k / 2**finest in lowest terms has denominator 2**(finest - trailing zeros of k)
+    trailing = np.log2(np.where(k == 0, 1 << 62, k & -k)).astype(int)
+    levels = np.maximum(finest - trailing, coarsest)
+    return k * step, levels
+
+
+def dyadic_heights(levels, x_range, spacing, max_height):
+    """Heights falling off linearly in log spacing: max_height for the whole window, nothing below spacing / 2."""
+    gaps = 2.0 ** -levels / (x_range[1] - x_range[0])
+    octaves = np.log2(1 / spacing) + 1
+    return max_height * np.clip((np.log2(gaps / spacing) + 1) / octaves, 0, 1)
+
+
+class TickField(VMobject):
+    """Baseline of x_range plus ticks at positions; heights and depths are scalars or arrays, one per tick."""
+
+    def __init__(self, positions=(), heights=0.2, x_range=(0, 1), width=4, depths=0, **kwargs):
+        super().__init__(**kwargs)
+        self.tick_width = width
+        self.x_range = tuple(x_range)
+        left = np.array([-width / 2, 0, 0])
+        self.set_ticks(positions, heights, depths=depths, frame=(left, -2 * left, np.array([0, 1, 0])))
+
+    @classmethod
+    def dyadic(cls, x_range=(0, 1), spacing=1 / 64, max_height=0.3, **kwargs):
+        """Every dyadic rational down to spacing (a fraction of the window), heights by denominator."""
+        positions, levels = dyadic_ticks(x_range, spacing)
+        heights = dyadic_heights(levels, x_range, spacing, max_height)
+        field = cls(positions, heights, x_range, depths=levels - levels.min(), **kwargs)
+        field.spacing, field.max_height = spacing, max_height
+        return field
+
+    def frame(self):
+        """(left end, baseline vector, unit tick vector) where the field now stands."""
+        left, right = self.points[0], self.points[3]
+        if len(self.heights) and self.heights.max() > 0:
+            tallest = 4 + 4 * self.heights.argmax()
+            return left, right - left, (self.points[tallest + 3] - self.points[tallest]) / self.heights.max()
+        # No tick to read it from: square to the baseline, in its plane with OUT, scaled as the field has been
+        along = right - left
+        normal = np.cross(OUT, along)
+        return left, along, normal / np.linalg.norm(normal) * np.linalg.norm(along) / self.tick_width
+
+    def n2p(self, value):
+        left, along, _ = self.frame()
+        lo, hi = self.x_range
+        return left + (value - lo) / (hi - lo) * along
+
+    def set_ticks(self, positions, heights=None, x_range=None, depths=None, frame=None):
+        """Replaces the ticks (and optionally the window), redrawing them in frame or the current one."""
+        left, along, up = frame if frame is not None else self.frame()
+        positions = np.asarray(positions, dtype=float)
+        self.positions = positions
+        self.heights = np.broadcast_to(self.heights if heights is None else heights, positions.shape).astype(float)
+        if depths is not None:
+            self.depths = np.broadcast_to(depths, positions.shape).astype(int)
+        if x_range is not None:
+            self.x_range = tuple(x_range)
+
+        lo, hi = self.x_range
+        mids = left + ((positions - lo) / (hi - lo))[:, None] * along
+        half = (self.heights / 2)[:, None] * up
+        starts = np.vstack([left, mids - half])
+        ends = np.vstack([left + along, mids + half])
+        self.set_points(segment_points(starts, ends))
+        return self
+
+
+class GrowTicks(Animation):
+    """Grows every tick out of the baseline, depth 0 first, then each finer depth in turn."""
+
+    def __init__(self, field, **kwargs):
+        kwargs.setdefault("introducer", True)
+        super().__init__(field, **kwargs)
+
+    def begin(self):
+        self.frame = self.mobject.frame()
+        self.heights = self.mobject.heights.copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)
+        depths = self.mobject.depths
+        grown = np.clip(alpha * (depths.max(initial=0) + 1) - depths, 0, 1)
+        self.mobject.set_ticks(self.mobject.positions, self.heights * grown, frame=self.frame)
+
+
+class RefineTicks(Animation):
+    """Zooms a dyadic TickField onto x_range; the window's width changes geometrically, so zooming is steady."""
+
+    def __init__(self, field, x_range, spacing=None, max_height=None, **kwargs):
+        self.target_range = tuple(x_range)
+        self.spacing = spacing or getattr(field, "spacing", 1 / 64)
+        self.max_height = max_height or getattr(field, "max_height", field.heights.max(initial=0.3))
+        super().__init__(field, **kwargs)
+
+    def begin(self):
+        self.frame = self.mobject.frame()
+        self.start_range = self.mobject.x_range
+        super().begin()
+
+    def window(self, alpha):
+        (lo0, hi0), (lo1, hi1) = self.start_range, self.target_range
+        w0, w1 = hi0 - lo0, hi1 - lo1
+        w = w0 ** (1 - alpha) * w1 ** alpha
+        # The pan follows the zoom, so the point both windows agree on stays put
+        t = alpha if np.isclose(w0, w1) else (w0 - w) / (w0 - w1)
+        lo = lo0 + t * (lo1 - lo0)
+        return lo, lo + w
+
+    def interpolate_mobject(self, alpha):
+        x_range = self.window(self.rate_func(alpha))
+        positions, levels = dyadic_ticks(x_range, self.spacing)
+        heights = dyadic_heights(levels, x_range, self.spacing, self.max_height)
+        self.mobject.set_ticks(positions, heights, x_range, depths=levels - levels.min(), frame=self.frame)
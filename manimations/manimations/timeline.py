@@ -0,0 +1,124 @@
+"""Scene timelines without rendering: construct runs, nothing is drawn or encoded.
+
+The worker is started with `--dry_run -n <past the end>`, so manim skips every
+animation (the scene clock still advances by each run_time) and never opens
+a movie file. The hooks below also stop the Cairo camera from painting the
+one frame manim draws per skipped animation, then record every play / wait
+and every voiceover block with its narration length, as read from the
+voiceover cache.
+"""
+
+import csv
+import inspect
+import json
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+# Set by the parent: where the worker writes the scene's timeline JSON
+TIMELINE_ENV = "MANIMATIONS_TIMELINE"
+
+# `-n` start that no scene reaches: every animation is skipped
+SKIP_ALL = 1_000_000
+
+# manim flags for a timeline run
+TIMELINE_ARGS = ["--dry_run", "-n", str(SKIP_ALL)]
+
+CSV_FIELDS = ["kind", "index", "line", "start", "end", "run_time", "narration", "slack", "text"]
+
+
+def _call_line(source_file):
+    """Line in the scene's own file that (eventually) made the current call."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_code.co_filename == source_file:
+            return frame.f_lineno
+        frame = frame.f_back
+    return None
+
+
+def install(path):
+    """Record the scene's timeline and write it to path as JSON when the scene ends."""
+    import manim_voiceover.services.base as speech_base
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+    from manim_voiceover import VoiceoverScene
+
+    events = []
+    blocks = []
+    play = CairoRenderer.play
+    voiceover = VoiceoverScene.voiceover
+    append_entry = speech_base.append_voiceover_cache_entry
+
+    def timed_play(self, scene, *args, **kwargs):
+        source_file = inspect.getsourcefile(type(scene))
+        event = {"index": self.num_plays, "line": _call_line(source_file), "start": self.time}
+        play(self, scene, *args, **kwargs)
+        animations = scene.animations or []
+        is_wait = all(type(a).__name__ == "Wait" for a in animations)
+        event.update(kind="wait" if is_wait else "play", end=self.time, run_time=self.time - event["start"])
+        events.append(event)
+
+    @contextmanager
+    def timed_voiceover(self, text=None, ssml=None, **kwargs):
+        block = {
+            "animation": self.renderer.num_plays,
+            "line": _call_line(inspect.getsourcefile(type(self))),
+            "start": self.renderer.time,
+            "text": " ".join((text or ssml or "").split()),
+        }
+        blocks.append(block)
+        with voiceover(self, text, ssml, **kwargs) as tracker:
+            block["narration"] = tracker.duration
+            yield tracker
+        block["end"] = self.renderer.time
+        # Time the block runs on after its narration has finished
+        block["slack"] = block["end"] - block["start"] - block["narration"]
+
+    def append_new_entry(json_file, entry):
+        """manim-voiceover appends on every lookup; only keep entries for narration it had to generate."""
+        json_file = Path(json_file)
+        if json_file.exists() and any(e.get("input_data") == entry.get("input_data")
+                                      for e in json.loads(json_file.read_text())):
+            return
+        append_entry(json_file, entry)
+
+    def write_timeline(self, scene):
+        """Ends the scene with its timeline; a scene that never plays or waits has an empty one."""
+        timeline = {
+            "duration": self.time,
+            "animations": self.num_plays,
+            "events": events,
+            "blocks": blocks,
+        }
+        Path(path).write_text(json.dumps(timeline, indent=2))
+
+    CairoRenderer.play = timed_play
+    VoiceoverScene.voiceover = timed_voiceover
+    # Skipped animations still paint a frame each; nothing is looked at here
+    CairoRenderer.update_frame = lambda self, scene, *args, **kwargs: None
+    CairoRenderer.save_static_frame_data = lambda self, scene, static_mobjects: None
+    speech_base.append_voiceover_cache_entry = append_new_entry
+    # Instead of finishing the movie, or saving a still for a scene with no animations
+    CairoRenderer.scene_finished = write_timeline
+    # manim-voiceover adds each clip even to a skipped scene, and manim decodes it to add it
+    SceneFileWriter.add_sound = lambda self, *args, **kwargs: None
+
+
+# --- REPORTS ---
+
+def rows(timeline):
+    """Voiceover blocks and animations in time order, flattened for CSV."""
+    entries = [dict(e, kind="voiceover", run_time=e.get("end", e["start"]) - e["start"])
+               for e in timeline["blocks"]]
+    entries += timeline["events"]
+    entries.sort(key=lambda e: (e["start"], e["kind"] != "voiceover"))
+    return [{field: entry.get(field, "") for field in CSV_FIELDS} for entry in entries]
+
+
+def write_csv(timeline, path):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows(timeline))
+
@@ -0,0 +1,76 @@
+"""Fractal trees built a level at a time with NumPy, one VMobject per level.
+
+A branch of depth d ends where its two children start; they are 0.7 times as
+long, turned by plus and minus pi/6 in the plane and twisted out of it by
+plus and minus 0.5 (the z component), as in math_uni's tree. All 2**level
+branches of a level are computed together, and drawn as one VMobject with a
+straight subpath per branch, so depth 12 (4095 branches) is still only 12
+mobjects to update and paint.
+
+    from manimations.trees import FractalTree, GrowBranches
+    tree = FractalTree(iterations=12)
+    tree.levels[-1].set_stroke(GREEN)    # per-level styling
+    self.play(GrowBranches(tree))        # every level grows out of the one before
+"""
+
+import numpy as np
+from manim import ORANGE, PI, WHITE, Animation, VGroup, VMobject, interpolate_color
+
+
+def branch_levels(iterations, start=(0, -1.5, 0), length=1.0, angle=PI / 2, ratio=0.7, spread=PI / 6, twist=0.5):
+    """[(starts, ends)] per level, trunk first; level k holds two (2**k, 3) arrays."""
+    starts = np.array([start], dtype=float)
+    angles = np.array([angle])
+    offsets = np.array([0.0])
+    levels = []
+    for _ in range(iterations):
+        ends = starts + length * np.column_stack([np.cos(angles), np.sin(angles), np.sin(angles + offsets)])
+        levels.append((starts, ends))
+        # Children of branch i are 2i (turned left) and 2i + 1 (turned right)
+        starts = np.repeat(ends, 2, axis=0)
+        angles = np.column_stack([angles + spread, angles - spread]).ravel()
+        offsets = np.column_stack([offsets + twist, offsets - twist]).ravel()
+        length *= ratio
+    return levels
+
+
+def segment_points(starts, ends):
+    """Bezier points of straight segments, one cubic piece each."""
+    step = (ends - starts)[:, None, :] / 3
+    return (starts[:, None, :] + step * np.arange(4)[None, :, None]).reshape(-1, 3)
+
+
+class FractalTree(VGroup):
+    """Binary branching tree; self.levels[k] is the VMobject holding every branch of level k."""
+
+    def __init__(self, iterations=4, trunk_color=WHITE, tip_color=ORANGE, **branching):
+        super().__init__()
+        self.levels = []
+        for level, (starts, ends) in enumerate(branch_levels(iterations, **branching)):
+            depth = iterations - level
+            branches = VMobject()
+            branches.set_points(segment_points(starts, ends))
+            # Trunk thick and white, fading to thin orange tips
+            branches.set_stroke(color=interpolate_color(tip_color, trunk_color, depth / iterations), width=depth)
+            self.levels.append(branches)
+        self.add(*self.levels)
+
+
+class GrowBranches(Animation):
+    """Grows a FractalTree (or any VGroup of straight-segment levels) level by level from its trunk."""
+
+    def __init__(self, tree, **kwargs):
+        kwargs.setdefault("introducer", True)
+        super().__init__(tree, **kwargs)
+
+    def begin(self):
+        # Where the tree stands now, after any move / rotate / scale
+        self.segments = [(level.points[0::4].copy(), level.points[3::4].copy()) for level in self.mobject.submobjects]
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)
+        count = len(self.segments)
+        for k, (level, (starts, ends)) in enumerate(zip(self.mobject.submobjects, self.segments)):
+            grown = np.clip(alpha * count - k, 0, 1)
+            level.set_points(segment_points(starts, starts + grown * (ends - starts)))
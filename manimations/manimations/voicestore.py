@@ -0,0 +1,244 @@
+"""Repo-wide voiceover store: every narration clip once, found by key rather than by scanning.
+
+manim-voiceover keeps a cache.json list in each media folder, reads the whole
+list on every self.voiceover(...) lookup and appends to it every time, and a
+sentence recorded for two folders is stored in both. The store instead keeps
+
+    index/<ab>/<text hash>/<settings hash>.json   one entry per narration
+    audio/<ab>/<sha256 of the file>.<ext>           each distinct clip once
+
+so a lookup opens a single small file, however much has been recorded. Each
+entry also records the clip's duration, read once when it is added, so a
+VoiceoverTracker never has to open the audio to learn how long it is. The
+text hash is taken of the whitespace-normalized text alone, which lets the
+build manifest and the offline speech service find a line's entries without
+knowing the service settings. Entries and clips are written to a temporary
+file and moved into place with os.replace, so parallel renders can add
+narration at the same time.
+
+The folder's media/voiceovers stays where manim-voiceover plays audio from:
+a clip found in the store is hard-linked there (copied across file systems).
+The old cache.json files are still read when the store has no entry, and the
+entry found is then added to the store; `manimations voice-store import` moves
+them all in at once.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from manimations.discovery import REPO_ROOT
+
+# Worker processes find the store through this variable
+VOICE_STORE_ENV = "MANIMATIONS_VOICE_STORE"
+
+# Entry fields naming audio files in the service's cache_dir
+AUDIO_FIELDS = ("original_audio", "final_audio")
+
+
+def default_store(root=REPO_ROOT):
+    return Path(os.environ.get(VOICE_STORE_ENV) or Path(root) / ".manimations" / "voices")
+
+
+def _sha(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def text_key(text):
+    # manim-voiceover collapses whitespace before looking text up
+    return _sha(" ".join(text.split()).encode())[:16]
+
+
+def settings_key(input_data):
+    return _sha(json.dumps(input_data, sort_keys=True).encode())[:16]
+
+
+def entry_path(store, input_data):
+    t = text_key(input_data["input_text"])
+    return Path(store) / "index" / t[:2] / t / f"{settings_key(input_data)}.json"
+
+
+def audio_duration(path):
+    """Length in seconds, read with mutagen exactly as manim-voiceover's get_duration does."""
+    from mutagen.mp3 import MP3
+    from mutagen.wave import WAVE
+
+    audio = WAVE(path) if str(path).endswith(".wav") else MP3(path)
+    if audio.info is None:
+        raise ValueError(f"Could not read audio metadata from {path}")
+    return float(audio.info.length)
+
+
+def _write_atomic(dest, write):
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=dest.parent, suffix=".part")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _place(src, dest):
+    """Puts a link to (or a copy of) src at dest, atomically."""
+    def link(tmp):
+        Path(tmp).unlink(missing_ok=True)
+        try:
+            os.link(src, tmp)
+        except OSError:
+            shutil.copyfile(src, tmp)
+
+    _write_atomic(Path(dest), link)
+
+
+# --- LOOKUP ---
+
+def lookup(store, input_data):
+    """The stored entry for exactly this narration and these settings, or None."""
+    path = entry_path(store, input_data)
+    try:
+        return json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def entries_for_text(store, text):
+    """Every stored entry for this text, whatever service or settings produced it."""
+    t = text_key(text)
+    entries = []
+    for path in sorted((Path(store) / "index" / t[:2] / t).glob("*.json")):
+        try:
+            entries.append(json.loads(path.read_text()))
+        except json.JSONDecodeError:
+            continue
+    return entries
+
+
+def materialize(store, entry, cache_dir):
+    """The entry as manim-voiceover expects it, with its audio present in cache_dir."""
+    for name, blob in entry.get("audio", {}).items():
+        target = Path(cache_dir) / name
+        if not target.exists():
+            _place(Path(store) / "audio" / blob, target)
+    return {k: v for k, v in entry.items() if k != "audio"}
+
+
+# --- ADDING ---
+
+def add(store, entry, cache_dir):
+    """Stores a manim-voiceover cache entry and its audio from cache_dir. Returns False if nothing was added."""
+    input_data = entry.get("input_data")
+    if not input_data or "input_text" not in input_data:
+        return False
+    dest = entry_path(store, input_data)
+    if dest.exists():
+        return False
+
+    audio = {}
+    for field in AUDIO_FIELDS:
+        name = entry.get(field)
+        if not name or name in audio:
+            continue
+        source = Path(cache_dir) / name
+        if not source.is_file():
+            return False
+        audio[name] = add_blob(store, source)
+
+    record = dict(entry, audio=audio)
+    if entry.get("final_audio"):
+        record["duration"] = audio_duration(Path(cache_dir) / entry["final_audio"])
+    _write_atomic(dest, lambda tmp: Path(tmp).write_text(json.dumps(record, indent=2)))
+    return True
+
+
+def add_blob(store, source):
+    """Copies an audio file into the store under its content hash; returns its path within audio/."""
+    digest = _sha(Path(source).read_bytes())
+    name = f"{digest[:2]}/{digest}{Path(source).suffix}"
+    dest = Path(store) / "audio" / name
+    if not dest.exists():
+        _write_atomic(dest, lambda tmp: shutil.copyfile(source, tmp))
+    return name
+
+
+# --- WORKER HOOK ---
+
+def install(store=None):
+    """Serve every voiceover lookup, and the length of its audio, from the store; record new narration there."""
+    import manim_voiceover.services.base as speech_base
+    import manim_voiceover.tracker as tracker
+
+    if store is not None:
+        os.environ[VOICE_STORE_ENV] = str(store)
+    store = default_store()
+    get_cached_result = speech_base.SpeechService.get_cached_result
+    get_duration = tracker.get_duration
+    durations = {}  # audio path in a cache_dir -> stored duration
+
+    def stored_result(self, input_data, cache_dir):
+        entry = lookup(store, input_data)
+        if entry is not None:
+            if "duration" in entry:
+                durations[os.path.normpath(Path(cache_dir) / entry["final_audio"])] = entry["duration"]
+            return materialize(store, entry, cache_dir)
+        # Not moved over yet: fall back to the folder's cache.json, once
+        result = get_cached_result(self, input_data, cache_dir)
+        if result is not None:
+            add(store, result, cache_dir)
+        return result
+
+    def add_entry(json_file, entry):
+        add(store, entry, Path(json_file).parent)
+
+    def stored_duration(path):
+        duration = durations.get(os.path.normpath(path))
+        return get_duration(path) if duration is None else duration
+
+    speech_base.SpeechService.get_cached_result = stored_result
+    speech_base.append_voiceover_cache_entry = add_entry
+    tracker.get_duration = stored_duration
+
+
+# --- SEEDING FROM THE OLD PER-FOLDER CACHES ---
+
+def import_media_voiceovers(root=REPO_ROOT, store=None):
+    """Adds every entry of every media/voiceovers/cache.json to the store. Returns (added, seen)."""
+    store = Path(store or default_store(root))
+    added = seen = 0
+    for cache_file in sorted(Path(root).rglob("media/voiceovers/cache.json")):
+        try:
+            entries = json.loads(cache_file.read_text())
+        except json.JSONDecodeError:
+            continue
+        # cache.json gains a duplicate on every lookup; the last one wins
+        unique = {settings_key(e["input_data"]): e for e in entries if e.get("input_data")}
+        for entry in unique.values():
+            seen += 1
+            added += add(store, entry, cache_file.parent)
+    return added, seen
+
+
+def add_durations(store):
+    """Records the duration of every stored entry that lacks one. Returns how many were updated."""
+    updated = 0
+    for path in Path(store).glob("index/*/*/*.json"):
+        entry = json.loads(path.read_text())
+        blob = entry.get("audio", {}).get(entry.get("final_audio"))
+        if "duration" in entry or not blob:
+            continue
+        entry["duration"] = audio_duration(Path(store) / "audio" / blob)
+        _write_atomic(path, lambda tmp: Path(tmp).write_text(json.dumps(entry, indent=2)))
+        updated += 1
+    return updated
+
+
+def store_stats(store):
+    """(entries, audio files, bytes of audio)."""
+    store = Path(store)
+    blobs = list((store / "audio").glob("*/*"))
+    return len(list((store / "index").glob("*/*/*.json"))), len(blobs), sum(p.stat().st_size for p in blobs)
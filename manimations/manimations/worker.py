@@ -0,0 +1,50 @@
+"""Render worker: `manim render` with the repo's hooks installed.
+
+    python -m manimations.worker -ql file.py SceneName
+
+The parent process opts into each hook through environment variables.
+"""
+
+import os
+import sys
+
+from manimations import audio, bench, lod, profiler, segments, texcache, timeline, voicestore
+from manimations.render import OFFLINE_SPEECH_ENV
+
+
+def install_hooks():
+    if os.environ.get(texcache.TEX_CACHE_ENV):
+        texcache.install()
+    # Before the timeline and segment hooks, which wrap or replace what these install
+    if os.environ.get(voicestore.VOICE_STORE_ENV):
+        voicestore.install()
+    if os.environ.get(audio.STREAM_AUDIO_ENV):
+        audio.install()
+    if os.environ.get(lod.LOD_ENV):
+        lod.install()
+    if os.environ.get(timeline.TIMELINE_ENV):
+        timeline.install(os.environ[timeline.TIMELINE_ENV])
+    elif os.environ.get(segments.SEGMENT_ENV):
+        segments.install_segment()
+    if os.environ.get(segments.SEED_ENV):
+        segments.install_seed(int(os.environ[segments.SEED_ENV]))
+    if os.environ.get(bench.BENCH_ENV):
+        bench.install(os.environ[bench.BENCH_ENV])
+    if os.environ.get(OFFLINE_SPEECH_ENV):
+        from manimations import speech
+
+        speech.install()
+    if os.environ.get(profiler.PROFILE_ENV):
+        profiler.install(os.environ[profiler.PROFILE_ENV])
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    install_hooks()
+    from manim.__main__ import main as manim_main
+
+    manim_main(args=["render", *argv], prog_name="manim")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+import doctest
+import random
+
+import numpy as np
+import pytest
+
+from manimations import voicestore
+from manimations.discovery import scenes_in_file
+from manimations.manifest import scene_digest
+from manimations.segments import plan_segments
+
+
+def _truth_tables():
+    # Draws its tables with manim
+    return pytest.importorskip("manimations.truth_tables")
+
+
+def _factor_tree():
+    return pytest.importorskip("manimations.factor_tree")
+
+
+# --- TRUTH TABLES ---
+
+def _random_tree(rng, depth):
+    if depth == 0 or rng.random() < 0.2:
+        return rng.choice([("var", "p"), ("var", "q_1"), ("var", r"\varphi"), ("const", True), ("const", False)])
+    kind = rng.choice(["not", "and", "or", "to", "iff"])
+    if kind == "not":
+        return ("not", _random_tree(rng, depth - 1))
+    return (kind, _random_tree(rng, depth - 1), _random_tree(rng, depth - 1))
+
+
+def test_to_tex_doctest():
+    truth_tables = _truth_tables()
+    result = doctest.testmod(truth_tables)
+    assert result.attempted and not result.failed
+
+
+@pytest.mark.parametrize("formula", [
+    r"p \land q \land r",
+    r"p \lor (q \lor r)",
+    r"p \to q \to r",
+    r"(p \to q) \to r",
+    r"\neg \neg (p \leftrightarrow q) \lor \bot",
+    r"\left(p_1 \rightarrow q'\right) \iff \varphi",
+])
+def test_parse_to_tex_round_trip(formula):
+    truth_tables = _truth_tables()
+    tree = truth_tables.parse(formula)
+    assert truth_tables.parse(truth_tables.to_tex(tree)) == tree
+
+
+def test_random_trees_round_trip():
+    truth_tables = _truth_tables()
+    rng = random.Random(1)
+    for _ in range(500):
+        tree = _random_tree(rng, 5)
+        assert truth_tables.parse(truth_tables.to_tex(tree)) == tree
+
+
+@pytest.mark.parametrize("formula, column", [
+    ("p", [0, 1]),
+    (r"p \to q", [1, 1, 0, 1]),
+    (r"p \leftrightarrow \neg q", [0, 1, 1, 0]),
+    (r"(p \lor q) \land \neg r", [0, 0, 1, 0, 1, 0, 1, 0]),
+])
+def test_columns_of_fewer_than_eight_rows(formula, column):
+    truth_tables = _truth_tables()
+    assert truth_tables.TruthTable(formula).column().astype(int).tolist() == column
+
+
+def test_columns_match_every_assignment():
+    truth_tables = _truth_tables()
+    table = truth_tables.TruthTable(r"(a \to b) \lor (c \land \neg d) \leftrightarrow e")
+    for row in range(table.rows):
+        v = table.assignment(row)
+        expected = ((not v["a"]) or v["b"] or (v["c"] and not v["d"])) == bool(v["e"])
+        assert table.column()[row] == expected
+
+
+def test_window():
+    truth_tables = _truth_tables()
+    assert truth_tables.TruthTable(r"p \to q").window(16) == [0, 1, 2, 3]
+    table = truth_tables.TruthTable(r"a \land b \land c \land d \land e")
+    assert table.window(16) == [*range(8), None, *range(24, 32)]
+    assert table.window(32) == list(range(32))
+
+
+# --- FACTORIZATION ---
+
+def test_is_prime_matches_the_sieve():
+    factor_tree = _factor_tree()
+    primes = set(factor_tree.small_primes(10_000))
+    assert [n for n in range(10_000) if factor_tree.is_prime(n)] == sorted(primes)
+
+
+@pytest.mark.parametrize("n, prime", [
+    (561, False),  # Carmichael
+    (3_215_031_751, False),  # strong pseudoprime to bases 2, 3, 5 and 7
+    (2**61 - 1, True),
+    ((2**31 - 1) * (2**61 - 1), False),
+])
+def test_miller_rabin(n, prime):
+    assert _factor_tree().is_prime(n) == prime
+
+
+@pytest.mark.parametrize("n", [1, 2, 1792, 2**64, 1_000_000_007 * 998_244_353, 3 * (2**31 - 1) ** 2 * (2**61 - 1)])
+def test_prime_factors(n):
+    factor_tree = _factor_tree()
+    factors = factor_tree.prime_factors(n)
+    assert factors == sorted(factors)
+    assert all(factor_tree.is_prime(p) for p in factors)
+    assert int(np.prod(factors, dtype=object)) == n
+
+
+@pytest.mark.parametrize("n", [0, -12])
+def test_prime_factors_rejects_non_positive(n):
+    with pytest.raises(ValueError):
+        _factor_tree().prime_factors(n)
+
+
+# --- SEGMENTS ---
+
+TIMELINE = {
+    "animations": 10,
+    "duration": 40.0,
+    "blocks": [
+        {"animation": 0, "start": 0.0},
+        {"animation": 3, "start": 10.0},
+        {"animation": 5, "start": 20.0},
+        {"animation": 8, "start": 30.0},
+    ],
+}
+
+
+@pytest.mark.parametrize("count, ranges", [
+    (1, [(0, 9)]),
+    (2, [(0, 4), (5, 9)]),
+    (4, [(0, 2), (3, 4), (5, 7), (8, 9)]),
+    (10, [(0, 2), (3, 4), (5, 7), (8, 9)]),
+])
+def test_plan_segments(count, ranges):
+    assert plan_segments(TIMELINE, count) == ranges
+
+
+def test_plan_segments_without_animations():
+    assert plan_segments({"animations": 0, "duration": 0.0, "blocks": []}, 4) == [(0, -1)]
+
+
+# --- DIGESTS ---
+
+SCRIPT = '''from manim import *
+
+
+class Base(Scene):
+    def construct(self):
+        self.play(Write(Text("base")))
+
+
+class First(Base):
+    def construct(self):
+        self.play(Write(Text("first")))
+
+
+class Second(Scene):
+    def construct(self):
+        self.play(Write(Text("second")))
+'''
+
+
+@pytest.fixture
+def script(tmp_path, monkeypatch):
+    monkeypatch.delenv(voicestore.VOICE_STORE_ENV, raising=False)
+    path = tmp_path / "video" / "scenes.py"
+    path.parent.mkdir()
+    path.write_text(SCRIPT)
+    return path
+
+
+def _digests(path):
+    return {job.name: scene_digest(job) for job in scenes_in_file(path, path.parent.parent)}
+
+
+def test_scene_digest_is_stable(script):
+    job = scenes_in_file(script, script.parent.parent)[1]
+    assert scene_digest(job) == scene_digest(job)
+    assert scene_digest(job, "h") != scene_digest(job)
+    assert scene_digest(job, extra_args=["lod"]) != scene_digest(job)
+
+
+def test_scene_digest_follows_the_scene_and_its_bases(script):
+    before = _digests(script)
+    script.write_text(SCRIPT.replace('"second"', '"changed"'))
+    after = _digests(script)
+    assert after["Second"] != before["Second"]
+    assert after["First"] == before["First"]
+
+    script.write_text(SCRIPT.replace('"base"', '"changed"'))
+    after = _digests(script)
+    assert after["First"] != before["First"]
+    assert after["Second"] == before["Second"]
+
+
+def test_scene_digest_follows_referenced_assets(script):
+    script.write_text(SCRIPT.replace('Text("first")', 'ImageMobject("picture.png")'))
+    (script.parent / "picture.png").write_bytes(b"one")
+    job = next(job for job in scenes_in_file(script, script.parent.parent) if job.name == "First")
+    before = scene_digest(job)
+    (script.parent / "picture.png").write_bytes(b"two")
+    assert scene_digest(job) != before